@@ -0,0 +1,89 @@
+"""
+Compares the CSV parsing engines of `load_file` on synthetic files.
+
+Usage (from the repository root):
+
+    python benchmarks/bench_csv_engines.py
+    python benchmarks/bench_csv_engines.py --rows 1000000 --repeat 5
+
+By default files of 1M and 10M rows are generated in a temporary
+directory, with integer, float and text columns and some nulls.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+from data_processing.import_module import CSV_ENGINES, load_file  # noqa
+
+
+def make_csv(path: str, rows: int, seed: int = 0) -> None:
+    """
+    Writes a synthetic CSV file with `rows` rows.
+    """
+    rng = np.random.default_rng(seed)
+    block = 1_000_000
+    for start in range(0, rows, block):
+        size = min(block, rows - start)
+        data = pd.DataFrame({
+            'id': np.arange(start, start + size),
+            'x1': rng.normal(size=size),
+            'x2': rng.uniform(0, 1000, size=size),
+            'x3': rng.integers(0, 100, size=size),
+            'group': rng.choice(['a', 'b', 'c', 'd'], size=size),
+            'y': rng.normal(size=size),
+        })
+        data.loc[data.sample(frac=0.01, random_state=seed).index, 'x1'] =\
+            np.nan
+        data.to_csv(path, mode='w' if start == 0 else 'a',
+                    header=start == 0, index=False)
+
+
+def time_load(path: str, engine: str, chunksize, repeat: int) -> float:
+    """
+    Returns the best time of `repeat` loads of a file.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load_file(path, chunksize=chunksize, engine=engine)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+',
+                        default=[1_000_000, 10_000_000])
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'rows':>12} {'MB':>8} {'engine':>8} {'full (s)':>10} "
+          f"{'chunked (s)':>12}")
+    with tempfile.TemporaryDirectory() as folder:
+        for rows in args.rows:
+            path = os.path.join(folder, f"bench_{rows}.csv")
+            make_csv(path, rows)
+            size = os.path.getsize(path) / 1024 ** 2
+            for engine in CSV_ENGINES:
+                full = time_load(path, engine, None, args.repeat)
+                chunked = time_load(path, engine, args.chunksize,
+                                    args.repeat)
+                print(f"{rows:>12} {size:>8.1f} {engine:>8} {full:>10.3f} "
+                      f"{chunked:>12.3f}")
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+import numpy as np
+from pandas import DataFrame, Series, array as pd_array
+from pandas.api.types import is_extension_array_dtype
+
+
+class ColumnBuffer():
+    """
+    Growable columnar store used to assemble a DataFrame from batches.
+
+    Each column is kept in its own preallocated NumPy array. Batches are
+    converted to the column dtypes as soon as they are appended, so the
+    full dataset never exists twice in memory while it is being read.
+
+    Attributes
+    ----------
+    _columns : dict[str, np.ndarray]
+        Preallocated arrays, one per column.
+    _dtypes : dict[str, object]
+        Final dtype of each column, including pandas extension dtypes.
+    _order : list[str]
+        Column names in their original order.
+    _size : int
+        Number of rows stored so far.
+    _capacity : int
+        Number of rows the arrays can hold before growing.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        """
+        Initializes an empty buffer.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            Number of rows to preallocate once the schema is known.
+        """
+        self._columns = {}
+        self._dtypes = {}
+        self._order = []
+        self._size = 0
+        self._capacity = max(int(capacity), 0)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def columns(self) -> list[str]:
+        """
+        Gets the column names stored in the buffer.
+
+        Returns
+        ----------
+        list[str]
+            Column names in their original order.
+        """
+        return list(self._order)
+
+    @property
+    def dtypes(self) -> dict[str, object]:
+        """
+        Gets the dtype of each column stored in the buffer.
+
+        Returns
+        ----------
+        dict[str, object]
+            Dtype of each column, as it will be in the DataFrame.
+        """
+        return dict(self._dtypes)
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Makes sure the buffer can hold at least `capacity` rows.
+
+        Parameters
+        ----------
+        capacity : int
+            Minimum number of rows to preallocate.
+        """
+        capacity = int(capacity)
+        if capacity <= self._capacity:
+            return
+        self._capacity = capacity
+        for name, values in self._columns.items():
+            grown = np.empty(capacity, dtype=values.dtype)
+            grown[:self._size] = values[:self._size]
+            self._columns[name] = grown
+
+    def append(self, batch: DataFrame) -> None:
+        """
+        Converts a batch to the column dtypes and copies it into the buffer.
+
+        Columns whose values no longer fit the stored dtype (e.g. an
+        integer column that receives nulls) are promoted once. Batches
+        without rows only give the column names, and the dtypes are
+        taken from the first batch with rows.
+
+        Parameters
+        ----------
+        batch : DataFrame
+            Rows to append. Must have the same columns as previous batches.
+
+        Raises
+        ------
+        ValueError
+            If the batch columns differ from the stored ones.
+        """
+        if self._order and list(batch.columns) != self._order:
+            raise ValueError("Las columnas del bloque no coinciden con las"
+                             " columnas anteriores")
+        if not self._size:
+            self._init_columns(batch)
+
+        rows = len(batch)
+        end = self._size + rows
+        if end > self._capacity:
+            self.reserve(max(end, 2 * self._capacity))
+
+        for name in self._order:
+            column = batch[name]
+            values = _to_numpy(column)
+            store = self._columns[name]
+            if not np.can_cast(values.dtype, store.dtype, casting="safe"):
+                # Promote the stored values once to a dtype that fits both
+                target = np.promote_types(store.dtype, values.dtype)
+                store = store.astype(target)
+                self._columns[name] = store
+            if self._dtypes[name] != column.dtype:
+                self._dtypes[name] = store.dtype
+            store[self._size:end] = values
+
+        self._size = end
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Builds the DataFrame with the stored rows.
+
+        Returns
+        ----------
+        DataFrame
+            Data with one column per stored array, trimmed to the rows read.
+        """
+        if self._capacity != self._size:
+            # A small unused tail is kept, and a large one is released by
+            # shrinking the arrays in place, so no column is copied
+            small_tail = self._capacity - self._size <= self._capacity // 16
+            for name in self._order:
+                values = self._columns[name]
+                if small_tail:
+                    values = values[:self._size]
+                else:
+                    # The buffer holds the only reference to its arrays
+                    values.resize(self._size, refcheck=False)
+                self._columns[name] = values
+            self._capacity = self._size
+
+        data = {}
+        for name in self._order:
+            values = self._columns[name]
+            dtype = self._dtypes[name]
+            if is_extension_array_dtype(dtype):
+                values = pd_array(values, dtype=dtype)
+            data[name] = values
+        return DataFrame(data, columns=self._order, copy=False)
+
+    def _init_columns(self, batch: DataFrame) -> None:
+        """
+        Allocates one array per column using the first batch's dtypes.
+        """
+        self._order = list(batch.columns)
+        self._capacity = max(self._capacity, len(batch))
+        for name in self._order:
+            column = batch[name]
+            self._dtypes[name] = column.dtype
+            self._columns[name] = np.empty(self._capacity,
+                                           dtype=_to_numpy(column).dtype)
+
+
+def _to_numpy(column: Series) -> np.ndarray:
+    """
+    Returns the values of a column as a NumPy array.
+
+    Extension dtypes (strings, nullable integers...) are stored as objects.
+    """
+    if is_extension_array_dtype(column.dtype):
+        return column.to_numpy(dtype=object)
+    return column.to_numpy()
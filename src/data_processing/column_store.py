@@ -0,0 +1,261 @@
+import numpy as np
+from pandas import DataFrame
+from typing import Optional
+import os
+import shutil
+import tempfile
+import time
+import weakref
+
+# Prefix of the directories of the stores
+STORE_PREFIX = "lmm_columns_"
+
+
+class MappedColumnStore():
+    """
+    Store of the columns of a DataFrame in memory-mapped files.
+
+    Each numeric column is written to its own `.npy` file on local disk
+    and mapped back read-only, so the DataFrames built from the store,
+    the model tabs and the models share the same pages, and none of them
+    can change the values the others read. Columns that are not used are
+    paged out by the OS instead of filling the RAM. The preprocessing
+    replaces the columns it changes with private copies. Text and
+    categorical columns are kept in memory.
+
+    The files are removed by `close` or when the store is garbage
+    collected, so the store must be kept alive while its DataFrames are
+    used. On POSIX systems they are unlinked as soon as they are mapped,
+    so the OS frees the disk space once the last view of a column is
+    released. Windows cannot remove mapped files, so the files of stores
+    that could not be removed are cleaned by `remove_stale_stores`.
+
+    Attributes
+    ----------
+    directory : str
+        Directory holding the column files.
+    _columns : dict[str, object]
+        Memory-mapped arrays of the numeric columns, and the original
+        values of the others.
+    _order : list[str]
+        Column names in their original order.
+    _frame : DataFrame, optional
+        DataFrame with every column, from which the DataFrames returned
+        by `to_dataframe` are taken so pandas tracks their shared columns.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """
+        Initializes an empty store.
+
+        Parameters
+        ----------
+        directory : str, optional
+            Directory for the column files. Defaults to a new temporary
+            directory.
+        """
+        self.directory = tempfile.mkdtemp(prefix=STORE_PREFIX,
+                                          dir=directory)
+        self._columns = {}
+        self._order = []
+        self._frame = None
+        self._finalizer = weakref.finalize(self, shutil.rmtree,
+                                           self.directory, True)
+
+    @classmethod
+    def from_dataframe(cls, data: DataFrame,
+                       directory: Optional[str] = None
+                       ) -> "MappedColumnStore":
+        """
+        Builds a store with the columns of a DataFrame.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Data to store.
+        directory : str, optional
+            Directory for the column files.
+
+        Returns
+        ----------
+        MappedColumnStore
+            Store with every column of `data`.
+        """
+        store = cls(directory)
+        for name in data.columns:
+            store.add(name, data[name])
+        return store
+
+    def close(self) -> None:
+        """
+        Removes the directory of the column files.
+
+        The DataFrames taken from the store keep their values on POSIX
+        systems. On Windows the files still mapped are left on disk.
+        """
+        self._finalizer()
+
+    def __len__(self) -> int:
+        if not self._order:
+            return 0
+        return len(self._columns[self._order[0]])
+
+    @property
+    def columns(self) -> list[str]:
+        """
+        Gets the names of the stored columns.
+        """
+        return list(self._order)
+
+    def add(self, name: str, values) -> None:
+        """
+        Stores a column, memory-mapping it if it is numeric.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+        values : Series or np.ndarray
+            Values of the column.
+        """
+        dtype = getattr(values, "dtype", None)
+        if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+            path = os.path.join(self.directory, f"{len(self._order)}.npy")
+            np.save(path, np.asarray(values))
+            values = np.load(path, mmap_mode="r")
+            try:
+                # The mapping keeps the data available after the unlink
+                os.remove(path)
+            except OSError:
+                pass
+        if name not in self._columns:
+            self._order.append(name)
+        self._columns[name] = values
+        self._frame = None
+
+    def column(self, name: str):
+        """
+        Returns the values of a column without copying them.
+
+        Numeric columns are read-only.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+
+        Returns
+        ----------
+        np.ndarray or Series
+            Memory-mapped array for numeric columns, the stored values
+            otherwise.
+        """
+        return self._columns[name]
+
+    def to_dataframe(self, columns: Optional[list[str]] = None) -> DataFrame:
+        """
+        Builds a DataFrame whose numeric columns are read-only views of
+        the store.
+
+        The columns cannot be written in place: replacing a column, as the
+        preprocessing does, only changes the DataFrame it is replaced in,
+        so the store and the other DataFrames taken from it keep their
+        values.
+
+        Parameters
+        ----------
+        columns : list[str], optional
+            Columns of the DataFrame. Defaults to every column.
+
+        Returns
+        ----------
+        DataFrame
+            Data backed by the memory-mapped columns.
+        """
+        if self._frame is None:
+            self._frame = DataFrame(
+                {name: self._view(name) for name in self._order},
+                columns=self._order, copy=False)
+        if columns is None:
+            return self._frame.copy(deep=False)
+        return self._frame[list(columns)]
+
+    def _view(self, name: str):
+        """
+        Returns a column as a plain read-only array that shares the
+        mapped memory.
+        """
+        values = self._columns[name]
+        if isinstance(values, np.memmap):
+            return values.view(np.ndarray)
+        return values
+
+
+def map_dataframe(data: DataFrame, directory: Optional[str] = None
+                  ) -> tuple[DataFrame, MappedColumnStore]:
+    """
+    Moves the numeric columns of a DataFrame to a `MappedColumnStore`.
+
+    The store has to be kept while the DataFrame is used, and closed once
+    it is not needed.
+
+    Parameters
+    ----------
+    data : DataFrame
+        Data to map.
+    directory : str, optional
+        Directory for the column files.
+
+    Returns
+    ----------
+    tuple[DataFrame, MappedColumnStore]
+        Same data, with memory-mapped numeric columns, and the store of
+        its columns.
+    """
+    store = MappedColumnStore.from_dataframe(data, directory)
+    mapped = store.to_dataframe()
+    mapped.index = data.index
+    return mapped, store
+
+
+def remove_stale_stores(directory: Optional[str] = None,
+                        min_age: float = 3600) -> int:
+    """
+    Removes the directories left by stores that were not closed, e.g.
+    on Windows or after a crash.
+
+    Only directories not modified for `min_age` seconds are removed, so
+    the stores being written by other instances of the application are
+    not touched. The files still mapped by a running instance cannot be
+    removed on Windows and are skipped.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Directory holding the stores. Defaults to the temporary directory.
+    min_age : float, optional
+        Seconds since the last change of a directory to remove it.
+
+    Returns
+    ----------
+    int
+        Number of directories removed.
+    """
+    directory = directory or tempfile.gettempdir()
+    removed = 0
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return 0
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            if not name.startswith(STORE_PREFIX) or\
+                    not os.path.isdir(path) or\
+                    time.time() - os.path.getmtime(path) < min_age:
+                continue
+        except OSError:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        removed += not os.path.exists(path)
+    return removed
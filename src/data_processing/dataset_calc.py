@@ -1,4 +1,12 @@
+import numpy as np
 from pandas import DataFrame
+from typing import Optional
+from data_processing.history import Edit, EditHistory
+from data_processing.null_index import NullIndex
+from data_processing.outliers import find_outliers
+from data_processing.row_mask import RowMask
+from data_processing.pipeline import (PreprocessPipeline, Strategy,
+                                      parse_strategy)
 
 
 class PreprocessApplier():
@@ -7,6 +15,9 @@ class PreprocessApplier():
 
     This class allows the application of various preprocessing methods 
     to a dataset, specifically for handling null values in specified columns.
+    Each column can get its own strategy ("delete", "mean", "median",
+    ("quantile", q), ("constant", value) or ("knn", k)), and all of them
+    are applied in a single pass.
 
     Attributes 
     ----------
@@ -14,10 +25,24 @@ class PreprocessApplier():
         Dictionary associating method names with their functions.
     cte : list[float]
         List of constants to be used in certain methods.
+    neighbors : int
+        Number of neighbours averaged by the "knn" method.
+    strategies : dict[str, str | tuple[str, float]]
+        Strategy of each column for the "columns" method.
     dataframe : pd.DataFrame
         The DataFrame on which preprocessing will be applied.
     columns : list[str]
         List of DataFrame columns to be processed.
+    null_index : NullIndex, optional
+        Index of the nulls of the DataFrame, updated by the methods.
+    row_mask : RowMask, optional
+        Rows kept of the DataFrame. The "delete" method removes rows from
+        the mask, so the DataFrame is not rewritten.
+    pipeline : PreprocessPipeline
+        Steps applied so far, with their fitted values, so they can be
+        replayed on other data.
+    history : EditHistory
+        Changes made by the steps applied so far, to undo and redo them.
     _current_method : function
         The current preprocessing method to be applied.
     """
@@ -30,10 +55,17 @@ class PreprocessApplier():
         initializes state variables.
         """
         self._methods = {"delete": self.delete, "mean": self.mean,
-                         "median": self.median, "constant": self.constant}
+                         "median": self.median, "constant": self.constant,
+                         "knn": self.knn, "columns": self.per_column}
         self.cte = []
+        self.neighbors = 5
+        self.strategies = {}
         self.dataframe = None
         self.columns = None
+        self.null_index = None
+        self.row_mask = None
+        self.pipeline = PreprocessPipeline()
+        self.history = EditHistory()
         self._current_method = None
 
     @property
@@ -63,15 +95,27 @@ class PreprocessApplier():
         self._current_method = self._methods[value]
         self.cte = cte
 
+    def set_strategies(self, strategies: dict[str, Strategy]) -> None:
+        """
+        Sets a strategy for each column and selects the "columns" method.
+
+        Parameters
+        ----------
+        strategies : dict[str, str | tuple[str, float]]
+            Strategy of each column: "delete", "mean", "median",
+            ("quantile", q), ("constant", value) or ("knn", k).
+        """
+        self.strategies = dict(strategies)
+        self._current_method = self.per_column
+
     def delete(self) -> None:
         """
         Deletes rows with null values in the specified columns.
 
-        Modifies the current DataFrame by removing rows that contain
-        null values in the defined columns.
+        Removes from the row mask the rows that contain null values
+        in the defined columns, without modifying the DataFrame.
         """
-        self.dataframe = self.dataframe.dropna(
-            inplace=True, subset=self.columns)
+        self.impute({x: "delete" for x in self.columns})
 
     def mean(self) -> None:
         """
@@ -80,9 +124,7 @@ class PreprocessApplier():
         Replaces null values in the specified columns with 
         the mean of each column.
         """
-        for x in self.columns:
-            self.dataframe[x] = self.dataframe[x].fillna(
-                self.dataframe[x].mean(skipna=True))
+        self.impute({x: "mean" for x in self.columns})
 
     def median(self) -> None:
         """
@@ -91,9 +133,17 @@ class PreprocessApplier():
         Replaces null values in the specified columns with 
         the median of each column.
         """
-        for x in self.columns:
-            self.dataframe[x] = self.dataframe[x].fillna(
-                self.dataframe[x].median(skipna=True))
+        self.impute({x: "median" for x in self.columns})
+
+    def knn(self) -> None:
+        """
+        Replaces null values with the mean of the nearest rows.
+
+        Replaces null values in the specified columns with the mean
+        of the `neighbors` rows without nulls closest to each row,
+        measured on the specified columns.
+        """
+        self.impute({x: ("knn", self.neighbors) for x in self.columns})
 
     def constant(self) -> None:
         """
@@ -106,25 +156,105 @@ class PreprocessApplier():
         if self.cte is None:
             raise ValueError("No se han proporcionado constantes")
 
-        # Ensure we have a constant for each column
-        while len(self.cte) < len(self.columns):
-            # Pad the constants list with None if needed
-            self.cte.extend([None] * (len(self.columns) - len(self.cte)))
-
-        # Replace null values with constants
-        for i, x in enumerate(self.columns):
-            # Only fill if a constant is provided and is not None
-            if i < len(self.cte) and self.cte[i] is not None:
-                print(self.cte[i])
+        # Only fill the columns with a constant that is not None
+        strategies = {}
+        for x, value in zip(self.columns, self.cte):
+            if value is not None:
                 try:
-                    constant_value = float(self.cte[i])
-                    self.dataframe[x] = self.dataframe[x].fillna(
-                        constant_value)
+                    strategies[x] = ("constant", float(value))
                 except (ValueError, TypeError):
                     raise ValueError(f"No se puede convertir '{\
-                                     self.cte[i]}' a un número decimal")
+                                     value}' a un número decimal")
+        self.impute(strategies)
+
+    def per_column(self) -> None:
+        """
+        Applies the strategy of each column in `strategies`.
+
+        Only the specified columns that have a strategy are processed.
+        """
+        self.impute({x: self.strategies[x] for x in self.columns
+                     if x in self.strategies})
 
-    def apply_preprocess(self, dataframe: DataFrame, columns: list[str]) -> None:
+    def impute(self, strategies: dict[str, Strategy]) -> None:
+        """
+        Applies a strategy to each column of the current DataFrame.
+
+        The strategies are fitted on the DataFrame, applied in a single
+        vectorized pass and recorded as a new step of `pipeline`. The
+        changes are recorded in `history` so the step can be undone.
+
+        Parameters
+        ----------
+        strategies : dict[str, str | tuple[str, float]]
+            Strategy of each column: "delete", "mean", "median",
+            ("quantile", q), ("constant", value) or ("knn", k).
+
+        Raises
+        ------
+        ValueError
+            If a strategy is not valid or its constant is not a number.
+        TypeError
+            If a statistic of a non-numeric column is requested.
+        """
+        if not strategies:
+            return
+        null_index = self.null_index
+        if null_index is None:
+            # Scanned once, for the edit and for the step
+            null_index = NullIndex.from_dataframe(self.dataframe[[
+                x for x in strategies if x in self.dataframe.columns]])
+        edit = Edit.capture(self.dataframe, {"strategies": {
+            x: parse_strategy(strategy)
+            for x, strategy in strategies.items()}}, null_index,
+            self.row_mask)
+        edit.step = self.pipeline.fit_step(self.dataframe, strategies,
+                                           null_index, self.row_mask)
+        self.history.push(edit)
+
+    def undo(self, dataframe: DataFrame,
+             null_index: Optional[NullIndex] = None,
+             row_mask: Optional[RowMask] = None) -> None:
+        """
+        Undoes in place the last preprocessing step applied.
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            The DataFrame the step was applied to.
+        null_index : NullIndex, optional
+            Index of the nulls of `dataframe`, updated with the changes.
+        row_mask : RowMask, optional
+            Rows kept of `dataframe`, updated with the changes. By
+            default, the mask of the last preprocessing.
+        """
+        self.history.undo(dataframe, null_index, self.pipeline,
+                          row_mask if row_mask is not None
+                          else self.row_mask)
+
+    def redo(self, dataframe: DataFrame,
+             null_index: Optional[NullIndex] = None,
+             row_mask: Optional[RowMask] = None) -> None:
+        """
+        Applies again in place the last preprocessing step undone.
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            The DataFrame the step was undone on.
+        null_index : NullIndex, optional
+            Index of the nulls of `dataframe`, updated with the changes.
+        row_mask : RowMask, optional
+            Rows kept of `dataframe`, updated with the changes. By
+            default, the mask of the last preprocessing.
+        """
+        self.history.redo(dataframe, null_index, self.pipeline,
+                          row_mask if row_mask is not None
+                          else self.row_mask)
+
+    def apply_preprocess(self, dataframe: DataFrame, columns: list[str],
+                         null_index: Optional[NullIndex] = None,
+                         row_mask: Optional[RowMask] = None) -> None:
         """
         Modifies None values based on the current configuration.
 
@@ -134,14 +264,22 @@ class PreprocessApplier():
             The DataFrame on which preprocessing will be applied.
         columns : list[str]
             List of columns to which preprocessing will be applied.
+        null_index : NullIndex, optional
+            Index of the nulls of `dataframe`, updated with the changes.
+        row_mask : RowMask, optional
+            Rows kept of `dataframe`, updated by the "delete" method. By
+            default, the mask of the previous call on the same DataFrame,
+            or a new one that keeps every row.
 
         Raises
         ------
         ValueError
             If no preprocessing configuration or columns are selected.
         """
+        self._set_row_mask(dataframe, row_mask)
         self.dataframe = dataframe
         self.columns = columns
+        self.null_index = null_index
         try:
             if self.columns is not None and self._current_method is not None:
                 self._current_method()
@@ -154,8 +292,71 @@ class PreprocessApplier():
         except Exception as e:
             raise Exception(f"Ha ocurrido un error inesperado: {e}")
 
+    def filter_outliers(self, dataframe: DataFrame, columns: list[str],
+                        method: str = "iqr",
+                        threshold: Optional[float] = None,
+                        row_mask: Optional[RowMask] = None
+                        ) -> dict[str, int]:
+        """
+        Deletes from the row mask the rows with outliers in any of the
+        columns, without modifying the DataFrame.
+
+        The deletion is recorded in `history`, so it can be undone, but
+        not in `pipeline`, which is also applied to the inputs of the
+        predictions.
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            The DataFrame to check.
+        columns : list[str]
+            Numeric columns to check.
+        method : str, optional
+            "zscore", "iqr" or "mad", as in `OutlierDetector`.
+        threshold : float, optional
+            Distance from which a value is an outlier.
+        row_mask : RowMask, optional
+            Rows kept of `dataframe`, as in `apply_preprocess`.
+
+        Returns
+        ----------
+        dict[str, int]
+            Number of rows kept that each column flagged.
 
-def none_count(dataframe: DataFrame, columns: list[str]) -> list[int]:
+        Raises
+        ------
+        ValueError
+            If the method or the threshold are not valid.
+        TypeError
+            If a column is not numeric.
+        """
+        self._set_row_mask(dataframe, row_mask)
+        self.dataframe = dataframe
+        outliers, counts = find_outliers(dataframe, columns, method,
+                                         threshold, self.row_mask)
+        deleted = self.row_mask.delete(outliers)
+        if deleted.any():
+            self.history.push(Edit(None, np.packbits(deleted), {},
+                                   len(dataframe)))
+        return counts
+
+    def _set_row_mask(self, dataframe: DataFrame,
+                      row_mask: Optional[RowMask]) -> None:
+        """
+        Uses the given mask, or keeps the current one while the DataFrame
+        is the same.
+        """
+        if row_mask is None and (self.row_mask is None or
+                                 self.dataframe is not dataframe or
+                                 self.row_mask.rows != len(dataframe)):
+            row_mask = RowMask(len(dataframe))
+        if row_mask is not None:
+            self.row_mask = row_mask
+
+
+def none_count(dataframe: DataFrame, columns: list[str],
+               null_index: Optional[NullIndex] = None,
+               row_mask: Optional[RowMask] = None) -> list[int]:
     """
     Counts None values in the specified columns.
 
@@ -165,10 +366,20 @@ def none_count(dataframe: DataFrame, columns: list[str]) -> list[int]:
         DataFrame in which None values will be counted.
     columns : list[str]
         List of columns to count None values.
+    null_index : NullIndex, optional
+        Index of the nulls of `dataframe`. If given, the counts are read
+        from it instead of scanning the columns.
+    row_mask : RowMask, optional
+        Rows kept of `dataframe`. If given, only their values are counted.
 
     Returns
     ----------
     list[int]
         List with the number of None values in the selected columns.
     """
+    if null_index is not None:
+        return null_index.counts(columns, row_mask)
+    if row_mask is not None:
+        dataframe = row_mask.select(dataframe)
     return [dataframe[x].isna().sum() for x in columns]
+
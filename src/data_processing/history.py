@@ -0,0 +1,263 @@
+import numpy as np
+from pandas import DataFrame
+from typing import Optional
+from data_processing.null_index import NullIndex
+from data_processing.pipeline import (PreprocessPipeline, apply_step,
+                                     replace_columns)
+from data_processing.row_mask import RowMask
+
+
+class Edit():
+    """
+    Changes made to a DataFrame by one preprocessing step.
+
+    Only what the step changes is kept: a packed bitmap of the rows it
+    deletes from the row mask, and another of the cells it fills in each
+    column. The filled cells were null and the deleted rows are still in
+    the data, so no values need storage, and the memory of an edit is
+    one bit per row and changed column.
+
+    Attributes
+    ----------
+    step : dict, optional
+        Fitted step of the `PreprocessPipeline` that made the edit, None
+        for edits that only delete rows, as the outlier filters.
+    deleted : np.ndarray
+        Rows deleted by the step, as bits packed by `np.packbits`.
+    filled : dict[str, np.ndarray]
+        Cells filled in each column, as bits packed by `np.packbits`.
+    rows : int
+        Number of rows of the data.
+    """
+
+    def __init__(self, step: dict, deleted: np.ndarray,
+                 filled: dict[str, np.ndarray], rows: int) -> None:
+        self.step = step
+        self.deleted = deleted
+        self.filled = filled
+        self.rows = rows
+
+    @classmethod
+    def capture(cls, data: DataFrame, step: dict,
+                null_index: Optional[NullIndex] = None,
+                row_mask: Optional[RowMask] = None) -> "Edit":
+        """
+        Records the changes a step is about to make to a DataFrame.
+
+        Must be called before the step is applied.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Data the step will be applied to.
+        step : dict
+            Step with the strategies of its columns. Its fill values are
+            not needed.
+        null_index : NullIndex, optional
+            Index of the nulls of `data`. If given, the nulls are read
+            from it instead of scanning the columns.
+        row_mask : RowMask, optional
+            Rows kept of `data`, which the step deletes rows from.
+
+        Returns
+        ----------
+        Edit
+            Changes of the step.
+        """
+        strategies = step["strategies"]
+        if null_index is None:
+            # Only the columns of the step are scanned
+            null_index = NullIndex.from_dataframe(data[[
+                column for column in strategies if column in data.columns]])
+        deleted = null_index.rows_with_nulls(
+            [column for column, (name, _) in strategies.items()
+             if name == "delete"])
+        if row_mask is not None:
+            deleted &= row_mask.to_numpy()
+        filled = {}
+        for column, (name, _) in strategies.items():
+            if name != "delete" and null_index.has_nulls(column):
+                filled[column] = np.packbits(null_index.mask(column))
+        return cls(step, np.packbits(deleted), filled, len(data))
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Gets the bytes used to store the edit.
+        """
+        return self.deleted.nbytes +\
+            sum(bitmap.nbytes for bitmap in self.filled.values())
+
+    def apply(self, data: DataFrame, null_index: Optional[NullIndex] = None,
+              row_mask: Optional[RowMask] = None) -> None:
+        """
+        Makes the edit again in place, replaying its step if it has one.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Data as it was before the edit.
+        null_index : NullIndex, optional
+            Index of the nulls of `data`, updated with the changes.
+        row_mask : RowMask, optional
+            Rows kept of `data`.
+        """
+        if self.step is not None:
+            apply_step(data, self.step, null_index, row_mask)
+        elif row_mask is not None:
+            row_mask.delete(
+                np.unpackbits(self.deleted, count=self.rows).astype(bool))
+
+    def revert(self, data: DataFrame, null_index: Optional[NullIndex] = None,
+               row_mask: Optional[RowMask] = None) -> None:
+        """
+        Undoes the edit in place.
+
+        The filled columns are replaced by copies with the filled cells
+        set back to null, so the views of them held by the models keep
+        their values, and the deleted rows are kept again by the mask.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Data as it was left by the step.
+        null_index : NullIndex, optional
+            Index of the nulls of `data`, updated with the changes.
+        row_mask : RowMask, optional
+            Rows kept of `data`.
+        """
+        groups = {}
+        for column in self.filled:
+            groups.setdefault(data.dtypes[column], []).append(column)
+        for columns in groups.values():
+            values = data[columns].to_numpy(copy=True)
+            for j, column in enumerate(columns):
+                mask = np.unpackbits(self.filled[column],
+                                     count=self.rows).astype(bool)
+                values[mask, j] = np.nan
+                if null_index is not None:
+                    null_index.set_column(column, mask)
+            replace_columns(data, columns, values)
+        if row_mask is not None:
+            row_mask.restore(
+                np.unpackbits(self.deleted, count=self.rows).astype(bool))
+
+
+class EditHistory():
+    """
+    Undo and redo stacks of the preprocessing steps applied to the data.
+
+    Attributes
+    ----------
+    limit : int, optional
+        Maximum number of steps that can be undone.
+    _undo : list[Edit]
+        Edits that can be undone, the last one on top.
+    _redo : list[Edit]
+        Edits undone that can be applied again.
+    """
+
+    def __init__(self, limit: Optional[int] = 50) -> None:
+        """
+        Initializes an empty history.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Maximum number of steps that can be undone. None keeps all.
+        """
+        self.limit = limit
+        self._undo = []
+        self._redo = []
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Gets the bytes used by every edit in the history.
+        """
+        return sum(edit.nbytes for edit in self._undo + self._redo)
+
+    def push(self, edit: Edit) -> None:
+        """
+        Records a new edit, discarding the edits that were undone.
+        """
+        self._undo.append(edit)
+        self._redo.clear()
+        if self.limit is not None and len(self._undo) > self.limit:
+            del self._undo[0]
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+    def undo(self, data: DataFrame, null_index: Optional[NullIndex] = None,
+             pipeline: Optional[PreprocessPipeline] = None,
+             row_mask: Optional[RowMask] = None) -> None:
+        """
+        Undoes the last edit in place.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Current data.
+        null_index : NullIndex, optional
+            Index of the nulls of `data`, updated with the changes.
+        pipeline : PreprocessPipeline, optional
+            Pipeline whose last step is removed.
+        row_mask : RowMask, optional
+            Rows kept of `data`, updated with the changes.
+
+        Raises
+        ------
+        ValueError
+            If there is nothing to undo.
+        """
+        if not self._undo:
+            raise ValueError("No hay cambios que deshacer")
+        edit = self._undo.pop()
+        edit.revert(data, null_index, row_mask)
+        if pipeline is not None and pipeline.steps and\
+                edit.step is not None and pipeline.steps[-1] is edit.step:
+            pipeline.steps.pop()
+        self._redo.append(edit)
+
+    def redo(self, data: DataFrame, null_index: Optional[NullIndex] = None,
+             pipeline: Optional[PreprocessPipeline] = None,
+             row_mask: Optional[RowMask] = None) -> None:
+        """
+        Applies again in place the last edit undone.
+
+        The fitted step is replayed, so its statistics are not computed
+        again.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Current data.
+        null_index : NullIndex, optional
+            Index of the nulls of `data`, updated with the changes.
+        pipeline : PreprocessPipeline, optional
+            Pipeline the step is appended to again.
+        row_mask : RowMask, optional
+            Rows kept of `data`, updated with the changes.
+
+        Raises
+        ------
+        ValueError
+            If there is nothing to redo.
+        """
+        if not self._redo:
+            raise ValueError("No hay cambios que rehacer")
+        edit = self._redo.pop()
+        edit.apply(data, null_index, row_mask)
+        if pipeline is not None and edit.step is not None:
+            pipeline.steps.append(edit.step)
+        self._undo.append(edit)
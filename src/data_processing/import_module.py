@@ -1,15 +1,221 @@
-from pandas import DataFrame, read_csv, read_excel, read_sql
+import numpy as np
+from pandas import Categorical, DataFrame, ExcelFile, read_csv, read_excel
+from pandas.api.types import is_numeric_dtype
+from pandas.errors import EmptyDataError
+from typing import Callable, Iterator, Optional, Union
+from data_processing.column_buffer import ColumnBuffer
+from data_processing.ingest_cache import IngestCache
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+import bz2
+import glob
+import gzip
+import lzma
+import multiprocessing
+import os
 import sqlite3
 
+# Needed for columnar formats: pip install pyarrow
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as feather
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
 
-def load_file(file_path: str) -> DataFrame:
+# Needed to stream .xlsx files: pip install openpyxl
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+# Needed for .zst compressed files: pip install zstandard
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Signature: progress_callback(bytes_read, total_bytes, rows_parsed)
+ProgressCallback = Callable[[int, int, int], None]
+# Signature: batch_callback(batch)
+BatchCallback = Callable[[DataFrame], None]
+
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+FEATHER_EXTENSIONS = (".feather",)
+ARROW_EXTENSIONS = (".arrow", ".ipc")
+COLUMNAR_EXTENSIONS = PARQUET_EXTENSIONS + FEATHER_EXTENSIONS + \
+    ARROW_EXTENSIONS
+CSV_EXTENSIONS = (".csv", ".tsv")
+# "c": single-threaded pandas parser, "pyarrow": multithreaded Arrow parser
+CSV_ENGINES = ("c", "pyarrow")
+COMPRESSION_EXTENSIONS = (".gz", ".bz2", ".xz", ".zst")
+# Column added to datasets of several files with the file of each row
+PARTITION_COLUMN = "_partition"
+
+
+class LoadCancelled(BaseException):
+    """
+    Raised from a callback to stop a file that is being loaded.
+
+    It derives from BaseException, like KeyboardInterrupt, so the error
+    handlers of the readers let it through instead of reporting it as a
+    loading error.
+    """
+
+
+def is_dataset(file_path: Union[str, list[str]]) -> bool:
+    """
+    Checks if a path refers to several files: a list of files, a
+    directory or a glob pattern (e.g. `data_2026-*.csv`).
+
+    Existing files are never patterns, even if their name has glob
+    characters (e.g. `ventas [2024].csv`).
+    """
+    if isinstance(file_path, (list, tuple)):
+        return True
+    if os.path.isfile(file_path):
+        return False
+    if os.path.isdir(file_path):
+        return True
+    return not os.path.exists(file_path) and glob.has_magic(file_path)
+
+
+def expand_dataset(file_path: Union[str, list[str]]) -> list[str]:
     """
-    Loads a .sql, .db, .csv, .xls, or .xlsx file.
+    Lists the files of a dataset.
+
+    Parameters 
+    -----------
+    file_path : str or list[str]
+        List of files, directory or glob pattern.
+
+    Returns
+    -----------
+    list[str]
+        Sorted paths of the supported files of the dataset.
+
+    Raises
+    -----------
+    ValueError: If the dataset has no supported files
+    """
+    if isinstance(file_path, (list, tuple)):
+        files = list(file_path)
+    elif os.path.isdir(file_path):
+        files = sorted(os.path.join(file_path, name)
+                       for name in os.listdir(file_path))
+    else:
+        files = sorted(glob.glob(file_path))
+    files = [path for path in files if os.path.isfile(path) and (
+        is_csv(path) or is_excel(path) or is_sqlite(path)
+        or is_columnar(path))]
+    if not files:
+        raise ValueError(f"No se han encontrado archivos en {file_path}")
+    return files
+
+
+def is_columnar(file_path: str) -> bool:
+    """
+    Checks if a file is stored in a columnar format (Parquet, Feather, Arrow).
 
     Parameters 
     -----------
     file_path : str
-        Path to the desired file.
+        Path to the file.
+
+    Returns
+    -----------
+    bool
+        True if columns can be read individually from the file.
+    """
+    return file_path.lower().endswith(COLUMNAR_EXTENSIONS)
+
+
+def is_csv(file_path: str) -> bool:
+    """
+    Checks if a file is a CSV or TSV file, compressed or not.
+    """
+    path = file_path.lower()
+    if path.endswith(COMPRESSION_EXTENSIONS):
+        path = os.path.splitext(path)[0]
+    return path.endswith(CSV_EXTENSIONS)
+
+
+def is_excel(file_path: str) -> bool:
+    """
+    Checks if a file is an Excel workbook.
+    """
+    return file_path.lower().endswith((".xlsx", ".xls"))
+
+
+def is_sqlite(file_path: str) -> bool:
+    """
+    Checks if a file is a SQLite database.
+    """
+    return file_path.lower().endswith((".sqlite", ".db"))
+
+
+def load_file(file_path: Union[str, list[str]],
+              chunksize: Optional[int] = None,
+              progress_callback: Optional[ProgressCallback] = None,
+              columns: Optional[list[str]] = None,
+              cache: Optional[IngestCache] = None,
+              table: Optional[str] = None, where: Optional[str] = None,
+              limit: Optional[int] = None,
+              sample: Optional[float] = None,
+              sheet: Optional[str] = None, header: int = 0,
+              batch_callback: Optional[BatchCallback] = None,
+              workers: Optional[int] = None, engine: str = "c") -> DataFrame:
+    """
+    Loads a .sql, .db, .csv, .tsv, .xls, .xlsx, .parquet, .feather or
+    .arrow file. CSV and TSV files may be compressed with gzip, bz2, xz
+    or zstd (.gz, .bz2, .xz, .zst).
+
+    A list of files, a directory or a glob pattern loads every file as a
+    partition of the same dataset (see `__import_dataset`).
+
+    Parameters 
+    -----------
+    file_path : str or list[str]
+        Path to the desired file, or the files of a dataset.
+    chunksize : int, optional
+        Number of rows per batch when reading CSV and .xlsx files in
+        chunks. If None, the whole file is parsed in one call.
+    progress_callback : callable, optional
+        Called after every batch with the bytes read, the total size
+        of the file and the rows parsed so far. For Excel files the
+        first two values count the rows of the sheet instead of bytes.
+    columns : list[str], optional
+        Columns to read, in the given order. Columnar and SQLite files
+        only read these columns from disk, and CSV and Excel files skip
+        parsing the rest. If None, all columns are read.
+    cache : IngestCache, optional
+        Cache of parsed files. CSV, Excel and SQLite files found in the
+        cache are memory-mapped instead of parsed again.
+    table : str, optional
+        SQLite table to read. Defaults to the first table.
+    where : str, optional
+        SQL condition the rows read from SQLite must satisfy.
+    limit : int, optional
+        Maximum number of rows to read from SQLite.
+    sample : float, optional
+        Fraction of the rows (0-1] to read from SQLite.
+    sheet : str, optional
+        Excel sheet to read. Defaults to the first sheet.
+    header : int, optional
+        Index (starting at 0) of the Excel row with the column names.
+    batch_callback : callable, optional
+        Called with every batch read by the chunked readers, e.g. to
+        preview the data while the rest of the file is loading.
+    workers : int, optional
+        Number of processes parsing the files of a dataset. Defaults to
+        the number of CPUs.
+    engine : str, optional
+        CSV parser: "c" (pandas) or "pyarrow", which parses blocks of the
+        file in several threads. Falls back to "c" if pyarrow is not
+        installed or cannot parse the file.
 
     Returns
     -----------
@@ -19,15 +225,50 @@ def load_file(file_path: str) -> DataFrame:
 
     # Obtain the file's extension
     try:
-        if file_path.lower().endswith(".csv"):
-            data = __import_csv(file_path)
-        elif file_path.lower().endswith((".xlsx", ".xls")):
-            data = __import_excel(file_path)
-        elif file_path.lower().endswith((".sqlite", ".db")):
-            data = __import_sql(file_path)
+        if engine not in CSV_ENGINES:
+            raise ValueError(f"Motor de CSV no soportado: {engine}")
+        if is_dataset(file_path):
+            options = {"table": table, "where": where, "limit": limit,
+                       "sample": sample, "sheet": sheet, "header": header,
+                       "engine": engine}
+            return __import_dataset(file_path, chunksize, progress_callback,
+                                    columns, batch_callback, workers,
+                                    **options)
+
+        # Columnar files are already stored in a binary format
+        use_cache = cache is not None and not is_columnar(file_path)
+        options = {key: value for key, value in [
+            ("columns", columns), ("table", table), ("where", where),
+            ("limit", limit), ("sample", sample), ("sheet", sheet),
+            ("header", header or None)] if value is not None}
+        if is_csv(file_path):
+            # The engines do not parse every file to the same dtypes
+            options["engine"] = engine
+        if use_cache:
+            data = cache.get(file_path, **options)
+            if data is not None:
+                return data
+
+        if is_csv(file_path):
+            if chunksize:
+                data = __import_csv_chunked(file_path, chunksize,
+                                            progress_callback,
+                                            batch_callback, columns, engine)
+            else:
+                data = __import_csv(file_path, columns, engine)
+        elif is_excel(file_path):
+            data = __import_excel(file_path, sheet, header, chunksize,
+                                  progress_callback, batch_callback, columns)
+        elif is_sqlite(file_path):
+            data = __import_sql(file_path, table, columns, where, limit,
+                                sample, batch_callback)
+        elif is_columnar(file_path):
+            data = __import_columnar(file_path, columns)
         else:
             raise ValueError("Formato de archivo no soportado")
 
+        if use_cache:
+            cache.put(file_path, data, **options)
         return data
     # Error managing: File reading error
     except ValueError as e:
@@ -40,14 +281,333 @@ def load_file(file_path: str) -> DataFrame:
         print(f"Se produjo un error inesperado: {e}")
 
 
-def __import_sql(file_path: str) -> DataFrame:
+def iter_file_batches(file_path: Union[str, list[str]],
+                      chunksize: int = 100_000,
+                      progress_callback: Optional[ProgressCallback] = None,
+                      columns: Optional[list[str]] = None,
+                      table: Optional[str] = None, where: Optional[str] = None,
+                      limit: Optional[int] = None,
+                      sample: Optional[float] = None,
+                      sheet: Optional[str] = None, header: int = 0,
+                      engine: str = "c") -> Iterator[DataFrame]:
+    """
+    Streams a file of any supported format in batches of rows.
+
+    Used to make a single pass over files that may not fit in memory.
+    The options are the same as in `load_file`. .xls sheets cannot be
+    streamed and are yielded in a single batch.
+
+    Parameters 
+    -----------
+    file_path : str or list[str]
+        Path to the file, or the files of a dataset. The batches of a
+        dataset have an extra `_partition` column with their file.
+    chunksize : int, optional
+        Number of rows per batch. SQLite batches are sized from the
+        number of columns instead.
+    progress_callback : callable, optional
+        Receives the progress after every batch, as in `load_file`.
+        SQLite databases do not report progress, and datasets report
+        it after every file.
+    columns, table, where, limit, sample, sheet, header, engine : optional
+        Options of `load_file`.
+
+    Yields
+    -----------
+    DataFrame
+        Consecutive batches of rows.
+    """
+    if is_dataset(file_path):
+        options = {"table": table, "where": where, "limit": limit,
+                   "sample": sample, "sheet": sheet, "header": header,
+                   "engine": engine}
+        files = expand_dataset(file_path)
+        columns = _part_columns(columns)
+        sizes = [os.path.getsize(path) for path in files]
+        bytes_read = parsed = 0
+        for part, name, size in zip(files, _partition_names(files), sizes):
+            for batch in iter_file_batches(part, chunksize, None, columns,
+                                           **options):
+                batch[PARTITION_COLUMN] = name
+                parsed += len(batch)
+                yield batch
+            bytes_read += size
+            if progress_callback is not None:
+                progress_callback(bytes_read, sum(sizes), parsed)
+    elif is_csv(file_path):
+        yield from iter_csv_batches(file_path, chunksize, progress_callback,
+                                    columns, engine)
+    elif is_excel(file_path):
+        if openpyxl is not None and file_path.lower().endswith(".xlsx"):
+            yield from iter_excel_batches(file_path, sheet, header,
+                                          chunksize, progress_callback,
+                                          columns)
+        else:
+            yield __import_excel(file_path, sheet, header, columns=columns)
+    elif is_sqlite(file_path):
+        yield from iter_sqlite_batches(file_path, table, columns, where,
+                                       limit, sample)
+    elif is_columnar(file_path):
+        yield from __iter_columnar_batches(file_path, chunksize,
+                                           progress_callback, columns)
+    else:
+        raise ValueError("Formato de archivo no soportado")
+
+
+def __import_dataset(file_path: Union[str, list[str]],
+                     chunksize: Optional[int] = None,
+                     progress_callback: Optional[ProgressCallback] = None,
+                     columns: Optional[list[str]] = None,
+                     batch_callback: Optional[BatchCallback] = None,
+                     workers: Optional[int] = None, **options) -> DataFrame:
     """
-    Loads data from the first table of a SQL file.
+    Loads the files of a dataset in parallel and concatenates them.
+
+    Each file is parsed by `load_file` in a process pool. The parts are
+    copied into a `ColumnBuffer` in file order as they arrive and then
+    released, so only the parts in flight exist twice in memory. Every
+    file must have the same columns, and the column `_partition` records
+    the file each row came from.
+
+    Parameters 
+    -----------
+    file_path: str or list[str]
+        List of files, directory or glob pattern.
+    chunksize: int, optional
+        Number of rows per batch used to parse each file.
+    progress_callback: callable, optional
+        Receives the bytes of the files read, the bytes of every file and
+        the rows parsed after each file.
+    columns: list[str], optional
+        Columns to read from every file.
+    batch_callback: callable, optional
+        Called with the data of each file.
+    workers: int, optional
+        Number of processes. Defaults to the number of CPUs.
+    **options
+        Options of `load_file` (table, sheet...).
+
+    Returns
+    -----------
+     data: DataFrame
+        Rows of every file.
+    """
+    files = expand_dataset(file_path)
+    columns = _part_columns(columns)
+    sizes = [os.path.getsize(path) for path in files]
+    total_bytes = sum(sizes)
+    workers = min(workers or os.cpu_count() or 1, len(files))
+
+    buffer = ColumnBuffer()
+    callback = _reserving_callback(buffer, progress_callback)
+    lengths = []
+    bytes_read = 0
+    executor = None
+    try:
+        if workers > 1:
+            # Spawned processes do not inherit the threads of the GUI
+            executor = ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context("spawn"))
+            parts = executor.map(_load_partition, files,
+                                 [chunksize] * len(files),
+                                 [columns] * len(files),
+                                 [options] * len(files))
+        else:
+            parts = (_load_partition(path, chunksize, columns, options)
+                     for path in files)
+
+        for path, size, part in zip(files, sizes, parts):
+            if buffer.columns:
+                _check_schema(buffer, part, path)
+            buffer.append(part)
+            lengths.append(len(part))
+            bytes_read += size
+            callback(bytes_read, total_bytes, len(buffer))
+            if batch_callback is not None:
+                batch_callback(part)
+            del part
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    data = buffer.to_dataframe()
+    names = _partition_names(files)
+    codes = np.repeat(np.arange(len(files), dtype=np.int32), lengths)
+    data[PARTITION_COLUMN] = Categorical.from_codes(codes, names)
+    return data
+
+
+def _part_columns(columns: Optional[list[str]]) -> Optional[list[str]]:
+    """
+    Removes the `_partition` column, which is not read from the files.
+    """
+    if columns is None:
+        return None
+    return [column for column in columns if column != PARTITION_COLUMN]
+
+
+def _partition_names(files: list[str]) -> list[str]:
+    """
+    Names the files of a dataset by their file name, or by their full
+    path if two files have the same name.
+    """
+    names = [os.path.basename(path) for path in files]
+    return names if len(set(names)) == len(names) else list(files)
+
+
+def _load_partition(file_path: str, chunksize: Optional[int],
+                    columns: Optional[list[str]], options: dict
+                    ) -> DataFrame:
+    """
+    Loads one file of a dataset. Runs in a worker process.
+    """
+    data = load_file(file_path, chunksize=chunksize, columns=columns,
+                     **options)
+    if data is None:
+        raise ValueError(f"No se ha podido cargar {file_path}")
+    return data
+
+
+def _check_schema(buffer: ColumnBuffer, part: DataFrame,
+                  file_path: str) -> None:
+    """
+    Raises an error if a file of a dataset does not have the columns of
+    the previous files, or a column changes between numbers and text.
+    """
+    if list(part.columns) != buffer.columns:
+        raise ValueError(f"Las columnas de {os.path.basename(file_path)} "
+                         "no coinciden con las de los archivos anteriores")
+    if not len(part) or not len(buffer):
+        return
+    first = buffer.dtypes
+    for name in buffer.columns:
+        if is_numeric_dtype(first[name]) != is_numeric_dtype(part[name]):
+            raise ValueError(f"La columna {name} de "
+                             f"{os.path.basename(file_path)} no tiene el "
+                             "mismo tipo que en los archivos anteriores")
+
+
+def list_sqlite_tables(file_path: str) -> list[tuple[str, int]]:
+    """
+    Lists the tables of a SQLite database with their number of rows.
+
+    Parameters 
+    -----------
+    file_path: str
+        Path to the .sqlite/.db file.
+
+    Returns
+    -----------
+    list[tuple[str, int]]
+        Name and row count of each table.
+
+    Raises
+    -----------
+    ValueError: If the database cannot be opened
+    """
+    try:
+        conn = __connect_sqlite(file_path)
+        try:
+            names = [row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' "
+                "AND name NOT LIKE 'sqlite_%';")]
+            return [(name, conn.execute(
+                f"SELECT COUNT(*) FROM {quote_identifier(name)}").fetchone()[0])
+                for name in names]
+        finally:
+            conn.close()
+    except Exception as e:
+        raise ValueError(f"Error al cargar la base de datos SQLite: {e}")
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quotes a table or column name to be used in a SQLite query.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def build_sqlite_query(table: str, columns: Optional[list[str]] = None,
+                       where: Optional[str] = None,
+                       limit: Optional[int] = None,
+                       sample: Optional[float] = None) -> str:
+    """
+    Builds the query that reads a table with the given filters.
+
+    Parameters 
+    -----------
+    table: str
+        Name of the table.
+    columns: list[str], optional
+        Columns to select. If None, all columns are selected.
+    where: str, optional
+        SQL condition rows must satisfy.
+    limit: int, optional
+        Maximum number of rows to read.
+    sample: float, optional
+        Fraction of rows (0-1] to read. Rows are chosen by a hash of their
+        rowid, so the same rows are returned for any set of columns. The
+        table must have a rowid (see `_check_rowid`).
+
+    Returns
+    -----------
+    str
+        The SELECT query.
+    """
+    projection = "*" if not columns else\
+        ", ".join(quote_identifier(column) for column in columns)
+    query = f"SELECT {projection} FROM {quote_identifier(table)}"
+
+    conditions = []
+    if where:
+        conditions.append(f"({where})")
+    if sample is not None:
+        if not 0 < sample <= 1:
+            raise ValueError("La muestra debe ser una fracción entre 0 y 1")
+        # Multiplicative hash of the rowid, uniform in [0, 2^32). The
+        # rowid is split in two 16-bit halves so no product overflows
+        # the 64-bit integers of SQLite, whatever the rowid
+        threshold = int(sample * 2 ** 32)
+        conditions.append(
+            "(((rowid & 65535) * 2654435761 + "
+            "((((rowid >> 16) & 65535) * 2654435761) & 65535) * 65536) "
+            f"& 4294967295) < {threshold}")
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    if limit is not None:
+        query += f" LIMIT {int(limit)}"
+    return query
+
+
+def __import_sql(file_path: str, table: Optional[str] = None,
+                 columns: Optional[list[str]] = None,
+                 where: Optional[str] = None, limit: Optional[int] = None,
+                 sample: Optional[float] = None,
+                 batch_callback: Optional[BatchCallback] = None) -> DataFrame:
+    """
+    Loads data from a table of a SQL file.
+
+    The column selection, filter, limit and sample are pushed down into
+    the SQL query, so SQLite only returns the requested data. The rows
+    of the query are counted first and the `ColumnBuffer` is reserved
+    with them, so the columns are allocated once at their final size.
 
     Parameters 
     -----------
     file_path: str
         Path to the .sql/.db file.
+    table: str, optional
+        Table to read. Defaults to the first table of the database.
+    columns: list[str], optional
+        Columns to read. If None, all columns are read.
+    where: str, optional
+        SQL condition rows must satisfy.
+    limit: int, optional
+        Maximum number of rows to read.
+    sample: float, optional
+        Fraction of rows (0-1] to read.
+    batch_callback: callable, optional
+        Called with every batch fetched from the database.
 
     Returns
     -----------
@@ -59,38 +619,214 @@ def __import_sql(file_path: str) -> DataFrame:
     ValueError: If the database is empty or cannot be loaded
     """
     try:
-        conn = sqlite3.connect(file_path)
-        cursor = conn.cursor()
+        conn = __connect_sqlite(file_path)
+        try:
+            cursor = conn.cursor()
 
-        # Obtain the name of the first table
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        result = cursor.fetchone()
+            # Obtain the names of the tables
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table';")
+            tables = [row[0] for row in cursor.fetchall()]
 
-        # Check if any tables exist
-        if result is None:
-            conn.close()
-            raise ValueError("La base de datos no contiene ninguna tabla")
+            # Check if any tables exist
+            if not tables:
+                raise ValueError("La base de datos no contiene ninguna tabla")
+            if table is None:
+                table = tables[0]
+            elif table not in tables:
+                raise ValueError(f"La tabla '{table}' no existe")
+            if sample is not None:
+                _check_rowid(conn, table)
 
-        table_name = result[0]
+            # Same filters as the data, so the count is the rows read
+            rows = cursor.execute(
+                "SELECT COUNT(*) FROM (" + build_sqlite_query(
+                    table, None, where, limit, sample) + ")").fetchone()[0]
+        finally:
+            conn.close()
 
         # Load the data from the table to the DataFrame
-        query = f"SELECT * FROM {table_name}"
-        data = read_sql(query, conn)
+        batches = iter_sqlite_batches(file_path, table, columns, where,
+                                      limit, sample)
+        return _collect_batches(batches, ColumnBuffer(rows), batch_callback)
+    except Exception as e:
+        raise ValueError(f"Error al cargar la base de datos SQLite: {e}")
+
+
+def iter_sqlite_batches(file_path: str, table: str,
+                        columns: Optional[list[str]] = None,
+                        where: Optional[str] = None,
+                        limit: Optional[int] = None,
+                        sample: Optional[float] = None,
+                        batch_size: Optional[int] = None
+                        ) -> Iterator[DataFrame]:
+    """
+    Streams the rows of a SQLite table in typed batches.
+
+    Rows are fetched from the cursor `batch_size` at a time and each
+    batch is turned into one NumPy array per column, so at most one batch
+    of Python tuples exists in memory. The batches can be consumed one by
+    one without building the whole table.
+
+    Parameters 
+    -----------
+    file_path: str
+        Path to the .sqlite/.db file.
+    table: str
+        Table to read.
+    columns, where, limit, sample: optional
+        Filters pushed into the query, as in `build_sqlite_query`.
+    batch_size: int, optional
+        Rows fetched per batch. By default it is chosen so that each batch
+        holds about 250,000 values.
+
+    Yields
+    -----------
+    DataFrame
+        Consecutive batches of rows.
+    """
+    conn = __connect_sqlite(file_path)
+    try:
+        if sample is not None:
+            _check_rowid(conn, table)
+        cursor = conn.cursor()
+        cursor.execute(build_sqlite_query(table, columns, where, limit,
+                                          sample))
+        names = [description[0] for description in cursor.description]
+        if batch_size is None:
+            batch_size = max(1000, 250_000 // max(len(names), 1))
+        cursor.arraysize = batch_size
+
+        empty = True
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            empty = False
+            values = zip(*rows)
+            del rows
+            batch = DataFrame({name: _column_array(column)
+                               for name, column in zip(names, values)},
+                              columns=names, copy=False)
+            # The zip keeps an iterator, and so a tuple, of every row
+            del values
+            yield batch
+            del batch
 
+        # Keep the column names when no row matches the query
+        if empty:
+            yield DataFrame(columns=names)
+    finally:
         conn.close()
-        return data
+
+
+def _check_rowid(conn: sqlite3.Connection, table: str) -> None:
+    """
+    Checks that a table has the rowid the samples are hashed from.
+
+    Raises
+    -----------
+    ValueError: If the table is a WITHOUT ROWID table
+    """
+    try:
+        conn.execute(f"SELECT rowid FROM {quote_identifier(table)} LIMIT 0")
+    except sqlite3.OperationalError as e:
+        if "rowid" not in str(e):
+            raise
+        raise ValueError(f"No se puede tomar una muestra de la tabla "
+                         f"'{table}': es una tabla WITHOUT ROWID")
+
+
+def _column_array(values: tuple) -> np.ndarray:
+    """
+    Converts the values of a column fetched from SQLite to a typed array.
+
+    Integer and real columns become int64/float64 arrays (float64 with NaN
+    if they contain NULLs); anything else is kept as objects.
+
+    The dtype is chosen from the Python types of the values, so text
+    columns are built as objects directly instead of going through a
+    fixed-width string array as wide as the longest value.
+    """
+    types = set(map(type, values))
+    if types and types <= {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            # Integers too large for int64
+            return np.array(values, dtype=np.float64)
+    if types <= {int, float, bool, type(None)} and types != {bool}:
+        # Numbers mixed with NULLs
+        return np.array(values, dtype=np.float64)
+    return np.array(values, dtype=object)
+
+
+def __connect_sqlite(file_path: str) -> sqlite3.Connection:
+    """
+    Opens a read-only connection to a SQLite database.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(file_path)
+    uri = Path(os.path.abspath(file_path)).as_uri() + "?mode=ro"
+    return sqlite3.connect(uri, uri=True)
+
+
+def list_excel_sheets(file_path: str) -> list[str]:
+    """
+    Lists the sheets of an Excel file.
+
+    Parameters 
+    -----------
+    file_path: str
+        Path to the .xls/.xlsx file.
+
+    Returns
+    -----------
+    list[str]
+        Names of the sheets, in the workbook order.
+    """
+    try:
+        if openpyxl is not None and file_path.lower().endswith(".xlsx"):
+            workbook = openpyxl.load_workbook(file_path, read_only=True)
+            try:
+                return list(workbook.sheetnames)
+            finally:
+                workbook.close()
+        with ExcelFile(file_path) as excel_file:
+            return [str(name) for name in excel_file.sheet_names]
     except Exception as e:
-        raise ValueError(f"Error al cargar la base de datos SQLite: {e}")
+        raise ValueError(f"Error al cargar el archivo excel: {e}")
 
 
-def __import_excel(file_path: str) -> DataFrame:
+def __import_excel(file_path: str, sheet: Optional[str] = None,
+                   header: int = 0, chunksize: Optional[int] = None,
+                   progress_callback: Optional[ProgressCallback] = None,
+                   batch_callback: Optional[BatchCallback] = None,
+                   columns: Optional[list[str]] = None) -> DataFrame:
     """
     Loads data from an Excel file.
 
+    With a `chunksize`, .xlsx files are streamed row by row with a
+    read-only workbook and their typed batches are appended into a
+    `ColumnBuffer`. Otherwise (and for .xls files) the sheet is read
+    in one call.
+
     Parameters 
     -----------
     file_path: str
         Path to the .xls/.xlsx file.
+    sheet: str, optional
+        Sheet to read. Defaults to the first sheet.
+    header: int, optional
+        Index (starting at 0) of the row with the column names.
+    chunksize: int, optional
+        Number of rows per batch when streaming the sheet.
+    progress_callback: callable, optional
+        Receives the rows read, the rows of the sheet and the rows parsed.
+    batch_callback: callable, optional
+        Called with every batch when streaming the sheet.
+    columns: list[str], optional
+        Columns to read. If None, all columns are read.
 
     Returns
     -----------
@@ -98,8 +834,19 @@ def __import_excel(file_path: str) -> DataFrame:
         Data in a DataFrame.
     """
     try:
-        # Read excel file
-        data = read_excel(file_path)
+        if chunksize and openpyxl is not None and\
+                file_path.lower().endswith(".xlsx"):
+            buffer = ColumnBuffer()
+            callback = _reserving_callback(buffer, progress_callback)
+            batches = iter_excel_batches(file_path, sheet, header, chunksize,
+                                         callback, columns)
+            data = _collect_batches(batches, buffer, batch_callback)
+        else:
+            # Read excel file
+            data = read_excel(file_path,
+                              sheet_name=0 if sheet is None else sheet,
+                              header=header, usecols=columns)
+            data = _select_columns(data, columns)
         if data.empty:
             raise ValueError(f"Documento excel vacio")
         return data
@@ -109,7 +856,112 @@ def __import_excel(file_path: str) -> DataFrame:
     # Needed in order to work: pip install pandas openpyxl xlrd
 
 
-def __import_csv(file_path: str) -> DataFrame:
+def iter_excel_batches(file_path: str, sheet: Optional[str] = None,
+                       header: int = 0, chunksize: int = 10_000,
+                       progress_callback: Optional[ProgressCallback] = None,
+                       columns: Optional[list[str]] = None
+                       ) -> Iterator[DataFrame]:
+    """
+    Streams the rows of an .xlsx sheet in typed batches.
+
+    The workbook is opened in read-only mode, so rows are read from the
+    file as they are iterated instead of building the whole workbook.
+
+    Parameters 
+    -----------
+    file_path: str
+        Path to the .xlsx file.
+    sheet: str, optional
+        Sheet to read. Defaults to the first sheet.
+    header: int, optional
+        Index (starting at 0) of the row with the column names.
+    chunksize: int, optional
+        Number of rows per batch.
+    progress_callback: callable, optional
+        Receives the rows read, the rows of the sheet and the rows parsed.
+    columns: list[str], optional
+        Columns to read, in the given order. If None, all columns are read.
+
+    Yields
+    -----------
+    DataFrame
+        Consecutive batches of rows.
+    """
+    workbook = openpyxl.load_workbook(file_path, read_only=True,
+                                      data_only=True)
+    try:
+        worksheet = workbook.worksheets[0] if sheet is None else\
+            workbook[sheet]
+        total_rows = worksheet.max_row or 0
+        rows = worksheet.iter_rows(min_row=header + 1, values_only=True)
+
+        names = _column_names(next(rows, ()))
+        width = len(names)
+        indices = None
+        if columns is not None:
+            missing = [column for column in columns if column not in names]
+            if missing:
+                raise ValueError(f"Columnas no encontradas: {missing}")
+            indices = [names.index(column) for column in columns]
+            names = list(columns)
+        position = header + 1
+        parsed = 0
+        batch = []
+        for row in rows:
+            position += 1
+            # Blank rows are skipped, as read_excel does
+            if all(value is None for value in row):
+                continue
+            row = tuple(row[:width]) + (None,) * (width - len(row))
+            if indices is not None:
+                row = tuple(row[i] for i in indices)
+            batch.append(row)
+            if len(batch) == chunksize:
+                parsed += len(batch)
+                if progress_callback is not None:
+                    progress_callback(position, total_rows, parsed)
+                yield _rows_to_batch(batch, names)
+                batch = []
+
+        if batch or not parsed:
+            parsed += len(batch)
+            if progress_callback is not None:
+                progress_callback(total_rows, total_rows, parsed)
+            yield _rows_to_batch(batch, names)
+    finally:
+        workbook.close()
+
+
+def _column_names(header_row: tuple) -> list[str]:
+    """
+    Builds the column names from a header row, naming empty cells and
+    renaming duplicates like `read_excel`.
+    """
+    names = []
+    for i, value in enumerate(header_row):
+        name = f"Unnamed: {i}" if value is None else str(value)
+        base, count = name, 1
+        while name in names:
+            name = f"{base}.{count}"
+            count += 1
+        names.append(name)
+    return names
+
+
+def _rows_to_batch(rows: list[tuple], names: list[str]) -> DataFrame:
+    """
+    Turns a list of row tuples into a DataFrame with typed columns.
+    """
+    if not rows:
+        return DataFrame(columns=names)
+    columns = zip(*rows)
+    return DataFrame({name: _column_array(values)
+                      for name, values in zip(names, columns)},
+                     columns=names, copy=False)
+
+
+def __import_csv(file_path: str, columns: Optional[list[str]] = None,
+                 engine: str = "c") -> DataFrame:
     """
     Loads data from a CSV file.
 
@@ -117,6 +969,10 @@ def __import_csv(file_path: str) -> DataFrame:
     -----------
     file_path: str
         Path to the .csv file.
+    columns: list[str], optional
+        Columns to read. If None, all columns are read.
+    engine: str, optional
+        CSV parser, "c" or "pyarrow".
 
     Returns
     -----------
@@ -124,12 +980,455 @@ def __import_csv(file_path: str) -> DataFrame:
         Data in a DataFrame.
     """
     try:
+        if _use_pyarrow(engine):
+            try:
+                options = _pyarrow_csv_options(file_path, columns)
+                with open_csv(file_path) as (_, stream):
+                    table = pacsv.read_csv(stream, **options)
+                return table.to_pandas(split_blocks=True)
+            except (pa.ArrowInvalid, KeyError):
+                # Values that do not match the type inferred from the
+                # first block, or unknown columns: use the pandas parser
+                pass
+
         # Read csv file
-        data = read_csv(file_path)
-        return data
+        with open_csv(file_path) as (_, stream):
+            data = read_csv(stream, usecols=columns,
+                            sep=_csv_separator(file_path))
+        return _select_columns(data, columns)
 
-    except ValueError as e:
+    except EmptyDataError as e:
         raise ValueError(
             f"Error al cargar el archivo CSV: Documento CSV vacio")
     except Exception as e:
         raise ValueError(f"Error al cargar el archivo CSV: {e}")
+
+
+def __import_csv_chunked(file_path: str, chunksize: int,
+                         progress_callback: Optional[ProgressCallback] = None,
+                         batch_callback: Optional[BatchCallback] = None,
+                         columns: Optional[list[str]] = None,
+                         engine: str = "c") -> DataFrame:
+    """
+    Loads data from a CSV file in batches of `chunksize` rows.
+
+    Each batch is converted to its final dtypes and copied into a
+    preallocated `ColumnBuffer`, so peak memory stays close to the
+    size of the resulting DataFrame.
+
+    Parameters 
+    -----------
+    file_path: str
+        Path to the .csv file.
+    chunksize: int
+        Number of rows per batch.
+    progress_callback: callable, optional
+        Receives the bytes read, the file size and the rows parsed.
+    batch_callback: callable, optional
+        Called with every batch read.
+    columns: list[str], optional
+        Columns to read. If None, all columns are read.
+    engine: str, optional
+        CSV parser, "c" or "pyarrow".
+
+    Returns
+    -----------
+     data: DataFrame
+        Data in a DataFrame.
+    """
+    try:
+        buffer = ColumnBuffer()
+        callback = _reserving_callback(buffer, progress_callback)
+        batches = iter_csv_batches(file_path, chunksize, callback, columns,
+                                   engine)
+        return _collect_batches(batches, buffer, batch_callback)
+
+    except EmptyDataError:
+        raise ValueError(
+            f"Error al cargar el archivo CSV: Documento CSV vacio")
+    except Exception as e:
+        raise ValueError(f"Error al cargar el archivo CSV: {e}")
+
+
+def iter_csv_batches(file_path: str, chunksize: int,
+                     progress_callback: Optional[ProgressCallback] = None,
+                     columns: Optional[list[str]] = None,
+                     engine: str = "c") -> Iterator[DataFrame]:
+    """
+    Streams the rows of a CSV file in batches of `chunksize` rows.
+
+    Compressed files are decompressed while they are parsed, without
+    writing the decompressed data to disk. The progress is measured in
+    bytes of the compressed file.
+
+    With the "pyarrow" engine, batches hold about `chunksize` rows and
+    are parsed in several threads. Arrow fixes the column types with the
+    first block, so if a later block does not match them, the file is
+    parsed again from the start with the pandas parser and the rows
+    already yielded are dropped.
+
+    Parameters 
+    -----------
+    file_path: str
+        Path to the .csv/.tsv file, optionally compressed.
+    chunksize: int
+        Number of rows per batch.
+    progress_callback: callable, optional
+        Receives the bytes read, the file size and the rows parsed.
+    columns: list[str], optional
+        Columns to read, in the given order. The other columns are
+        skipped by the parser. If None, all columns are read.
+    engine: str, optional
+        CSV parser, "c" or "pyarrow".
+
+    Yields
+    -----------
+    DataFrame
+        Consecutive batches of rows.
+    """
+    total_bytes = os.path.getsize(file_path)
+    parsed = 0
+    if _use_pyarrow(engine):
+        try:
+            options = _pyarrow_csv_options(
+                file_path, columns, block_size=_block_size(chunksize))
+            with open_csv(file_path) as (handle, stream):
+                reader = pacsv.open_csv(stream, **options)
+                empty = True
+                for record_batch in reader:
+                    empty = False
+                    parsed += record_batch.num_rows
+                    if progress_callback is not None:
+                        progress_callback(handle.tell(), total_bytes, parsed)
+                    yield record_batch.to_pandas()
+                # Keep the column names of a file with only the header
+                if empty:
+                    yield reader.schema.empty_table().to_pandas()
+            return
+        except (pa.ArrowInvalid, KeyError):
+            # Continue with the pandas parser after the rows yielded
+            pass
+
+    # The rows yielded are counted in parsed rows and not skipped with
+    # `skiprows`, which counts the blank lines that pyarrow ignores
+    skip = parsed
+    with open_csv(file_path) as (handle, stream):
+        for batch in read_csv(stream, chunksize=chunksize, usecols=columns,
+                              sep=_csv_separator(file_path)):
+            if skip:
+                dropped = min(skip, len(batch))
+                skip -= dropped
+                batch = batch.iloc[dropped:]
+                if batch.empty:
+                    continue
+            parsed += len(batch)
+            if progress_callback is not None:
+                progress_callback(handle.tell(), total_bytes, parsed)
+            yield _select_columns(batch, columns)
+
+
+def _use_pyarrow(engine: str) -> bool:
+    """
+    Checks if the pyarrow CSV parser has to be used.
+    """
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Motor de CSV no soportado: {engine}")
+    return engine == "pyarrow" and pa is not None
+
+
+def _pyarrow_csv_options(file_path: str, columns: Optional[list[str]] = None,
+                         block_size: Optional[int] = None) -> dict:
+    """
+    Builds the options of the pyarrow CSV reader, with nulls and dates
+    parsed like in `read_csv`.
+
+    pyarrow infers dates, times and timestamps, which `read_csv` leaves
+    as text. The types are inferred from the first block of the file, so
+    the first block is parsed with the same options and the temporal
+    columns found are read as strings.
+    """
+    options = {
+        "read_options": pacsv.ReadOptions(use_threads=True,
+                                          block_size=block_size),
+        "parse_options": pacsv.ParseOptions(
+            delimiter=_csv_separator(file_path)),
+        "convert_options": pacsv.ConvertOptions(include_columns=columns,
+                                                strings_can_be_null=True),
+    }
+    with open_csv(file_path) as (_, stream):
+        schema = pacsv.open_csv(stream, **options).schema
+    temporal = {field.name: pa.string() for field in schema
+                if pa.types.is_temporal(field.type)}
+    if temporal:
+        options["convert_options"].column_types = temporal
+    return options
+
+
+def _block_size(chunksize: int) -> int:
+    """
+    Estimates the bytes of a pyarrow block holding about `chunksize` rows.
+    """
+    return min(max(chunksize * 64, 1 << 20), 1 << 30)
+
+
+@contextmanager
+def open_csv(file_path: str) -> Iterator[tuple]:
+    """
+    Opens a CSV file, decompressing it on the fly if it is compressed.
+
+    Parameters 
+    -----------
+    file_path: str
+        Path to the .csv/.tsv file, optionally ending in .gz, .bz2, .xz
+        or .zst.
+
+    Yields
+    -----------
+    tuple
+        Raw file handle, whose position tells the compressed bytes read,
+        and the binary stream with the decompressed data.
+    """
+    extension = os.path.splitext(file_path.lower())[1]
+    if extension == ".zst" and zstandard is None:
+        raise ValueError("Se necesita zstandard para leer archivos .zst")
+
+    with open(file_path, "rb") as handle:
+        if extension == ".gz":
+            stream = gzip.GzipFile(fileobj=handle)
+        elif extension == ".bz2":
+            stream = bz2.BZ2File(handle)
+        elif extension == ".xz":
+            stream = lzma.LZMAFile(handle)
+        elif extension == ".zst":
+            stream = zstandard.ZstdDecompressor().stream_reader(handle)
+        else:
+            yield handle, handle
+            return
+        with stream:
+            yield handle, stream
+
+
+def _csv_separator(file_path: str) -> str:
+    """
+    Returns the field separator of a CSV or TSV file.
+    """
+    path = file_path.lower()
+    if path.endswith(COMPRESSION_EXTENSIONS):
+        path = os.path.splitext(path)[0]
+    return "\t" if path.endswith(".tsv") else ","
+
+
+def _select_columns(data: DataFrame,
+                    columns: Optional[list[str]] = None) -> DataFrame:
+    """
+    Puts the columns read with `usecols` in the requested order, which
+    the CSV and Excel parsers do not keep.
+    """
+    if columns is None or list(data.columns) == list(columns):
+        return data
+    return data[list(columns)]
+
+
+def _collect_batches(batches: Iterator[DataFrame], buffer: ColumnBuffer,
+                     batch_callback: Optional[BatchCallback] = None
+                     ) -> DataFrame:
+    """
+    Appends every batch into the buffer and returns the resulting DataFrame.
+    """
+    for batch in batches:
+        buffer.append(batch)
+        if batch_callback is not None:
+            batch_callback(batch)
+    return buffer.to_dataframe()
+
+
+def _reserving_callback(buffer: ColumnBuffer,
+                        progress_callback: Optional[ProgressCallback] = None
+                        ) -> ProgressCallback:
+    """
+    Wraps a progress callback so the first batch also preallocates the
+    buffer with the number of rows estimated from the progress made.
+    """
+    def callback(position: int, total: int, rows: int) -> None:
+        if not len(buffer) and rows:
+            buffer.reserve(int(total * rows / max(position, 1) * 1.05))
+        if progress_callback is not None:
+            progress_callback(position, total, rows)
+    return callback
+
+
+def probe_file(file_path: Union[str, list[str]], nrows: int = 1000,
+               table: Optional[str] = None, where: Optional[str] = None,
+               limit: Optional[int] = None,
+               sample: Optional[float] = None,
+               sheet: Optional[str] = None, header: int = 0) -> DataFrame:
+    """
+    Reads the header and the first rows of a file to preview it.
+
+    Only the schema and the first `nrows` rows are read, so the column
+    selector can be populated without loading the whole file. The
+    confirmed columns are loaded later with `load_file(columns=...)`.
+
+    Parameters 
+    -----------
+    file_path: str
+        Path to the file, with any of the formats of `load_file`, or
+        the files of a dataset.
+    nrows: int
+        Number of rows to read.
+    table, where, limit, sample: optional
+        SQLite options, as in `load_file`.
+    sheet, header: optional
+        Excel options, as in `load_file`.
+
+    Returns
+    -----------
+     data: DataFrame
+        First rows of the file with every column.
+    """
+    if is_dataset(file_path):
+        # The first file is enough to know the columns of the dataset
+        files = expand_dataset(file_path)
+        data = probe_file(files[0], nrows, table, where, limit, sample,
+                          sheet, header)
+        data[PARTITION_COLUMN] = Categorical(
+            [_partition_names(files)[0]] * len(data),
+            categories=_partition_names(files))
+        return data
+    if is_sqlite(file_path):
+        nrows = nrows if limit is None else min(nrows, limit)
+        return __import_sql(file_path, table, where=where, limit=nrows,
+                            sample=sample)
+    if is_csv(file_path):
+        try:
+            with open_csv(file_path) as (_, stream):
+                return read_csv(stream, nrows=nrows,
+                                sep=_csv_separator(file_path))
+        except EmptyDataError:
+            raise ValueError(
+                f"Error al cargar el archivo CSV: Documento CSV vacio")
+        except Exception as e:
+            raise ValueError(f"Error al cargar el archivo CSV: {e}")
+    if is_excel(file_path):
+        try:
+            if openpyxl is not None and file_path.lower().endswith(".xlsx"):
+                batches = iter_excel_batches(file_path, sheet, header,
+                                             chunksize=nrows)
+                try:
+                    return next(batches)
+                finally:
+                    # Closes the workbook without reading the other rows
+                    batches.close()
+            return read_excel(file_path,
+                              sheet_name=0 if sheet is None else sheet,
+                              header=header, nrows=nrows)
+        except Exception as e:
+            raise ValueError(f"Error al cargar el archivo excel: {e}")
+    if not is_columnar(file_path):
+        raise ValueError("Formato de archivo no soportado")
+    try:
+        __check_pyarrow(file_path)
+        if file_path.lower().endswith(PARQUET_EXTENSIONS):
+            parquet_file = pq.ParquetFile(file_path)
+            batch = next(parquet_file.iter_batches(batch_size=nrows), None)
+            if batch is None:
+                return parquet_file.schema_arrow.empty_table().to_pandas()
+            return batch.to_pandas()
+        table = __read_arrow_table(file_path)
+        return table.slice(0, nrows).to_pandas()
+
+    except Exception as e:
+        raise ValueError(f"Error al cargar el archivo columnar: {e}")
+
+
+def __import_columnar(file_path: str,
+                      columns: Optional[list[str]] = None) -> DataFrame:
+    """
+    Loads data from a Parquet, Feather or Arrow IPC file.
+
+    Only the requested columns are read, using the column projection of
+    each format. Feather and Arrow IPC files are memory-mapped, so the
+    columns without nulls are used directly from the mapped file.
+
+    Parameters 
+    -----------
+    file_path: str
+        Path to the .parquet/.feather/.arrow file.
+    columns: list[str], optional
+        Columns to read. If None, all columns are read.
+
+    Returns
+    -----------
+     data: DataFrame
+        Data in a DataFrame.
+    """
+    try:
+        __check_pyarrow(file_path)
+        if file_path.lower().endswith(PARQUET_EXTENSIONS):
+            table = pq.read_table(file_path, columns=columns)
+        else:
+            table = __read_arrow_table(file_path, columns)
+        # One block per column avoids copying the mapped buffers
+        return table.to_pandas(split_blocks=True)
+
+    except Exception as e:
+        raise ValueError(f"Error al cargar el archivo columnar: {e}")
+
+
+def __iter_columnar_batches(file_path: str, chunksize: int,
+                            progress_callback: Optional[ProgressCallback]
+                            = None,
+                            columns: Optional[list[str]] = None
+                            ) -> Iterator[DataFrame]:
+    """
+    Streams a Parquet, Feather or Arrow IPC file in batches of rows.
+
+    The progress is reported in rows, as the row count is stored in the
+    file metadata.
+    """
+    __check_pyarrow(file_path)
+    if file_path.lower().endswith(PARQUET_EXTENSIONS):
+        parquet_file = pq.ParquetFile(file_path)
+        total_rows = parquet_file.metadata.num_rows
+        batches = parquet_file.iter_batches(batch_size=chunksize,
+                                            columns=columns)
+    else:
+        table = __read_arrow_table(file_path, columns)
+        total_rows = table.num_rows
+        batches = table.to_batches(max_chunksize=chunksize)
+
+    parsed = 0
+    for batch in batches:
+        parsed += batch.num_rows
+        if progress_callback is not None:
+            progress_callback(parsed, total_rows, parsed)
+        yield batch.to_pandas()
+
+
+def __read_arrow_table(file_path: str,
+                       columns: Optional[list[str]] = None) -> "pa.Table":
+    """
+    Memory-maps a Feather or Arrow IPC file and returns its table.
+    """
+    if file_path.lower().endswith(FEATHER_EXTENSIONS):
+        return feather.read_table(file_path, columns=columns,
+                                  memory_map=True)
+    source = pa.memory_map(file_path, "r")
+    try:
+        table = ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        # Arrow IPC stream format instead of the file format
+        source.seek(0)
+        table = ipc.open_stream(source).read_all()
+    if columns is not None:
+        table = table.select(columns)
+    return table
+
+
+def __check_pyarrow(file_path: str) -> None:
+    """
+    Raises an error if pyarrow is not installed.
+    """
+    if pa is None:
+        extension = os.path.splitext(file_path)[1]
+        raise ValueError(f"Se necesita pyarrow para leer archivos {extension}")
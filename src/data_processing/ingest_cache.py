@@ -0,0 +1,200 @@
+from pandas import DataFrame
+from typing import Optional
+import hashlib
+import os
+
+# Needed in order to work: pip install pyarrow
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+
+class IngestCache():
+    """
+    On-disk cache of parsed data files.
+
+    Parsed DataFrames are stored as uncompressed Arrow IPC (Feather) files,
+    so reopening a file only memory-maps the stored columns instead of
+    parsing it again. Entries are keyed by a fingerprint of the source file
+    and the oldest used entries are evicted when the cache exceeds its size.
+
+    Attributes
+    ----------
+    directory : str
+        Directory where the cached files are stored.
+    max_bytes : int
+        Maximum size of the cache on disk.
+    sample_bytes : int
+        Bytes hashed from the head and the tail of each source file.
+    """
+
+    EXTENSION = ".arrow"
+
+    def __init__(self, directory: Optional[str] = None,
+                 max_bytes: int = 4 * 1024 ** 3,
+                 sample_bytes: int = 64 * 1024) -> None:
+        """
+        Initializes the cache.
+
+        Parameters
+        ----------
+        directory : str, optional
+            Directory where the cached files are stored. Defaults to
+            `~/.cache/linear_model_maker/ingest`.
+        max_bytes : int, optional
+            Maximum size of the cache on disk.
+        sample_bytes : int, optional
+            Bytes hashed from the head and the tail of each source file.
+        """
+        if directory is None:
+            directory = os.path.join(os.path.expanduser("~"), ".cache",
+                                     "linear_model_maker", "ingest")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.sample_bytes = sample_bytes
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Checks if the cache can be used (pyarrow is installed).
+        """
+        return feather is not None
+
+    def key(self, file_path: str, **options) -> str:
+        """
+        Computes the cache key of a file.
+
+        The key combines the absolute path, size and modification time of
+        the file, a hash of its first and last bytes and the load options.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the source file.
+        **options
+            Load options that change the parsed result.
+
+        Returns
+        ----------
+        str
+            Hexadecimal key of the entry.
+        """
+        stat = os.stat(file_path)
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(os.path.abspath(file_path).encode())
+        digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        digest.update(repr(sorted(options.items())).encode())
+        with open(file_path, "rb") as handle:
+            digest.update(handle.read(self.sample_bytes))
+            if stat.st_size > 2 * self.sample_bytes:
+                handle.seek(-self.sample_bytes, os.SEEK_END)
+                digest.update(handle.read(self.sample_bytes))
+        return digest.hexdigest()
+
+    def get(self, file_path: str, **options) -> Optional[DataFrame]:
+        """
+        Returns the cached DataFrame of a file, if present.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the source file.
+        **options
+            Load options used when the entry was stored.
+
+        Returns
+        ----------
+        DataFrame or None
+            Cached data, or None if there is no valid entry.
+        """
+        if not self.enabled:
+            return None
+        path = self._entry_path(self.key(file_path, **options))
+        if not os.path.exists(path):
+            return None
+        try:
+            table = feather.read_table(path, memory_map=True)
+            # Mark the entry as recently used
+            os.utime(path)
+            return table.to_pandas(split_blocks=True)
+        except Exception:
+            # Corrupted entries are discarded and parsed again
+            self._remove(path)
+            return None
+
+    def put(self, file_path: str, data: DataFrame, **options) -> bool:
+        """
+        Stores the parsed DataFrame of a file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the source file.
+        data : DataFrame
+            Parsed data of the file.
+        **options
+            Load options used to parse the file.
+
+        Returns
+        ----------
+        bool
+            True if the data was stored, False otherwise.
+        """
+        if not self.enabled:
+            return False
+        path = self._entry_path(self.key(file_path, **options))
+        temp_path = path + ".tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            feather.write_feather(data, temp_path,
+                                  compression="uncompressed")
+            if os.path.getsize(temp_path) > self.max_bytes:
+                self._remove(temp_path)
+                return False
+            os.replace(temp_path, path)
+        except Exception:
+            # Data that cannot be stored (e.g. non-string column names)
+            # is simply not cached
+            self._remove(temp_path)
+            return False
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache fits
+        in `max_bytes`.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(self.EXTENSION):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(os.path.join(self.directory, name))
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Removes every entry of the cache.
+        """
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(self.EXTENSION):
+                self._remove(os.path.join(self.directory, name))
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.EXTENSION)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
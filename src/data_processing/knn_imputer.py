@@ -0,0 +1,115 @@
+import numpy as np
+from pandas import DataFrame
+from scipy.spatial import KDTree
+from typing import Optional, Union
+from data_processing.null_index import NullIndex
+from data_processing.row_mask import RowMask
+
+
+def knn_impute(data: DataFrame, columns: list[str],
+               k: Union[int, list[int]] = 5,
+               features: Optional[list[str]] = None,
+               null_index: Optional[NullIndex] = None,
+               row_mask: Optional[RowMask] = None,
+               batch_size: int = 65_536, workers: int = -1) -> None:
+    """
+    Fills in place the nulls of some columns with the mean of the `k`
+    nearest complete rows.
+
+    The complete rows of the feature columns are the donors. Incomplete
+    rows are grouped by their pattern of missing features, and each group
+    queries a KD-tree built on the donors over the features it has, so
+    distances are only measured on observed values. Each tree is built
+    and queried once, for the largest `k`, and the columns with a smaller
+    `k` average the first of those neighbours. Features are
+    standardized with the mean and standard deviation of the donors. The
+    queries of each group run in batches of `batch_size` rows, split
+    across `workers` threads, so the cost grows as `n log n` with the
+    rows instead of the `n ** 2` of the pairwise distances.
+
+    Rows that have no observed features, or data without complete rows,
+    keep their nulls.
+
+    Parameters
+    ----------
+    data : DataFrame
+        Data to fill.
+    columns : list[str]
+        Numeric columns whose nulls are filled.
+    k : int or list[int], optional
+        Number of neighbours averaged, or one number per column of
+        `columns`.
+    features : list[str], optional
+        Numeric columns used to measure the distance between rows. They
+        must include `columns`. By default, `columns`.
+    null_index : NullIndex, optional
+        Index of the nulls of `data`, updated with the changes.
+    row_mask : RowMask, optional
+        Rows kept of `data`. Deleted rows are not used as neighbours.
+    batch_size : int, optional
+        Number of rows queried at once.
+    workers : int, optional
+        Threads used by the queries, -1 for every CPU.
+    """
+    if features is None:
+        features = columns
+    values = data[features].to_numpy(dtype=np.float64, na_value=np.nan)
+    missing = np.isnan(values)
+    targets = [features.index(column) for column in columns]
+    incomplete = np.flatnonzero(missing[:, targets].any(axis=1))
+    donors = ~missing.any(axis=1)
+    if row_mask is not None:
+        donors &= row_mask.to_numpy()
+    if not len(incomplete) or not donors.any():
+        return
+
+    donor_values = values[donors]
+    mean = donor_values.mean(axis=0)
+    std = donor_values.std(axis=0)
+    std[std == 0] = 1
+    scaled_donors = (donor_values - mean) / std
+    ks = np.minimum(np.broadcast_to(k, len(columns)), len(donor_values))
+    k = int(ks.max())
+    # Columns averaged over the same number of neighbours
+    donor_targets = [(n, ks == n, donor_values[:, targets][:, ks == n])
+                     for n in np.unique(ks)]
+
+    filled = values[:, targets].copy()
+    patterns, groups = np.unique(np.packbits(missing[incomplete], axis=1),
+                                 axis=0, return_inverse=True)
+    order = np.argsort(groups.ravel(), kind="stable")
+    bounds = np.searchsorted(groups.ravel()[order],
+                             np.arange(len(patterns) + 1))
+    for i, pattern in enumerate(patterns):
+        observed = ~np.unpackbits(pattern, count=len(features))\
+            .astype(bool)
+        if not observed.any():
+            continue
+        rows = incomplete[order[bounds[i]:bounds[i + 1]]]
+        tree = KDTree(scaled_donors[:, observed])
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            query = (values[batch][:, observed] - mean[observed]) /\
+                std[observed]
+            _, neighbours = tree.query(query, k=k, workers=workers)
+            neighbours = neighbours.reshape(len(batch), k)
+            means = np.empty((len(batch), len(columns)))
+            for n, selected, targets_n in donor_targets:
+                means[:, selected] = targets_n[neighbours[:, :n]].mean(axis=1)
+            block = filled[batch]
+            filled[batch] = np.where(np.isnan(block), means, block)
+
+    for j, column in enumerate(columns):
+        mask = missing[:, targets[j]]
+        if not mask.any():
+            continue
+        # The column is replaced, so the views of its old values held by
+        # the models keep them
+        dtype = data.dtypes[column]
+        column_values = data[column].to_numpy(
+            dtype=dtype if isinstance(dtype, np.dtype) else np.float64,
+            na_value=np.nan, copy=True)
+        column_values[mask] = filled[mask, j]
+        data.isetitem(data.columns.get_loc(column), column_values)
+        if null_index is not None:
+            null_index.set_column(column, np.isnan(filled[:, j]))
@@ -0,0 +1,74 @@
+import numpy as np
+from pandas import DataFrame, Series, to_numeric
+from pandas.api.types import (is_bool_dtype, is_float_dtype,
+                              is_integer_dtype, is_object_dtype,
+                              is_string_dtype)
+
+
+def optimize_dtypes(data: DataFrame, category_ratio: float = 0.5
+                    ) -> tuple[DataFrame, dict[str, int]]:
+    """
+    Reduces the memory used by a DataFrame after it is loaded.
+
+    Integer columns are downcast to the smallest signed width that holds
+    their values, float columns are stored as float32 when every value is
+    exactly representable, and text columns with few distinct values are
+    turned into categoricals.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        DataFrame to optimize.
+    category_ratio : float, optional
+        Maximum ratio of distinct values to rows for a text column
+        to become categorical.
+
+    Returns
+    ----------
+    tuple[pd.DataFrame, dict[str, int]]
+        Optimized DataFrame and bytes saved in each column.
+    """
+    columns = {}
+    savings = {}
+    for name in data.columns:
+        column = data[name]
+        optimized = _optimize_column(column, category_ratio)
+        columns[name] = optimized
+        if optimized is not column:
+            savings[name] = int(column.memory_usage(index=False, deep=True)
+                                - optimized.memory_usage(index=False,
+                                                         deep=True))
+        else:
+            savings[name] = 0
+
+    optimized = DataFrame(columns, index=data.index, copy=False)
+    return optimized, savings
+
+
+def _optimize_column(column: Series, category_ratio: float) -> Series:
+    """
+    Returns the column with a smaller dtype, or the same column if
+    it cannot be reduced safely.
+    """
+    if is_bool_dtype(column.dtype):
+        return column
+
+    if is_integer_dtype(column.dtype) and isinstance(column.dtype, np.dtype):
+        downcast = to_numeric(column, downcast="integer")
+        return downcast if downcast.dtype != column.dtype else column
+
+    if is_float_dtype(column.dtype) and column.dtype == np.float64:
+        values = column.to_numpy()
+        reduced = values.astype(np.float32)
+        # Only keep float32 if every value survives the round trip
+        if np.array_equal(reduced.astype(np.float64), values, equal_nan=True):
+            return Series(reduced, index=column.index, name=column.name,
+                          copy=False)
+        return column
+
+    if is_object_dtype(column.dtype) or is_string_dtype(column.dtype):
+        if len(column) and\
+                column.nunique(dropna=True) / len(column) <= category_ratio:
+            return column.astype("category")
+
+    return column
@@ -0,0 +1,220 @@
+import numpy as np
+from pandas import DataFrame
+from typing import Iterable, Optional
+from data_processing.row_mask import RowMask
+
+
+class NullIndex():
+    """
+    Packed bitmap of the null values of each column of a DataFrame.
+
+    The bitmaps are built with a single scan when the data is loaded,
+    using one bit per row, and the null count of each column is cached,
+    so counts and any-null queries do not read the data again. The
+    preprocessing methods update the index instead of rescanning: filled
+    columns are cleared and deleted rows are removed from every bitmap.
+    Rows deleted through a `RowMask` stay in the bitmaps, and the counts
+    of the rows kept are found by combining both bitmaps.
+
+    Attributes
+    ----------
+    rows : int
+        Number of rows of the indexed data.
+    _bitmaps : dict[str, np.ndarray]
+        Bits of the null positions of each column, packed by `np.packbits`.
+        Columns without nulls have no bitmap.
+    _counts : dict[str, int]
+        Number of nulls of each column.
+    """
+
+    def __init__(self, rows: int = 0) -> None:
+        """
+        Initializes an empty index.
+
+        Parameters
+        ----------
+        rows : int, optional
+            Number of rows of the indexed data.
+        """
+        self.rows = rows
+        self._bitmaps = {}
+        self._counts = {}
+
+    @classmethod
+    def from_dataframe(cls, data: DataFrame,
+                       block_cells: int = 1 << 24) -> "NullIndex":
+        """
+        Builds the index of every column of a DataFrame.
+
+        The columns are scanned in blocks of about `block_cells` cells,
+        each with a single vectorized `isna` and `np.packbits`.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Data to index.
+        block_cells : int, optional
+            Maximum number of cells scanned at once.
+
+        Returns
+        ----------
+        NullIndex
+            Index of the nulls of `data`.
+        """
+        index = cls(len(data))
+        width = max(1, block_cells // max(len(data), 1))
+        for start in range(0, data.shape[1], width):
+            block = data.iloc[:, start:start + width]
+            mask = block.isna().to_numpy()
+            counts = np.count_nonzero(mask, axis=0)
+            bitmaps = np.packbits(mask.T, axis=1)
+            for name, count, bitmap in zip(block.columns, counts, bitmaps):
+                index._counts[name] = int(count)
+                if count:
+                    index._bitmaps[name] = bitmap.copy()
+                else:
+                    index._bitmaps.pop(name, None)
+        return index
+
+    def set_column(self, name: str, mask: np.ndarray) -> None:
+        """
+        Stores the nulls of a column.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+        mask : np.ndarray
+            Boolean array, True where the column is null.
+        """
+        count = int(np.count_nonzero(mask))
+        self._counts[name] = count
+        if count:
+            self._bitmaps[name] = np.packbits(mask)
+        else:
+            self._bitmaps.pop(name, None)
+
+    def count(self, name: str, row_mask: Optional[RowMask] = None) -> int:
+        """
+        Returns the number of nulls of a column, only in the rows kept by
+        `row_mask` if it is given.
+        """
+        if row_mask is None or row_mask.all:
+            return self._counts[name]
+        if name not in self._bitmaps:
+            return 0
+        return int(np.count_nonzero(np.unpackbits(
+            self._bitmaps[name] & row_mask.bits)))
+
+    def counts(self, columns: Iterable[str],
+               row_mask: Optional[RowMask] = None) -> list[int]:
+        """
+        Returns the number of nulls of each column.
+        """
+        return [self.count(name, row_mask) for name in columns]
+
+    def has_nulls(self, name: str,
+                  row_mask: Optional[RowMask] = None) -> bool:
+        """
+        Returns whether a column has null values.
+        """
+        return self.count(name, row_mask) > 0
+
+    def any(self, columns: Iterable[str],
+            row_mask: Optional[RowMask] = None) -> bool:
+        """
+        Returns whether any of the columns has null values.
+        """
+        return any(self.count(name, row_mask) for name in columns)
+
+    def null_columns(self, columns: Iterable[str],
+                     row_mask: Optional[RowMask] = None) -> list[str]:
+        """
+        Returns the columns with null values, in order and without
+        duplicates.
+        """
+        return list(dict.fromkeys(name for name in columns
+                                  if self.count(name, row_mask)))
+
+    def mask(self, name: str) -> np.ndarray:
+        """
+        Returns the null positions of a column.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column.
+
+        Returns
+        ----------
+        np.ndarray
+            Boolean array, True where the column is null.
+        """
+        if name not in self._bitmaps:
+            return np.zeros(self.rows, dtype=bool)
+        return np.unpackbits(self._bitmaps[name], count=self.rows)\
+            .astype(bool)
+
+    def masks(self, columns: list[str]) -> np.ndarray:
+        """
+        Returns the null positions of several columns.
+
+        Parameters
+        ----------
+        columns : list[str]
+            Names of the columns.
+
+        Returns
+        ----------
+        np.ndarray
+            2D boolean array with a row per column, True where it is null.
+        """
+        bitmaps = np.zeros((len(columns), (self.rows + 7) // 8),
+                           dtype=np.uint8)
+        for i, name in enumerate(columns):
+            if name in self._bitmaps:
+                bitmaps[i] = self._bitmaps[name]
+        return np.unpackbits(bitmaps, axis=1, count=self.rows).view(bool)
+
+    def rows_with_nulls(self, columns: Iterable[str]) -> np.ndarray:
+        """
+        Returns the rows with a null value in any of the columns.
+        """
+        rows = np.zeros((self.rows + 7) // 8, dtype=np.uint8)
+        for name in columns:
+            if name in self._bitmaps:
+                rows |= self._bitmaps[name]
+        return np.unpackbits(rows, count=self.rows).astype(bool)
+
+    def clear(self, columns: Iterable[str]) -> None:
+        """
+        Marks columns as having no nulls, once they are filled.
+        """
+        for name in columns:
+            self._bitmaps.pop(name, None)
+            self._counts[name] = 0
+
+    def delete_rows(self, columns: Iterable[str]) -> np.ndarray:
+        """
+        Removes the rows with a null value in any of the columns, as
+        `DataFrame.dropna(subset=columns)` does.
+
+        Parameters
+        ----------
+        columns : Iterable[str]
+            Columns whose nulls delete their rows.
+
+        Returns
+        ----------
+        np.ndarray
+            Boolean array, True for the rows that are kept.
+        """
+        keep = ~self.rows_with_nulls(columns)
+        if keep.all():
+            return keep
+        self.rows = int(np.count_nonzero(keep))
+        for name in list(self._bitmaps):
+            mask = np.unpackbits(self._bitmaps[name],
+                                 count=len(keep)).astype(bool)
+            self.set_column(name, mask[keep])
+        return keep
@@ -0,0 +1,300 @@
+import numpy as np
+from pandas import DataFrame
+from pandas.api.types import is_numeric_dtype
+from typing import Iterable, Optional
+import warnings
+from data_processing.quantile_sketch import QuantileSketch
+from data_processing.row_mask import RowMask
+
+# Default threshold of each method
+OUTLIER_METHODS = {"zscore": 3.0, "iqr": 1.5, "mad": 3.5}
+
+# Ratio of the MAD to the standard deviation of a normal distribution
+MAD_SCALE = 0.6745
+
+
+class OutlierDetector():
+    """
+    Finds the rows with extreme values in some columns.
+
+    A value is an outlier if it is outside the bounds of its column:
+
+    - "zscore": more than `threshold` standard deviations from the mean.
+    - "iqr": more than `threshold` interquartile ranges below the first
+      quartile or above the third.
+    - "mad": a modified z-score, `0.6745 * (x - median) / MAD`, above
+      `threshold` in absolute value.
+
+    The bounds are fitted in one vectorized pass over the columns, or on
+    a stream of batches, merging the count, mean and sum of squared
+    deviations of each batch for the z-score (Chan's update, which does
+    not lose precision on columns with a large offset) and a
+    `QuantileSketch` per column for the quantiles. Columns without spread have no
+    outliers, and nulls are never outliers.
+
+    Attributes
+    ----------
+    method : str
+        "zscore", "iqr" or "mad".
+    threshold : float
+        Distance from which a value is an outlier, in the units of the
+        method.
+    error : float
+        Rank error of the quantiles fitted on a stream.
+    bounds : dict[str, tuple[float, float]]
+        Lowest and highest value that is not an outlier, for each column.
+    """
+
+    def __init__(self, method: str = "iqr", threshold: Optional[float] = None,
+                 error: float = 0.001) -> None:
+        """
+        Initializes a detector that is not fitted yet.
+
+        Parameters
+        ----------
+        method : str, optional
+            "zscore", "iqr" or "mad".
+        threshold : float, optional
+            Distance from which a value is an outlier. By default, 3 for
+            "zscore", 1.5 for "iqr" and 3.5 for "mad".
+        error : float, optional
+            Rank error of the quantiles fitted on a stream.
+
+        Raises
+        ------
+        ValueError
+            If the method is not valid or the threshold is not positive.
+        """
+        if method not in OUTLIER_METHODS:
+            raise ValueError(f"Método de valores atípicos no válido: "
+                             f"{method}")
+        if threshold is None:
+            threshold = OUTLIER_METHODS[method]
+        if not threshold > 0:
+            raise ValueError("El umbral debe ser un número positivo")
+        self.method = method
+        self.threshold = float(threshold)
+        self.error = error
+        self.bounds = {}
+
+    def fit(self, data: DataFrame, columns: list[str],
+            row_mask: Optional[RowMask] = None) -> "OutlierDetector":
+        """
+        Fits the bounds of some columns in one vectorized pass.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Data the bounds are fitted on.
+        columns : list[str]
+            Numeric columns to fit.
+        row_mask : RowMask, optional
+            Rows of `data` used, by default every row.
+
+        Returns
+        ----------
+        OutlierDetector
+            The detector itself.
+        """
+        values = _values(data, columns)
+        if row_mask is not None:
+            values = row_mask.select(values)
+        with warnings.catch_warnings():
+            # Columns without values have no bounds
+            warnings.simplefilter("ignore", RuntimeWarning)
+            if self.method == "zscore":
+                center = np.nanmean(values, axis=0)
+                spread = np.nanstd(values, axis=0)
+            elif self.method == "iqr":
+                q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+                center, spread = (q1, q3), q3 - q1
+            else:
+                center = np.nanmedian(values, axis=0)
+                spread = np.nanmedian(np.abs(values - center), axis=0)
+        self.bounds = dict(zip(columns, self._bounds(center, spread)))
+        return self
+
+    def fit_batches(self, batches: Iterable[DataFrame],
+                    columns: list[str]) -> "OutlierDetector":
+        """
+        Fits the bounds of some columns in a single pass over a stream.
+
+        Parameters
+        ----------
+        batches : Iterable[DataFrame]
+            Batches of rows with the columns.
+        columns : list[str]
+            Numeric columns to fit.
+
+        Returns
+        ----------
+        OutlierDetector
+            The detector itself.
+        """
+        counts = np.zeros(len(columns))
+        means = np.zeros(len(columns))
+        deviations = np.zeros(len(columns))
+        sketches = [QuantileSketch(self.error) for _ in columns]
+        for batch in batches:
+            values = _values(batch, columns)
+            if self.method == "zscore":
+                counts, means, deviations = _merge_moments(
+                    counts, means, deviations, values)
+            else:
+                for sketch, column_values in zip(sketches, values.T):
+                    sketch.update(column_values)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if self.method == "zscore":
+                center = np.where(counts > 0, means, np.nan)
+                spread = np.sqrt(deviations / counts)
+            elif self.method == "iqr":
+                q1, q3 = np.array([sketch.quantiles([0.25, 0.75])
+                                   for sketch in sketches]).T
+                center, spread = (q1, q3), q3 - q1
+            else:
+                center = np.array([sketch.quantile(0.5)
+                                   for sketch in sketches])
+                spread = np.array([_sketch_mad(sketch, median)
+                                   for sketch, median
+                                   in zip(sketches, center)])
+        self.bounds = dict(zip(columns, self._bounds(center, spread)))
+        return self
+
+    def detect(self, data: DataFrame, row_mask: Optional[RowMask] = None
+               ) -> tuple[np.ndarray, dict[str, int]]:
+        """
+        Finds the outliers of the fitted columns.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Data to check.
+        row_mask : RowMask, optional
+            Rows of `data` checked, by default every row.
+
+        Returns
+        ----------
+        tuple[np.ndarray, dict[str, int]]
+            Boolean array, True for the rows with an outlier in any
+            column, and the number of rows each column flagged.
+
+        Raises
+        ------
+        ValueError
+            If the detector is not fitted.
+        """
+        if not self.bounds:
+            raise ValueError("El detector de valores atípicos no está "
+                             "ajustado")
+        columns = list(self.bounds)
+        values = _values(data, columns)
+        low, high = np.array([self.bounds[column]
+                              for column in columns]).T
+        with np.errstate(invalid="ignore"):
+            flagged = (values < low) | (values > high)
+        if row_mask is not None:
+            flagged &= row_mask.to_numpy()[:, np.newaxis]
+        counts = np.count_nonzero(flagged, axis=0)
+        return flagged.any(axis=1), dict(zip(columns, counts.tolist()))
+
+    def _bounds(self, center, spread: np.ndarray) -> list[tuple]:
+        """
+        Returns the bounds of each column from its center and spread.
+        """
+        if self.method == "iqr":
+            low = center[0] - self.threshold * spread
+            high = center[1] + self.threshold * spread
+        else:
+            if self.method == "mad":
+                spread = spread / MAD_SCALE
+            low = center - self.threshold * spread
+            high = center + self.threshold * spread
+        # Columns without spread or values have no outliers
+        constant = ~(spread > 0)
+        low = np.where(constant, -np.inf, low)
+        high = np.where(constant, np.inf, high)
+        return list(zip(low.tolist(), high.tolist()))
+
+
+def find_outliers(data: DataFrame, columns: list[str], method: str = "iqr",
+                  threshold: Optional[float] = None,
+                  row_mask: Optional[RowMask] = None
+                  ) -> tuple[np.ndarray, dict[str, int]]:
+    """
+    Fits an `OutlierDetector` on some columns and finds their outliers.
+
+    Parameters
+    ----------
+    data : DataFrame
+        Data to check.
+    columns : list[str]
+        Numeric columns to check.
+    method : str, optional
+        "zscore", "iqr" or "mad".
+    threshold : float, optional
+        Distance from which a value is an outlier.
+    row_mask : RowMask, optional
+        Rows of `data` used, by default every row.
+
+    Returns
+    ----------
+    tuple[np.ndarray, dict[str, int]]
+        Rows with an outlier and the number of rows each column flagged.
+    """
+    detector = OutlierDetector(method, threshold).fit(data, columns,
+                                                      row_mask)
+    return detector.detect(data, row_mask)
+
+
+def _values(data: DataFrame, columns: list[str]) -> np.ndarray:
+    """
+    Returns the values of numeric columns as a 2D float array.
+    """
+    dtypes = data.dtypes
+    for column in columns:
+        if not is_numeric_dtype(dtypes[column]):
+            raise TypeError(f"La columna '{column}' no es numérica")
+    return data[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _merge_moments(counts: np.ndarray, means: np.ndarray,
+                   deviations: np.ndarray, values: np.ndarray
+                   ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Merges the count, mean and sum of squared deviations of each column
+    of a batch into the ones accumulated, ignoring the nulls.
+    """
+    batch_counts = np.count_nonzero(~np.isnan(values), axis=0)
+    with warnings.catch_warnings():
+        # Columns without values in the batch are not merged
+        warnings.simplefilter("ignore", RuntimeWarning)
+        batch_means = np.nan_to_num(np.nanmean(values, axis=0))
+    batch_deviations = np.nansum((values - batch_means) ** 2, axis=0)
+    total = counts + batch_counts
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = np.where(total > 0, batch_counts / total, 0.0)
+    delta = batch_means - means
+    means = means + delta * weight
+    deviations = deviations + batch_deviations +\
+        delta ** 2 * counts * weight
+    return total, means, deviations
+
+
+def _sketch_mad(sketch: QuantileSketch, median: float) -> float:
+    """
+    Returns the median absolute deviation of the values of a sketch.
+
+    The MAD is the distance `d` such that half of the values are within
+    `median +- d`, found by bisection on the ranks of the sketch.
+    """
+    if not sketch.count:
+        return np.nan
+    low, high = 0.0, max(sketch.max - median, median - sketch.min)
+    for _ in range(64):
+        middle = (low + high) / 2
+        if sketch.rank(median + middle) - sketch.rank(median - middle) < 0.5:
+            low = middle
+        else:
+            high = middle
+    return high
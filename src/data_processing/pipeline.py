@@ -0,0 +1,705 @@
+import numpy as np
+from pandas import DataFrame
+from pandas.api.types import is_numeric_dtype
+from typing import Iterable, Iterator, Optional, Union
+import copy
+import warnings
+from data_processing.import_module import ProgressCallback, iter_file_batches
+from data_processing.knn_imputer import knn_impute
+from data_processing.null_index import NullIndex
+from data_processing.row_mask import RowMask
+from data_processing.quantile_sketch import QuantileSketch
+
+Strategy = Union[str, tuple[str, float]]
+
+STRATEGIES = ("delete", "mean", "median", "constant", "quantile", "knn")
+
+
+class PreprocessPipeline():
+    """
+    Serializable sequence of preprocessing steps.
+
+    Each step gives a strategy to some columns: "delete", "mean", "median",
+    ("quantile", q), ("constant", value) or ("knn", k). Fitting a step
+    computes the value used to fill each column, and transforming applies
+    the fitted steps in order, so the same cleanup can be replayed on new
+    files, on batches of a file or on the inputs of a prediction.
+
+    The "knn" columns are filled from the nearest rows of the data being
+    transformed, by `knn_impute`. Their fitted value is the mean of the
+    column, which fills the rows without neighbours, as a single input
+    of a prediction.
+
+    Attributes
+    ----------
+    steps : list[dict]
+        Steps in order, each a dict with the "strategies" of its columns
+        and the "fills" fitted for them (None until the step is fitted).
+    """
+
+    def __init__(self, steps: Optional[list[dict]] = None) -> None:
+        """
+        Initializes a pipeline.
+
+        Parameters
+        ----------
+        steps : list[dict], optional
+            Steps of the pipeline, as in `steps`.
+        """
+        self.steps = [] if steps is None else steps
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    @property
+    def is_fitted(self) -> bool:
+        """
+        Gets whether every step has its fill values.
+        """
+        return all(step["fills"] is not None for step in self.steps)
+
+    @property
+    def fills(self) -> dict[str, float]:
+        """
+        Gets the value that fills the nulls of each column.
+
+        A column filled by several steps only keeps the first value, as
+        it has no nulls left for the later steps.
+
+        Returns
+        ----------
+        dict[str, float]
+            Fitted fill value of each column.
+        """
+        fills = {}
+        for step in self.steps:
+            for column, value in (step["fills"] or {}).items():
+                fills.setdefault(column, value)
+        return fills
+
+    def add_step(self, strategies: dict[str, Strategy]) -> dict:
+        """
+        Appends a step that is not fitted yet.
+
+        Parameters
+        ----------
+        strategies : dict[str, str | tuple[str, float]]
+            Strategy of each column of the step.
+
+        Returns
+        ----------
+        dict
+            The new step.
+
+        Raises
+        ------
+        ValueError
+            If a strategy is not valid or its constant is not a number.
+        """
+        step = {"strategies": {column: parse_strategy(strategy)
+                               for column, strategy in strategies.items()},
+                "fills": None}
+        self.steps.append(step)
+        return step
+
+    def fit(self, data: DataFrame) -> "PreprocessPipeline":
+        """
+        Fits every step on a DataFrame.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Data the statistics are computed on.
+
+        Returns
+        ----------
+        PreprocessPipeline
+            The pipeline itself.
+        """
+        return self.fit_batches([data])
+
+    def fit_batches(self, batches: Iterable[DataFrame],
+                    error: float = 0.001) -> "PreprocessPipeline":
+        """
+        Fits every step in a single pass over a stream of batches.
+
+        Each batch is followed through the steps: the rows deleted by a
+        step are left out of the statistics of the next ones, and columns
+        already filled by a step are not changed by the next ones. Means
+        are accumulated as sums and counts, and medians and quantiles in
+        a `QuantileSketch` per column, so the memory does not grow with
+        the stream.
+
+        Parameters
+        ----------
+        batches : Iterable[DataFrame]
+            Batches of rows with the same columns.
+        error : float, optional
+            Rank error of the medians and quantiles. They are exact while
+            a column has fewer values than the sketch keeps.
+
+        Returns
+        ----------
+        PreprocessPipeline
+            The pipeline itself.
+        """
+        sums = [{} for _ in self.steps]
+        counts = [{} for _ in self.steps]
+        sketches = [{} for _ in self.steps]
+        for batch in batches:
+            kept = np.ones(len(batch), dtype=bool)
+            filled = set()
+            for i, step in enumerate(self.steps):
+                strategies = {column: strategy for column, strategy
+                              in step["strategies"].items()
+                              if column not in filled}
+                for column, (name, _) in strategies.items():
+                    if name == "delete":
+                        kept &= batch[column].notna().to_numpy()
+                for column, (name, _) in strategies.items():
+                    if name in ("mean", "knn"):
+                        column_values = _numeric_values(batch, column)[kept]
+                        column_values = column_values[
+                            ~np.isnan(column_values)]
+                        sums[i][column] = sums[i].get(column, 0.0) +\
+                            float(column_values.sum(dtype=np.float64))
+                        counts[i][column] = counts[i].get(column, 0) +\
+                            len(column_values)
+                    elif name in ("median", "quantile"):
+                        if column not in sketches[i]:
+                            sketches[i][column] = QuantileSketch(error)
+                        sketches[i][column].update(
+                            _numeric_values(batch, column)[kept])
+                    if name != "delete":
+                        filled.add(column)
+
+        for i, step in enumerate(self.steps):
+            fills = {}
+            for column, (name, value) in step["strategies"].items():
+                if name == "constant":
+                    fills[column] = value
+                elif name in ("mean", "knn"):
+                    count = counts[i].get(column, 0)
+                    fills[column] = sums[i][column] / count if count\
+                        else np.nan
+                elif name in ("median", "quantile"):
+                    sketch = sketches[i].get(column)
+                    fills[column] = np.nan if sketch is None else\
+                        sketch.quantile(_quantile(name, value))
+            step["fills"] = fills
+        return self
+
+    def fit_file(self, file_path: str, chunksize: int = 100_000,
+                 error: float = 0.001,
+                 progress_callback: Optional[ProgressCallback] = None,
+                 **options) -> "PreprocessPipeline":
+        """
+        Fits every step on a file that may not fit in memory.
+
+        The file is streamed once by `iter_file_batches`, reading only the
+        columns of the steps.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the file, or the files of a dataset.
+        chunksize : int, optional
+            Number of rows read per batch.
+        error : float, optional
+            Rank error of the medians and quantiles.
+        progress_callback : callable, optional
+            Receives the progress after every batch, as in `load_file`.
+        **options
+            Options of `load_file` (table, sheet...).
+
+        Returns
+        ----------
+        PreprocessPipeline
+            The pipeline itself.
+        """
+        columns = list(dict.fromkeys(
+            column for step in self.steps for column in step["strategies"]))
+        batches = iter_file_batches(file_path, chunksize, progress_callback,
+                                    columns=columns, **options)
+        return self.fit_batches(batches, error)
+
+    def fit_step(self, data: DataFrame, strategies: dict[str, Strategy],
+                 null_index: Optional[NullIndex] = None,
+                 row_mask: Optional[RowMask] = None) -> dict:
+        """
+        Appends a step, fits it on a DataFrame and applies it in place.
+
+        Rows with nulls in the "delete" columns are removed first, so the
+        statistics are computed on the rows that are kept. The other
+        columns are grouped by dtype and each group is copied once to a
+        2D block, on which the statistics are computed in one vectorized
+        pass. The same block is then filled at the null positions of the
+        index and replaces the columns with nulls. The "knn" columns are
+        filled before the rest, so their neighbours are found on the
+        values of the data and not on the filled ones.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Data the step is fitted on and applied to.
+        strategies : dict[str, str | tuple[str, float]]
+            Strategy of each column of the step.
+        null_index : NullIndex, optional
+            Index of the nulls of `data`, updated with the changes.
+        row_mask : RowMask, optional
+            Rows kept of `data`. If given, rows are deleted from the mask
+            instead of from the data, and the statistics only use the
+            rows kept.
+
+        Returns
+        ----------
+        dict
+            The new step, fitted.
+
+        Raises
+        ------
+        ValueError
+            If a strategy is not valid or its constant is not a number.
+        TypeError
+            If a statistic of a non-numeric column is requested.
+        """
+        strategies = {column: parse_strategy(strategy)
+                      for column, strategy in strategies.items()}
+        _check_numeric(data, [column for column, (name, _)
+                              in strategies.items() if name != "delete"])
+        _delete_rows(data, [column for column, (name, _)
+                            in strategies.items() if name == "delete"],
+                     null_index, row_mask)
+
+        fills = {}
+        dtypes = data.dtypes
+        groups = {}
+        for column, (name, value) in strategies.items():
+            if name == "constant":
+                fills[column] = value
+                # Constants only need the columns with nulls
+                if null_index is not None and\
+                        not null_index.has_nulls(column):
+                    continue
+            if name != "delete":
+                groups.setdefault(dtypes[column], []).append(column)
+        blocks = []
+        for columns in groups.values():
+            block = data[columns].to_numpy(copy=True)
+            fitted = [j for j, column in enumerate(columns)
+                      if strategies[column][0] != "constant"]
+            if fitted:
+                values = block if len(fitted) == len(columns)\
+                    else block[:, fitted]
+                if row_mask is not None:
+                    values = row_mask.select(values)
+                fills.update(zip([columns[j] for j in fitted], _statistics(
+                    values, [strategies[columns[j]] for j in fitted])))
+            blocks.append((columns, block))
+
+        step = {"strategies": strategies, "fills": fills}
+        self.steps.append(step)
+        _knn_fill(data, strategies, null_index, row_mask)
+        knn = [column for column, (name, _) in strategies.items()
+               if name == "knn"]
+        _fill_nulls(data, {column: fills[column] for column in knn},
+                    null_index)
+        # The blocks hold the "knn" columns before `_knn_fill`
+        fills = {column: value for column, value in fills.items()
+                 if column not in knn}
+        for columns, block in blocks:
+            _fill_block(data, columns, block, fills, null_index)
+        return step
+
+    def transform(self, data: DataFrame, inplace: bool = False,
+                  null_index: Optional[NullIndex] = None
+                  ) -> Optional[DataFrame]:
+        """
+        Applies the fitted steps to a DataFrame.
+
+        Columns of the steps that are not in the data are skipped, so
+        the pipeline can be applied to the inputs of a model.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Data to transform.
+        inplace : bool, optional
+            Whether to modify `data` instead of a copy.
+        null_index : NullIndex, optional
+            Index of the nulls of `data`, updated with the changes.
+
+        Returns
+        ----------
+        DataFrame or None
+            Transformed data, or None if `inplace` is True.
+
+        Raises
+        ------
+        ValueError
+            If the pipeline is not fitted.
+        """
+        if not self.is_fitted:
+            raise ValueError("El preprocesado no está ajustado")
+        if not inplace:
+            data = data.copy()
+        for step in self.steps:
+            apply_step(data, step, null_index)
+        return None if inplace else data
+
+    def transform_batches(self, batches: Iterable[DataFrame]
+                          ) -> Iterator[DataFrame]:
+        """
+        Applies the fitted steps to a stream of batches.
+
+        Parameters
+        ----------
+        batches : Iterable[DataFrame]
+            Batches of rows to transform.
+
+        Yields
+        ----------
+        DataFrame
+            Each batch, transformed.
+        """
+        for batch in batches:
+            yield self.transform(batch)
+
+    def copy(self) -> "PreprocessPipeline":
+        """
+        Returns a copy of the pipeline that does not share its steps.
+        """
+        return PreprocessPipeline(copy.deepcopy(self.steps))
+
+    def to_dict(self) -> dict:
+        """
+        Converts the pipeline to a dict of plain Python types.
+
+        Returns
+        ----------
+        dict
+            Steps of the pipeline, with the strategies as lists.
+        """
+        return {"steps": [
+            {"strategies": {column: [name, value] for column, (name, value)
+                            in step["strategies"].items()},
+             "fills": None if step["fills"] is None else
+             {column: float(value) for column, value
+              in step["fills"].items()}}
+            for step in self.steps]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PreprocessPipeline":
+        """
+        Builds a pipeline from the output of `to_dict`.
+
+        Parameters
+        ----------
+        data : dict
+            Steps of the pipeline.
+
+        Returns
+        ----------
+        PreprocessPipeline
+            The rebuilt pipeline.
+        """
+        steps = []
+        for step in data["steps"]:
+            steps.append({
+                "strategies": {column: parse_strategy(tuple(strategy))
+                               for column, strategy
+                               in step["strategies"].items()},
+                "fills": None if step["fills"] is None
+                else dict(step["fills"])})
+        return cls(steps)
+
+
+def apply_step(data: DataFrame, step: dict,
+               null_index: Optional[NullIndex] = None,
+               row_mask: Optional[RowMask] = None) -> None:
+    """
+    Applies a fitted step in place.
+
+    Columns of the step that are not in the data are skipped.
+
+    Parameters
+    ----------
+    data : DataFrame
+        Data to transform.
+    step : dict
+        Fitted step of a `PreprocessPipeline`.
+    null_index : NullIndex, optional
+        Index of the nulls of `data`, updated with the changes.
+    row_mask : RowMask, optional
+        Rows kept of `data`. If given, rows are deleted from the mask
+        instead of from the data.
+    """
+    present = [column for column in step["strategies"]
+               if column in data.columns]
+    _delete_rows(data, [column for column in present
+                        if step["strategies"][column][0] == "delete"],
+                 null_index, row_mask)
+    _knn_fill(data, {column: step["strategies"][column]
+                     for column in present}, null_index, row_mask)
+    _fill_nulls(data, {column: step["fills"][column] for column in present
+                       if column in step["fills"]}, null_index)
+
+
+def parse_strategy(strategy: Strategy) -> tuple[str, Optional[float]]:
+    """
+    Splits a strategy into its name and its constant.
+
+    Parameters
+    ----------
+    strategy : str or tuple[str, float]
+        "delete", "mean", "median", ("quantile", q), ("constant",
+        value) or ("knn", k). A tuple of a name and None is also accepted
+        for the strategies without a value.
+
+    Returns
+    ----------
+    tuple[str, float]
+        Name of the strategy and its value, None if it has none.
+
+    Raises
+    ------
+    ValueError
+        If the strategy is not valid, its value is not a number, the
+        quantile is not between 0 and 1 or the number of neighbours is not
+        a positive integer.
+    """
+    if isinstance(strategy, tuple):
+        if len(strategy) != 2 or strategy[0] not in STRATEGIES:
+            raise ValueError(f"Estrategia no válida: {strategy}")
+        name, value = strategy
+        if name == "knn":
+            try:
+                k = float(value)
+            except (ValueError, TypeError):
+                k = 0.0
+            if not k.is_integer() or k < 1:
+                raise ValueError("El número de vecinos debe ser un entero "
+                                 "positivo")
+            return name, int(k)
+        if name not in ("constant", "quantile"):
+            if value is not None:
+                raise ValueError(f"Estrategia no válida: {strategy}")
+            return name, None
+        try:
+            value = float(value)
+        except (ValueError, TypeError):
+            raise ValueError(f"No se puede convertir '{value}' a un "
+                             f"número decimal")
+        if name == "quantile" and not 0 <= value <= 1:
+            raise ValueError("El cuantil debe estar entre 0 y 1")
+        return name, value
+    if strategy not in STRATEGIES or\
+            strategy in ("constant", "quantile", "knn"):
+        raise ValueError(f"Estrategia no válida: {strategy}")
+    return strategy, None
+
+
+def _quantile(name: str, value: Optional[float]) -> float:
+    """
+    Returns the quantile computed by a "median" or "quantile" strategy.
+    """
+    return 0.5 if name == "median" else value
+
+
+def _check_numeric(data: DataFrame, columns: list[str]) -> None:
+    """
+    Raises a TypeError if any of the columns is not numeric.
+    """
+    dtypes = data.dtypes
+    for column in columns:
+        if not is_numeric_dtype(dtypes[column]):
+            raise TypeError(f"La columna '{column}' no es numérica")
+
+
+def _numeric_values(data: DataFrame, column: str) -> np.ndarray:
+    """
+    Returns the values of a column as floats, with NaN for the nulls.
+    """
+    _check_numeric(data, [column])
+    return data[column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _delete_rows(data: DataFrame, columns: list[str],
+                 null_index: Optional[NullIndex],
+                 row_mask: Optional[RowMask] = None) -> None:
+    """
+    Removes in place the rows with nulls in any of the columns, from the
+    mask if it is given and from the data otherwise.
+    """
+    if not columns:
+        return
+    if row_mask is not None:
+        row_mask.delete(null_index.rows_with_nulls(columns)
+                        if null_index is not None else
+                        data[columns].isna().any(axis=1).to_numpy())
+        return
+    data.dropna(subset=columns, inplace=True)
+    if null_index is not None:
+        null_index.delete_rows(columns)
+
+
+def _knn_fill(data: DataFrame, strategies: dict[str, tuple],
+              null_index: Optional[NullIndex],
+              row_mask: Optional[RowMask] = None) -> None:
+    """
+    Fills in place the "knn" columns of a step, measuring the distances on
+    the numeric columns of the step. The columns are filled together, so
+    the neighbours of every `k` come from the same trees.
+    """
+    knn = {column: value for column, (name, value) in strategies.items()
+           if name == "knn"}
+    if not knn:
+        return
+    dtypes = data.dtypes
+    features = [column for column in strategies
+                if is_numeric_dtype(dtypes[column])]
+    knn_impute(data, list(knn), list(knn.values()), features, null_index,
+               row_mask)
+
+
+def replace_columns(data: DataFrame, columns: list[str],
+                    values: np.ndarray) -> None:
+    """
+    Replaces some columns of a DataFrame with new arrays.
+
+    The arrays of the old columns are not written, so the views of them
+    held by the models and by other DataFrames keep their values.
+
+    Parameters
+    ----------
+    data : DataFrame
+        Data to modify.
+    columns : list[str]
+        Columns to replace.
+    values : np.ndarray
+        2D array with the new values, a column per column.
+    """
+    data.isetitem([data.columns.get_loc(column) for column in columns],
+                  values)
+
+
+def _statistics(values: np.ndarray,
+                strategies: list[tuple[str, Optional[float]]]) -> np.ndarray:
+    """
+    Computes the mean, median or quantile of each column of a 2D block.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        2D array with the values of the columns, NaN for the nulls.
+    strategies : list[tuple[str, float]]
+        Strategy of each column, as returned by `parse_strategy`.
+
+    Returns
+    ----------
+    np.ndarray
+        Statistic of each column, NaN for columns without values.
+    """
+    names = np.array([name for name, _ in strategies])
+    statistics = np.full(len(names), np.nan)
+    with warnings.catch_warnings():
+        # Columns without values keep their nulls, as with pandas
+        warnings.simplefilter("ignore", RuntimeWarning)
+        # The rows without neighbours of "knn" columns get their mean
+        selected = (names == "mean") | (names == "knn")
+        if selected.any():
+            selection = values if selected.all() else values[:, selected]
+            # Summed in place of `np.nanmean`, which copies the values
+            valid = ~np.isnan(selection)
+            statistics[selected] = np.sum(
+                selection, axis=0, where=valid, dtype=np.float64) /\
+                np.count_nonzero(valid, axis=0)
+        selected = names == "median"
+        if selected.all():
+            statistics[:] = np.nanmedian(values, axis=0)
+        elif selected.any():
+            statistics[selected] = np.nanmedian(values[:, selected], axis=0)
+        # Columns with the same quantile are computed together
+        qs = np.array([value if name == "quantile" else np.nan
+                       for name, value in strategies])
+        for q in np.unique(qs[names == "quantile"]):
+            selected = qs == q
+            statistics[selected] = np.nanquantile(values[:, selected], q,
+                                                  axis=0)
+    return statistics
+
+
+def _fill_nulls(data: DataFrame, fills: dict[str, float],
+                null_index: Optional[NullIndex]) -> None:
+    """
+    Fills in place the nulls of numeric columns with fitted values.
+
+    The columns are grouped by dtype, and each group is copied once to a
+    2D block and filled by `_fill_block`.
+
+    Parameters
+    ----------
+    data : DataFrame
+        Data to fill.
+    fills : dict[str, float]
+        Value that fills the nulls of each column.
+    null_index : NullIndex, optional
+        Index of the nulls of `data`, updated with the changes.
+    """
+    _check_numeric(data, list(fills))
+    dtypes = data.dtypes
+    groups = {}
+    for column in fills:
+        # The index tells which columns have nulls without reading them
+        if null_index is None or null_index.has_nulls(column):
+            groups.setdefault(dtypes[column], []).append(column)
+    for columns in groups.values():
+        _fill_block(data, columns, data[columns].to_numpy(copy=True), fills,
+                    null_index)
+
+
+def _fill_block(data: DataFrame, columns: list[str], block: np.ndarray,
+                fills: dict[str, float],
+                null_index: Optional[NullIndex]) -> None:
+    """
+    Fills the nulls of a 2D block and replaces the columns filled.
+
+    Only the null positions are written, taken from the index if there is
+    one, and the columns are replaced in a single assignment.
+
+    Parameters
+    ----------
+    data : DataFrame
+        Data to fill.
+    columns : list[str]
+        Column of `data` of each column of `block`.
+    block : np.ndarray
+        Copy of the values of the columns, written in place.
+    fills : dict[str, float]
+        Value that fills the nulls of each column. The columns without a
+        value, or with NaN, are not filled.
+    null_index : NullIndex, optional
+        Index of the nulls of `data`, updated with the changes.
+    """
+    fill_values = np.array([fills.get(column, np.nan) for column in columns],
+                           dtype=np.float64)
+    # Columns without values to compute a statistic keep nulls
+    selected = ~np.isnan(fill_values)
+    if null_index is not None:
+        selected &= [null_index.has_nulls(column) for column in columns]
+        mask = np.zeros(block.shape[::-1], dtype=bool)
+        mask[selected] = null_index.masks(
+            [column for column, chosen in zip(columns, selected) if chosen])
+        mask = mask.T
+    else:
+        mask = np.isnan(block) & selected
+    selected &= mask.any(axis=0)
+    if not selected.any():
+        return
+    np.copyto(block, fill_values.astype(block.dtype), where=mask)
+    filled = np.flatnonzero(selected)
+    replace_columns(data, [columns[j] for j in filled],
+                    block if len(filled) == len(columns)
+                    else block[:, filled])
+    if null_index is not None:
+        null_index.clear([columns[j] for j in filled])
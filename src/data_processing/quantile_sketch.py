@@ -0,0 +1,218 @@
+import numpy as np
+from typing import Iterable, Union
+import math
+
+
+class QuantileSketch():
+    """
+    Mergeable sketch of the quantiles of a stream of numbers.
+
+    Follows the KLL sketch: values are kept in a stack of compactors,
+    where an item of level `h` stands for `2 ** h` values of the stream.
+    When a level holds more items than its capacity it is sorted and
+    every other item, starting at a random offset, is promoted to the
+    next level. Capacities shrink by 2/3 from the top level down, so the
+    memory is bounded by about `3 * k` items whatever the stream length,
+    and the rank of a returned quantile is within `error` of the asked
+    one with high probability.
+
+    Sketches built on different parts of a stream can be merged, and the
+    merged sketch has the error of a sketch built on the whole stream.
+    The count, minimum and maximum are always exact, and so are the
+    quantiles while no level has been compacted.
+
+    Attributes
+    ----------
+    error : float
+        Target normalized rank error.
+    k : int
+        Capacity of the top level, derived from `error`.
+    count : int
+        Number of values added, nulls excluded.
+    min : float
+        Smallest value added.
+    max : float
+        Largest value added.
+    _levels : list[np.ndarray]
+        Items of each level, the lowest first.
+    _rng : np.random.Generator
+        Generator of the compaction offsets.
+    """
+
+    def __init__(self, error: float = 0.001, seed: int = 0) -> None:
+        """
+        Initializes an empty sketch.
+
+        Parameters
+        ----------
+        error : float, optional
+            Target normalized rank error, between 0 and 1.
+        seed : int, optional
+            Seed of the random compaction offsets.
+        """
+        if not 0 < error < 1:
+            raise ValueError("El error debe estar entre 0 y 1")
+        self.error = error
+        # Empirical error of KLL sketches for a top capacity k
+        self.k = max(8, math.ceil((2.296 / error) ** (1 / 0.9723)))
+        self.count = 0
+        self.min = np.nan
+        self.max = np.nan
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def is_exact(self) -> bool:
+        """
+        Gets whether the sketch still holds every value added.
+        """
+        return len(self._levels) == 1
+
+    @property
+    def retained(self) -> int:
+        """
+        Gets the number of items kept in memory.
+        """
+        return sum(len(level) for level in self._levels)
+
+    def update(self, values: Union[np.ndarray, Iterable[float]]) -> None:
+        """
+        Adds a batch of values to the sketch. Nulls are ignored.
+
+        Parameters
+        ----------
+        values : array-like
+            Values to add.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self._add_count(len(values), values.min(), values.max())
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Adds the values of another sketch to this one.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            Sketch of another part of the stream.
+
+        Returns
+        ----------
+        QuantileSketch
+            This sketch, updated.
+        """
+        if not other.count:
+            return self
+        self._add_count(other.count, other.min, other.max)
+        self.k = max(self.k, other.k)
+        self.error = min(self.error, other.error)
+        for h, level in enumerate(other._levels):
+            if h == len(self._levels):
+                self._levels.append(np.empty(0))
+            self._levels[h] = np.concatenate([self._levels[h], level])
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns an approximate quantile of the values added.
+
+        Parameters
+        ----------
+        q : float
+            Quantile to compute, between 0 and 1.
+
+        Returns
+        ----------
+        float
+            Value whose rank is `q` within the error of the sketch, or
+            NaN if the sketch is empty. While the sketch is exact it is
+            interpolated as `np.quantile` does.
+        """
+        return float(self.quantiles([q])[0])
+
+    def quantiles(self, qs: Iterable[float]) -> np.ndarray:
+        """
+        Returns several approximate quantiles at once.
+
+        Parameters
+        ----------
+        qs : Iterable[float]
+            Quantiles to compute, between 0 and 1.
+
+        Returns
+        ----------
+        np.ndarray
+            Value of each quantile, as in `quantile`.
+        """
+        qs = np.asarray(list(qs), dtype=np.float64)
+        if ((qs < 0) | (qs > 1)).any():
+            raise ValueError("Los cuantiles deben estar entre 0 y 1")
+        if not self.count:
+            return np.full(len(qs), np.nan)
+        if self.is_exact:
+            return np.quantile(self._levels[0], qs)
+
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(level), 2 ** h)
+                                  for h, level in enumerate(self._levels)])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        ranks = np.cumsum(weights[order])
+        positions = np.searchsorted(ranks, qs * ranks[-1], side="left")
+        result = items[np.minimum(positions, len(items) - 1)]
+        # The extremes are known exactly
+        result[qs == 0] = self.min
+        result[qs == 1] = self.max
+        return result
+
+    def rank(self, value: float) -> float:
+        """
+        Returns the approximate fraction of values lower than a value.
+        """
+        if not self.count:
+            return np.nan
+        below = sum(np.count_nonzero(level < value) * 2 ** h
+                    for h, level in enumerate(self._levels))
+        return below / sum(len(level) * 2 ** h
+                           for h, level in enumerate(self._levels))
+
+    def _add_count(self, count: int, low: float, high: float) -> None:
+        self.count += int(count)
+        self.min = low if np.isnan(self.min) else min(self.min, low)
+        self.max = high if np.isnan(self.max) else max(self.max, high)
+
+    def _capacity(self, h: int) -> int:
+        """
+        Returns the capacity of a level, smaller the further below the top.
+        """
+        depth = len(self._levels) - 1 - h
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        """
+        Compacts the levels above their capacity, from the lowest up.
+        """
+        h = 0
+        while h < len(self._levels):
+            level = self._levels[h]
+            if len(level) > self._capacity(h):
+                if h + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                level = np.sort(level)
+                # An odd item stays in the level
+                leftover = level[:len(level) % 2]
+                paired = level[len(level) % 2:]
+                promoted = paired[self._rng.integers(2)::2]
+                self._levels[h] = leftover
+                self._levels[h + 1] = np.concatenate(
+                    [self._levels[h + 1], promoted])
+            h += 1
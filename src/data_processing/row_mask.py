@@ -0,0 +1,146 @@
+import numpy as np
+from typing import Union
+from pandas import DataFrame, Series
+
+
+class RowMask():
+    """
+    Packed bitmap of the rows of a DataFrame that are kept.
+
+    Deleting rows clears their bits instead of rewriting the columns, so
+    the data stays shared and every view of it (the table, each model)
+    can hold its own mask at a cost of one bit per row. The bits are
+    packed as the bitmaps of `NullIndex`, so both can be combined without
+    unpacking.
+
+    Attributes
+    ----------
+    rows : int
+        Number of rows of the data.
+    count : int
+        Number of rows kept.
+    _bits : np.ndarray
+        Bits of the rows kept, packed by `np.packbits`.
+    """
+
+    def __init__(self, rows: int = 0) -> None:
+        """
+        Initializes a mask that keeps every row.
+
+        Parameters
+        ----------
+        rows : int, optional
+            Number of rows of the data.
+        """
+        self.rows = rows
+        self.count = rows
+        self._bits = np.packbits(np.ones(rows, dtype=bool))
+
+    @classmethod
+    def from_array(cls, kept: np.ndarray) -> "RowMask":
+        """
+        Builds a mask from a boolean array, True for the rows kept.
+        """
+        mask = cls(len(kept))
+        mask._set(np.asarray(kept, dtype=bool))
+        return mask
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def bits(self) -> np.ndarray:
+        """
+        Gets the packed bits of the rows kept, zero past the last row.
+        """
+        return self._bits
+
+    @property
+    def all(self) -> bool:
+        """
+        Gets whether every row is kept.
+        """
+        return self.count == self.rows
+
+    @property
+    def nbytes(self) -> int:
+        return self._bits.nbytes
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Returns a boolean array, True for the rows kept.
+        """
+        return np.unpackbits(self._bits, count=self.rows).astype(bool)
+
+    def positions(self) -> np.ndarray:
+        """
+        Returns the positions of the rows kept.
+        """
+        return np.flatnonzero(self.to_numpy())
+
+    def delete(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Deletes rows from the mask.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            Boolean array, True for the rows to delete.
+
+        Returns
+        ----------
+        np.ndarray
+            Boolean array, True for the rows that were kept until now.
+        """
+        kept = self.to_numpy()
+        deleted = kept & rows
+        if deleted.any():
+            self._set(kept & ~deleted)
+        return deleted
+
+    def restore(self, rows: np.ndarray) -> None:
+        """
+        Keeps again rows that were deleted.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            Boolean array, True for the rows to restore.
+        """
+        if rows.any():
+            self._set(self.to_numpy() | rows)
+
+    def select(self, data: Union[DataFrame, Series, np.ndarray]
+               ) -> Union[DataFrame, Series, np.ndarray]:
+        """
+        Returns the rows kept of some data with a row per bit.
+
+        Parameters
+        ----------
+        data : DataFrame, Series or np.ndarray
+            Data to select the rows of.
+
+        Returns
+        ----------
+        DataFrame, Series or np.ndarray
+            `data` itself if every row is kept, its rows kept otherwise.
+        """
+        if self.all:
+            return data
+        if isinstance(data, (DataFrame, Series)):
+            return data.iloc[self.positions()]
+        return data[self.to_numpy()]
+
+    def copy(self) -> "RowMask":
+        """
+        Returns a copy of the mask that does not share its bits.
+        """
+        mask = RowMask()
+        mask.rows = self.rows
+        mask.count = self.count
+        mask._bits = self._bits.copy()
+        return mask
+
+    def _set(self, kept: np.ndarray) -> None:
+        self._bits = np.packbits(kept)
+        self.count = int(np.count_nonzero(kept))
@@ -0,0 +1,210 @@
+import numpy as np
+from pandas import DataFrame, concat
+from typing import Iterable, Optional
+from data_processing.import_module import (BatchCallback, ProgressCallback,
+                                           iter_file_batches)
+
+
+class ReservoirSampler():
+    """
+    Keeps a uniform random sample of bounded size from a stream of batches.
+
+    Implements reservoir sampling (algorithm R) vectorized per batch: the
+    `j`-th row of the stream replaces a random slot of the reservoir with
+    probability `size / (j + 1)`. Only the rows that win a slot are kept,
+    so memory stays bounded by the sample size and not by the stream.
+    Row and null counts are accumulated for the whole stream.
+
+    Attributes
+    ----------
+    size : int
+        Maximum number of rows of the sample.
+    total_rows : int
+        Number of rows seen in the stream.
+    null_counts : dict[str, int]
+        Number of nulls of each column in the whole stream.
+    _rng : np.random.Generator
+        Seeded generator, so the same stream gives the same sample.
+    _pool : DataFrame, optional
+        Candidate rows, a superset of the rows in the reservoir.
+    _row_ids : np.ndarray
+        Position in the stream of each row of `_pool`.
+    _slots : np.ndarray
+        Row of `_pool` held by each slot of the reservoir.
+    """
+
+    def __init__(self, size: int, seed: int = 0) -> None:
+        """
+        Initializes an empty sampler.
+
+        Parameters
+        ----------
+        size : int
+            Maximum number of rows of the sample.
+        seed : int, optional
+            Seed of the random generator.
+        """
+        if size <= 0:
+            raise ValueError("El tamaño de la muestra debe ser positivo")
+        self.size = int(size)
+        self.total_rows = 0
+        self.null_counts = {}
+        self._rng = np.random.default_rng(seed)
+        self._pool = None
+        self._row_ids = np.empty(0, dtype=np.int64)
+        self._slots = np.empty(0, dtype=np.int64)
+
+    def add(self, batch: DataFrame) -> None:
+        """
+        Updates the sample and the counts with a batch of rows.
+
+        Parameters
+        ----------
+        batch : DataFrame
+            Next rows of the stream.
+        """
+        rows = len(batch)
+        for name, count in batch.isna().sum().items():
+            self.null_counts[name] = self.null_counts.get(name, 0) + int(count)
+
+        if self._pool is None:
+            self._pool = batch.iloc[:0].reset_index(drop=True)
+        start = self.total_rows
+        self.total_rows += rows
+        if not rows:
+            return
+
+        # Rows that fill the free slots of the reservoir
+        filled = len(self._slots)
+        free = min(max(self.size - filled, 0), rows)
+        slots = np.arange(filled, filled + free)
+        positions = np.arange(free)
+
+        # The j-th row of the stream takes slot randint(0, j] if it is
+        # below the size of the reservoir
+        if free < rows:
+            stream_ids = np.arange(start + free, start + rows)
+            draws = self._rng.integers(0, stream_ids + 1)
+            wins = draws < self.size
+            # If a slot is won twice in a batch, the later row keeps it
+            win_slots = draws[wins][::-1]
+            win_positions = np.flatnonzero(wins)[::-1] + free
+            win_slots, first = np.unique(win_slots, return_index=True)
+            slots = np.concatenate([slots, win_slots])
+            positions = np.concatenate([positions, win_positions[first]])
+
+        if not len(slots):
+            return
+
+        kept, inverse = np.unique(positions, return_inverse=True)
+        offset = len(self._pool)
+        rows_kept = batch.iloc[kept].reset_index(drop=True)
+        self._pool = concat([self._pool, rows_kept], ignore_index=True)\
+            if offset else rows_kept
+        self._row_ids = np.concatenate([self._row_ids, start + kept])
+        new_slots = np.resize(self._slots, max(len(self._slots),
+                                               slots.max() + 1))
+        new_slots[slots] = offset + inverse
+        self._slots = new_slots
+
+        if len(self._pool) > 2 * self.size:
+            self._compact()
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Builds the sample with its rows in the order of the stream.
+
+        Returns
+        ----------
+        DataFrame
+            Sampled rows, at most `size`.
+        """
+        if self._pool is None:
+            return DataFrame()
+        order = self._slots[np.argsort(self._row_ids[self._slots],
+                                       kind="stable")]
+        return self._pool.iloc[order].reset_index(drop=True)
+
+    def _compact(self) -> None:
+        """
+        Drops the rows of the pool that no longer hold a slot.
+        """
+        self._pool = self._pool.iloc[self._slots].reset_index(drop=True)
+        self._row_ids = self._row_ids[self._slots]
+        self._slots = np.arange(len(self._slots))
+
+
+def sample_batches(batches: Iterable[DataFrame], size: int, seed: int = 0,
+                   batch_callback: Optional[BatchCallback] = None
+                   ) -> tuple[DataFrame, int, dict[str, int]]:
+    """
+    Samples a stream of batches in a single pass.
+
+    Parameters
+    ----------
+    batches : Iterable[DataFrame]
+        Batches of rows with the same columns.
+    size : int
+        Maximum number of rows of the sample.
+    seed : int, optional
+        Seed of the random generator.
+    batch_callback : callable, optional
+        Called with every batch read.
+
+    Returns
+    ----------
+    tuple[DataFrame, int, dict[str, int]]
+        Sample, number of rows of the stream and nulls of each column.
+    """
+    sampler = ReservoirSampler(size, seed)
+    for batch in batches:
+        sampler.add(batch)
+        if batch_callback is not None:
+            batch_callback(batch)
+    return sampler.to_dataframe(), sampler.total_rows, sampler.null_counts
+
+
+def load_sample(file_path: str, size: int = 100_000, seed: int = 0,
+                chunksize: int = 100_000,
+                progress_callback: Optional[ProgressCallback] = None,
+                batch_callback: Optional[BatchCallback] = None,
+                **options) -> tuple[DataFrame, int, dict[str, int]]:
+    """
+    Loads a random sample of a file that may not fit in memory.
+
+    The file is streamed once and only the sampled rows are kept, along
+    with the exact row and null counts of the whole file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the file.
+    size : int, optional
+        Maximum number of rows of the sample.
+    seed : int, optional
+        Seed of the random generator.
+    chunksize : int, optional
+        Number of rows read per batch.
+    progress_callback : callable, optional
+        Receives the progress after every batch, as in `load_file`.
+    batch_callback : callable, optional
+        Called with every batch read.
+    **options
+        Options of `load_file` (columns, table, sheet...).
+
+    Returns
+    ----------
+    tuple[DataFrame, int, dict[str, int]]
+        Sample, number of rows of the file and nulls of each column.
+    """
+    try:
+        batches = iter_file_batches(file_path, chunksize, progress_callback,
+                                    **options)
+        data, rows, nulls = sample_batches(batches, size, seed,
+                                           batch_callback)
+    except ValueError as e:
+        raise ValueError(f"Error al cargar la muestra del archivo: {e}")
+    if data.empty and not len(data.columns):
+        raise ValueError("Error al cargar la muestra del archivo: "
+                         "Documento vacio")
+    return data, rows, nulls
@@ -0,0 +1,190 @@
+import numpy as np
+from typing import Iterable, Sequence
+import warnings
+
+SCALING_METHODS = ("standard", "minmax", "robust")
+
+
+class Scaler():
+    """
+    Scaling of the input columns of a model, with cached statistics.
+
+    Each column is scaled as `(x - center) / scale`:
+
+    - "standard": the mean and the standard deviation.
+    - "minmax": the minimum and the range.
+    - "robust": the median and the interquartile range.
+
+    The statistics of a column are computed the first time it is scaled
+    and cached, so fitting several models on the same rows does not read
+    the columns again. Columns are scaled one at a time when the design
+    matrix is built, so no scaled copy of the data is kept. Columns
+    without spread keep a scale of 1.
+
+    A model fitted on the scaled columns is brought back to the original
+    units by `unscale`, so its formula and predictions use the original
+    values.
+
+    Attributes
+    ----------
+    method : str
+        "standard", "minmax" or "robust".
+    statistics : dict[str, tuple[float, float]]
+        Center and scale of each column.
+    """
+
+    def __init__(self, method: str = "standard") -> None:
+        """
+        Initializes a scaler without statistics.
+
+        Parameters
+        ----------
+        method : str, optional
+            "standard", "minmax" or "robust".
+
+        Raises
+        ------
+        ValueError
+            If the method is not valid.
+        """
+        if method not in SCALING_METHODS:
+            raise ValueError(f"Método de escalado no válido: {method}")
+        self.method = method
+        self.statistics = {}
+
+    def fit(self, columns: Sequence[np.ndarray],
+            names: Sequence[str]) -> "Scaler":
+        """
+        Computes the statistics of the columns that are not cached.
+
+        Parameters
+        ----------
+        columns : Sequence[np.ndarray]
+            Values of each column.
+        names : Sequence[str]
+            Name of each column.
+
+        Returns
+        ----------
+        Scaler
+            The scaler itself.
+        """
+        for name, values in zip(names, columns):
+            if name not in self.statistics:
+                self.statistics[name] = self._statistics(
+                    np.asarray(values, dtype=np.float64))
+        return self
+
+    def transform(self, values: np.ndarray, name: str) -> np.ndarray:
+        """
+        Scales the values of a fitted column.
+        """
+        center, scale = self.statistics[name]
+        return (np.asarray(values, dtype=np.float64) - center) / scale
+
+    def design(self, columns: Sequence[np.ndarray],
+               names: Sequence[str]) -> np.ndarray:
+        """
+        Builds the scaled design matrix of some columns, fitting the
+        columns that are not cached.
+
+        Parameters
+        ----------
+        columns : Sequence[np.ndarray]
+            Values of each column.
+        names : Sequence[str]
+            Name of each column.
+
+        Returns
+        ----------
+        np.ndarray
+            2D array with a scaled column per column.
+        """
+        self.fit(columns, names)
+        design = np.empty((len(columns[0]) if len(columns) else 0,
+                           len(columns)))
+        for j, (name, values) in enumerate(zip(names, columns)):
+            design[:, j] = self.transform(values, name)
+        return design
+
+    def unscale(self, coefficients: np.ndarray, intercept: float,
+                names: Sequence[str]) -> tuple[np.ndarray, float]:
+        """
+        Converts the parameters of a model fitted on scaled columns to the
+        original units.
+
+        Parameters
+        ----------
+        coefficients : np.ndarray
+            Coefficient of each scaled column.
+        intercept : float
+            Intercept of the model.
+        names : Sequence[str]
+            Name of each column.
+
+        Returns
+        ----------
+        tuple[np.ndarray, float]
+            Coefficients and intercept for the original columns.
+        """
+        centers, scales = self._arrays(names)
+        coefficients = np.asarray(coefficients, dtype=np.float64) / scales
+        return coefficients, float(intercept - coefficients @ centers)
+
+    def scale_coefficients(self, coefficients: np.ndarray,
+                           names: Sequence[str]) -> np.ndarray:
+        """
+        Converts coefficients in the original units to the scaled columns,
+        the inverse of `unscale`.
+        """
+        _, scales = self._arrays(names)
+        return np.asarray(coefficients, dtype=np.float64) * scales
+
+    def to_dict(self) -> dict:
+        """
+        Converts the scaler to a dict of plain Python types.
+        """
+        return {"method": self.method,
+                "statistics": {name: [float(center), float(scale)]
+                               for name, (center, scale)
+                               in self.statistics.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Scaler":
+        """
+        Builds a scaler from the output of `to_dict`.
+        """
+        scaler = cls(data["method"])
+        scaler.statistics = {name: tuple(values) for name, values
+                             in data["statistics"].items()}
+        return scaler
+
+    def _arrays(self, names: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the centers and scales of some columns.
+        """
+        statistics = np.array([self.statistics[name] for name in names],
+                              dtype=np.float64).reshape(-1, 2)
+        return statistics[:, 0], statistics[:, 1]
+
+    def _statistics(self, values: np.ndarray) -> tuple[float, float]:
+        """
+        Returns the center and scale of a column, ignoring its nulls.
+        """
+        with warnings.catch_warnings():
+            # Columns without values are not scaled
+            warnings.simplefilter("ignore", RuntimeWarning)
+            if self.method == "standard":
+                center, scale = np.nanmean(values), np.nanstd(values)
+            elif self.method == "minmax":
+                center = np.nanmin(values) if len(values) else np.nan
+                scale = np.nanmax(values) - center if len(values) else np.nan
+            else:
+                q1, center, q3 = np.nanquantile(values, [0.25, 0.5, 0.75])\
+                    if len(values) else (np.nan,) * 3
+                scale = q3 - q1
+        if np.isnan(center):
+            center = 0.0
+        if not scale > 0:
+            scale = 1.0
+        return float(center), float(scale)
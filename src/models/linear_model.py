@@ -1,10 +1,13 @@
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error, r2_score
-from numpy import ndarray
+from numpy import asarray, column_stack, empty, float64, full, nan, ndarray
+from pandas import DataFrame
+from models.normal_equations import NormalEquations
 
 
 class LinearModel:
-    def __init__(self, data, input_columns, output_column):
+    def __init__(self, data, input_columns, output_column, row_mask=None,
+                 scaler=None, engine="sklearn", batch_size=65536):
         """
         A class for creating and managing a linear regression model.
 
@@ -19,16 +22,34 @@ class LinearModel:
             List of column names for input features.
         output_column : str
             Column name for the output feature.
+        row_mask : RowMask, optional
+            Rows of `data` used by the model. By default, every row.
+        scaler : Scaler, optional
+            Scaling of the input columns. The model is fitted on the
+            scaled columns and its coefficients are converted back to the
+            original units. By default, the columns are not scaled.
+        engine : str, optional
+            "sklearn" to fit with `LinearRegression`, or "gram" to solve
+            the normal equations from `NormalEquations` accumulated in
+            chunks of `batch_size` rows, without building `x`.
+        batch_size : int, optional
+            Number of rows of each chunk of the "gram" engine.
         x : array-like
-            Input features as a NumPy array.
+            Input features as a NumPy array, stacked from `x_columns`
+            each time it is read.
+        x_columns : list of array-like
+            Input features, one float64 NumPy view of `data` per column,
+            or a copy if the column has a smaller dtype or `row_mask`
+            deletes any row.
         y : array-like
-            Output feature as a NumPy array.
+            Output feature as a float64 NumPy view of `data`, or a copy.
         model : LinearRegression
-            The linear regression model from sklearn.
+            The linear regression model from sklearn, fitted on the scaled
+            columns if there is a scaler.
         coef_ : array-like
-            Coefficients of the regression model.
+            Coefficients of the regression model, in the original units.
         intercept_ : float
-            Intercept of the regression model.
+            Intercept of the regression model, in the original units.
         y_pred : array-like
             Predicted values based on the regression model.
         mse_ : float
@@ -42,9 +63,17 @@ class LinearModel:
         self.data = data
         self.input_columns = input_columns
         self.output_column = output_column
-        # Extract input (x) and output (y) data from the dataset
-        self.x = None if data is None else self.data[input_columns].values
-        self.y = None if data is None else self.data[output_column].values
+        self.row_mask = row_mask
+        self.scaler = scaler
+        if engine not in ("sklearn", "gram"):
+            raise ValueError(f"Motor de ajuste no válido: {engine}")
+        self.engine = engine
+        self.batch_size = batch_size
+        # Views of the input (x) and output (y) columns of the dataset,
+        # which may be memory-mapped and shared with other models
+        self.x_columns = None if data is None else\
+            [self._column(column) for column in input_columns]
+        self.y = None if data is None else self._column(output_column)
         # Initialize the linear regression model
         self.model = LinearRegression()
         # Initialize placeholders for model parameters and metrics
@@ -55,6 +84,38 @@ class LinearModel:
         self.r2_ = None
         self.formula = None
 
+    def _column(self, column: str) -> ndarray:
+        """
+        Returns the values of a column of `data` in the rows kept.
+
+        The values are always float64, so a column downcast to float32 on
+        load gives the same model as the original column. They are
+        read-only, as they may be views of the data shared with other
+        models.
+        """
+        values = self.data[column].to_numpy(dtype=float64, na_value=nan)
+        if self.row_mask is not None:
+            values = self.row_mask.select(values)
+        values.setflags(write=False)
+        return values
+
+    @property
+    def x(self) -> ndarray:
+        """
+        Gets the input features as a 2D array.
+
+        The array is built from the column views when it is read and is
+        not kept, so the model does not hold a copy of the dataset.
+
+        Returns
+        -------
+        ndarray or None
+            Input features, one column per input column.
+        """
+        if self.x_columns is None:
+            return None
+        return column_stack(self.x_columns)
+
     def set_model_params(self, coefficients, intercept, formula):
         """
         Sets the parameters of a preloaded model.
@@ -85,42 +146,157 @@ class LinearModel:
         The method also calculates predictions, evaluates the model's 
         performance, and generates the regression formula.
         """
-        # Fit the model using sklearn's LinearRegression
-        self.model.fit(self.x, self.y)
+        if self.engine == "gram":
+            self._fit_gram()
+            return
+
+        # Fit the model using sklearn's LinearRegression, on the scaled
+        # columns if there is a scaler
+        if self.scaler is None:
+            x = self.x
+        else:
+            x = self.scaler.design(self.x_columns, self.input_columns)
+        self.model.fit(x, self.y)
 
-        # Store the coefficients and intercept
+        # Store the coefficients and intercept in the original units
         self.coef_ = self.model.coef_
         self.intercept_ = self.model.intercept_
+        if self.scaler is not None:
+            self.coef_, self.intercept_ = self.scaler.unscale(
+                self.coef_, self.intercept_, self.input_columns)
 
         # Ensure predictions are generated using the training data
-        self.y_pred = self.model.predict(self.x)  # Use the predict method
+        self.y_pred = self.model.predict(x)  # Use the predict method
         self.evaluate()
         self.calc_formula()
 
-    def predict(self, input: ndarray = None) -> ndarray:
+    def _fit_gram(self):
+        """
+        Fits the model by accumulating the normal equations in chunks of
+        rows, on the scaled columns if there is a scaler.
+        """
+        if self.scaler is not None:
+            self.scaler.fit(self.x_columns, self.input_columns)
+        normal = NormalEquations(len(self.input_columns))
+        for start in range(0, len(self.y), self.batch_size):
+            stop = start + self.batch_size
+            chunk = [column[start:stop] for column in self.x_columns]
+            if self.scaler is None:
+                x = column_stack(chunk)
+            else:
+                x = self.scaler.design(chunk, self.input_columns)
+            normal.update(x, self.y[start:stop])
+
+        coefficients, intercept = normal.solve()
+        self.mse_, self.r2_ = normal.scores(coefficients, intercept)
+        self.coef_, self.intercept_ = coefficients, intercept
+        if self.scaler is not None:
+            self.coef_, self.intercept_ = self.scaler.unscale(
+                coefficients, intercept, self.input_columns)
+
+        self.y_pred = self.predict()
+        self.calc_formula()
+
+    def fit_batches(self, batches):
+        """
+        Fits the model on a stream of batches with the input and output
+        columns, with the "gram" engine.
+
+        Only the normal equations are kept, so the memory used does not
+        depend on the number of rows. The MSE and R² are computed from the
+        same sums. The predictions of the training data are not kept, and
+        the scaler is not needed since the equations are solved on centered
+        and equally scaled features.
+
+        Parameters
+        ----------
+        batches : Iterable[pd.DataFrame]
+            Batches of rows with the input and output columns.
+
+        Returns
+        -------
+        self : LinearModel
+            The fitted LinearModel instance.
+        """
+        normal = NormalEquations(len(self.input_columns))
+        for batch in batches:
+            normal.update(batch[self.input_columns].to_numpy(dtype=float),
+                          batch[self.output_column].to_numpy(dtype=float))
+
+        self.coef_, self.intercept_ = normal.solve()
+        self.mse_, self.r2_ = normal.scores(self.coef_, self.intercept_)
+        self.y_pred = None
+        self.calc_formula()
+        return self
+
+    def predict(self, input=None):
         """
         Makes predictions using the fitted model.
 
-        If `input` is not provided, it defaults to the training data.
+        The predictions are computed as `x @ coef_ + intercept_`, in
+        chunks of `batch_size` rows, so only one chunk of a DataFrame is
+        converted to an array at a time. It only needs the coefficients, so
+        it also works for models loaded from a file.
 
         Parameters
         ----------
-        input : ndarray, optional
-            Data for which predictions are required.
+        input : array-like or pd.DataFrame, optional
+            A row with a value per input column, a 2D array with a row per
+            sample, or a DataFrame with the input columns, matched by name.
+            If it is not provided, it defaults to the training data.
 
         Returns
         -------
-        ndarray
-            Predicted values.
+        float or ndarray
+            Predicted value of a single row, or of each row.
+
+        Raises
+        ------
+        ValueError
+            If the model is not fitted, there is no training data or the
+            input does not have a value per input column.
         """
+        if self.coef_ is None:
+            raise ValueError("El modelo no está ajustado.")
+        coefficients = asarray(self.coef_, dtype=float64)
+
         if input is None:
-            # Usa los datos de entrenamiento si no se especifican otros
-            input = self.x[0]
-        prediction = self.intercept_
-        for i in range(len(input)):
-            prediction += self.coef_[i] * input[i]
+            if self.x_columns is None:
+                raise ValueError(
+                    "No hay datos de entrenamiento para predecir.")
+            # One column at a time, without stacking the training data
+            prediction = full(len(self.y), float(self.intercept_))
+            for coefficient, column in zip(coefficients, self.x_columns):
+                prediction += coefficient * column
+            return prediction
+
+        if isinstance(input, DataFrame):
+            missing = [x for x in self.input_columns if x not in input]
+            if missing:
+                raise ValueError(
+                    f"Faltan las columnas de entrada: {', '.join(missing)}")
+            rows = len(input)
+
+            def chunk(start, stop):
+                return input[self.input_columns].iloc[start:stop]\
+                    .to_numpy(dtype=float64)
+        else:
+            input = asarray(input, dtype=float64)
+            if input.ndim == 1 and len(input) == len(coefficients):
+                return float(input @ coefficients + self.intercept_)
+            if input.ndim != 2 or input.shape[1] != len(coefficients):
+                raise ValueError(
+                    f"Se esperaban {len(coefficients)} valores por fila.")
+            rows = len(input)
+
+            def chunk(start, stop):
+                return input[start:stop]
 
-        # Return predictions for the input data
+        prediction = empty(rows)
+        for start in range(0, rows, self.batch_size):
+            stop = start + self.batch_size
+            prediction[start:stop] = chunk(start, stop) @ coefficients +\
+                self.intercept_
         return prediction
 
     def evaluate(self):
@@ -0,0 +1,169 @@
+import numpy as np
+from typing import Optional
+
+
+class NormalEquations():
+    """
+    Sufficient statistics of a linear regression, accumulated by chunks.
+
+    The accumulators are the number of rows and the sums of `x`, `y`,
+    `XᵀX`, `Xᵀy` and `y²`, so a dataset of any length is fitted in
+    memory proportional to the square of the number of features. The
+    values are shifted by the means of the first chunk before they are
+    added, which keeps the sums small and avoids the cancellation of
+    computing the centered matrices from raw sums of squares.
+
+    The normal equations are solved on the centered matrices, scaled so
+    that every feature has the same norm, by least squares, so constant
+    or collinear features get the minimum norm solution instead of an
+    error. The MSE and R² of any coefficients are computed from the same
+    accumulators without reading the data again.
+
+    Attributes
+    ----------
+    n : int
+        Number of rows accumulated.
+    shift_x : np.ndarray
+        Value subtracted from each feature.
+    shift_y : float
+        Value subtracted from the output.
+    sum_x : np.ndarray
+        Sum of each shifted feature.
+    sum_y : float
+        Sum of the shifted output.
+    xtx : np.ndarray
+        Sum of the outer products of the shifted features.
+    xty : np.ndarray
+        Sum of the shifted features times the shifted output.
+    yty : float
+        Sum of the squares of the shifted output.
+    """
+
+    def __init__(self, features: int) -> None:
+        """
+        Initializes empty accumulators.
+
+        Parameters
+        ----------
+        features : int
+            Number of input features.
+        """
+        self.n = 0
+        self.shift_x = None
+        self.shift_y = 0.0
+        self.sum_x = np.zeros(features)
+        self.sum_y = 0.0
+        self.xtx = np.zeros((features, features))
+        self.xty = np.zeros(features)
+        self.yty = 0.0
+
+    def update(self, x: np.ndarray, y: np.ndarray) -> "NormalEquations":
+        """
+        Adds a chunk of rows to the accumulators.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            2D array with a row per sample and a column per feature.
+        y : np.ndarray
+            Output of each row.
+
+        Returns
+        ----------
+        NormalEquations
+            The accumulators themselves.
+        """
+        x = np.asarray(x, dtype=np.float64).reshape(len(y), -1)
+        y = np.asarray(y, dtype=np.float64)
+        if not len(y):
+            return self
+        if self.shift_x is None:
+            self.shift_x = x.mean(axis=0)
+            self.shift_y = float(y.mean())
+        x = x - self.shift_x
+        y = y - self.shift_y
+        self.n += len(y)
+        self.sum_x += x.sum(axis=0)
+        self.sum_y += float(y.sum())
+        self.xtx += x.T @ x
+        self.xty += x.T @ y
+        self.yty += float(y @ y)
+        return self
+
+    def solve(self) -> tuple[np.ndarray, float]:
+        """
+        Solves the normal equations.
+
+        Returns
+        ----------
+        tuple[np.ndarray, float]
+            Coefficients and intercept of the least squares fit.
+
+        Raises
+        ------
+        ValueError
+            If there are no rows or the sums are not finite.
+        """
+        sxx, sxy, _ = self._centered()
+        # Scale the features to the same norm to improve the conditioning
+        norms = np.sqrt(np.diag(sxx))
+        norms[~(norms > 0)] = 1.0
+        scaled = np.linalg.lstsq(sxx / np.outer(norms, norms), sxy / norms,
+                                 rcond=None)[0]
+        coefficients = scaled / norms
+        mean_x, mean_y = self.sum_x / self.n, self.sum_y / self.n
+        intercept = self.shift_y + mean_y -\
+            (self.shift_x + mean_x) @ coefficients
+        return coefficients, float(intercept)
+
+    def scores(self, coefficients: np.ndarray,
+               intercept: Optional[float] = None) -> tuple[float, float]:
+        """
+        Computes the MSE and R² of some coefficients on the rows
+        accumulated.
+
+        Parameters
+        ----------
+        coefficients : np.ndarray
+            Coefficient of each feature.
+        intercept : float, optional
+            Intercept of the model. By default, the one that minimizes the
+            error with these coefficients.
+
+        Returns
+        ----------
+        tuple[float, float]
+            Mean squared error and R² score.
+        """
+        sxx, sxy, syy = self._centered()
+        coefficients = np.asarray(coefficients, dtype=np.float64)
+        # Error of the centered fit, plus the error of the intercept
+        sse = syy - 2 * coefficients @ sxy + coefficients @ sxx @ coefficients
+        if intercept is not None:
+            mean_x, mean_y = self.sum_x / self.n, self.sum_y / self.n
+            offset = self.shift_y + mean_y - intercept -\
+                (self.shift_x + mean_x) @ coefficients
+            sse += self.n * offset ** 2
+        sse = max(float(sse), 0.0)
+        if syy > 0:
+            r2 = 1 - sse / syy
+        else:
+            # Constant output, scored as sklearn does
+            r2 = 1.0 if np.isclose(sse, 0.0) else 0.0
+        return sse / self.n, r2
+
+    def _centered(self) -> tuple[np.ndarray, np.ndarray, float]:
+        """
+        Returns the centered `XᵀX`, `Xᵀy` and `yᵀy`.
+        """
+        if not self.n:
+            raise ValueError("No hay datos para ajustar el modelo")
+        if not (np.isfinite(self.xtx).all() and np.isfinite(self.xty).all()
+                and np.isfinite(self.yty)):
+            raise ValueError("Los datos contienen valores nulos o "
+                             "infinitos")
+        mean_x, mean_y = self.sum_x / self.n, self.sum_y / self.n
+        sxx = self.xtx - self.n * np.outer(mean_x, mean_x)
+        sxy = self.xty - self.n * mean_x * mean_y
+        syy = self.yty - self.n * mean_y ** 2
+        return sxx, sxy, syy
@@ -1,16 +1,89 @@
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QPushButton, QLabel, QHBoxLayout
+    QWidget, QVBoxLayout, QPushButton, QLabel, QHBoxLayout, QProgressBar,
+    QCheckBox, QShortcut
 )
-from typing import List, Optional
+from PyQt5.QtCore import QThreadPool, pyqtSignal
+from PyQt5.QtGui import QKeySequence
+from typing import List, Optional, Union
 import joblib
 from os.path import splitext
-from data_processing.import_module import DataFrame, load_file
-from ui.popup_handler import (InputDialog, open_file_dialog,
-                              open_model_dialog, show_error, show_message)
+from data_processing.import_module import (DataFrame, is_excel, is_sqlite,
+                                           list_excel_sheets,
+                                           list_sqlite_tables, load_file,
+                                           probe_file)
+from ui.popup_handler import (ExcelImportDialog, InputDialog,
+                              OutlierDialog, SqliteImportDialog,
+                              StrategyDialog,
+                              open_file_dialog, open_model_dialog,
+                              show_error, show_message)
 from data_processing.dataset_calc import PreprocessApplier, none_count
+from data_processing.ingest_cache import IngestCache
+from data_processing.memory_optimizer import optimize_dtypes
+from data_processing.sampling import load_sample
+from data_processing.column_store import (MappedColumnStore, map_dataframe,
+                                         remove_stale_stores)
+from data_processing.null_index import NullIndex
+from data_processing.row_mask import RowMask
+from data_processing.pipeline import PreprocessPipeline
 from ui.components.column_selector import ColumnSelector
 from ui.components.data_table import DataTable
 from ui.components.preprocess_toolbar import PreprocessToolbar
+from ui.load_worker import LoadWorker
+
+
+def _load_and_optimize(file_path: str, sample_size: Optional[int] = None,
+                       store_min_bytes: Optional[int] = None,
+                       **kwargs) -> tuple[DataFrame, dict[str, int],
+                                          Optional[tuple[int, dict]],
+                                          NullIndex,
+                                          Optional[MappedColumnStore]]:
+    """
+    Loads a file, or a random sample of it, and reduces the memory used
+    by its columns.
+
+    Data larger than `store_min_bytes` is moved to a memory-mapped column
+    store, so the model tabs share its pages and the OS can page out the
+    columns that are not in use.
+
+    Runs in a `LoadWorker` thread, so the GUI is only updated through
+    the worker signals. Returns the data, the bytes saved in each column,
+    for samples the rows and nulls of each column in the whole file, the
+    index of the nulls of the data and the column store, if it is mapped.
+    """
+    stats = None
+    if sample_size:
+        # Samples are not stored in the cache
+        kwargs.pop("cache", None)
+        data, rows, nulls = load_sample(file_path, sample_size, **kwargs)
+        stats = (rows, nulls)
+    else:
+        data = load_file(file_path, **kwargs)
+    if data is None:
+        raise ValueError("No se ha podido cargar el archivo")
+    data, savings = optimize_dtypes(data)
+    store = None
+    if store_min_bytes is not None and\
+            data.memory_usage(index=False).sum() >= store_min_bytes:
+        data, store = map_dataframe(data)
+    return data, savings, stats, NullIndex.from_dataframe(data), store
+
+
+def _probe_and_optimize(file_path: str, nrows: int,
+                        progress_callback=None, batch_callback=None,
+                        **kwargs) -> tuple[DataFrame, dict[str, int],
+                                           NullIndex]:
+    """
+    Reads the header and the first `nrows` rows of a file, to choose its
+    columns, and reduces the memory used by them.
+
+    Runs in a `LoadWorker` thread, like `_load_and_optimize`. The
+    callbacks of the worker are not used, since only the first rows are
+    read. Returns the data, the bytes saved in each column and the index
+    of the nulls of the data.
+    """
+    data, savings = optimize_dtypes(probe_file(file_path, nrows=nrows,
+                                               **kwargs))
+    return data, savings, NullIndex.from_dataframe(data)
 
 
 class DataTab(QWidget):
@@ -24,10 +97,32 @@ class DataTab(QWidget):
     ----------
     data : DataFrame, optional
         The DataFrame containing the loaded data.
+    file_path : str or list[str], optional
+        Path of the loaded data file, or the files of a dataset.
+    is_preview : bool
+        True while `data` only holds the first rows of the file, before
+        the selected columns are loaded.
+    load_options : dict
+        Options used to load the file (SQLite table, Excel sheet...).
+    memory_savings : dict[str, int]
+        Bytes saved in each column by the dtype optimizer on load.
+    sample_stats : tuple[int, dict[str, int]], optional
+        Rows and nulls of each column in the whole file when `data` is a
+        random sample of it, None otherwise.
+    null_index : NullIndex, optional
+        Index of the nulls of `data`, kept up to date by the preprocessing.
+    row_mask : RowMask, optional
+        Rows of `data` that are kept. Deleting rows clears them from the
+        mask, and each model gets its own copy of it.
+    column_store : MappedColumnStore, optional
+        Store of the memory-mapped columns of `data`, if they are mapped.
+        It is closed when other data is loaded or the application closes.
     selected_input_columns : List[str], optional
         List of columns selected as inputs for analysis.
     preprocess_applier : PreprocessApplier
         Object for managing and applying the selected preprocessing method.
+    ingest_cache : IngestCache
+        On-disk cache of the files already parsed.
     load_button : QPushButton
         Button to open a data file.
     file_path_label : QLabel
@@ -40,18 +135,64 @@ class DataTab(QWidget):
         Label describing the preprocessing options.
     preprocess_toolbar : PreprocessToolbar
         Toolbar with buttons for preprocessing options.
+    progress_bar : QProgressBar
+        Bar showing the progress of the file being loaded.
+    cancel_button : QPushButton
+        Button to cancel the file being loaded.
+    sample_checkbox : QCheckBox
+        Checkbox to load a random sample instead of the whole file.
+    sample_label : QLabel
+        Banner shown while the data is a sample of the file.
+    load_worker : LoadWorker, optional
+        Worker loading a file in the background, if any.
+    thread_pool : QThreadPool
+        Pool running the load workers.
+    chunk_size : int
+        Number of rows read per batch when loading files in chunks.
+    preview_rows : int
+        Number of rows read from the file before the columns are confirmed.
+    sample_rows : int
+        Number of rows of the random sample.
+    csv_engine : str
+        Parser used for CSV files ("c" or "pyarrow", which is multithreaded
+        and falls back to "c" when pyarrow is not installed).
+    store_min_bytes : int
+        Size from which the loaded columns are memory-mapped from disk.
+    selection_confirmed : pyqtSignal
+        Emitted once the confirmed columns are loaded.
 
     """
 
+    selection_confirmed = pyqtSignal()
+
+    chunk_size = 100_000
+    preview_rows = 1000
+    sample_rows = 100_000
+    csv_engine = "pyarrow"
+    store_min_bytes = 64 * 1024 ** 2
+
     def __init__(self):
         """
         Initializes the DataTab class and sets up the user interface components.
         """
         super().__init__()
         self.data: Optional[DataFrame] = None
+        self.file_path: Optional[str] = None
+        self.is_preview = False
+        self.load_options = {}
+        self.memory_savings = {}
+        self.sample_stats: Optional[tuple[int, dict[str, int]]] = None
+        self.null_index: Optional[NullIndex] = None
+        self.row_mask: Optional[RowMask] = None
+        self.column_store: Optional[MappedColumnStore] = None
+        # Column files left by previous runs that could not remove them
+        remove_stale_stores()
         self.selected_input_columns: Optional[List[str]] = None
         self.selected_output_column: Optional[str] = None
         self.preprocess_applier = PreprocessApplier()
+        self.ingest_cache = IngestCache()
+        self.load_worker: Optional[LoadWorker] = None
+        self.thread_pool = QThreadPool.globalInstance()
         self.init_ui()
 
     def init_ui(self):
@@ -72,6 +213,24 @@ class DataTab(QWidget):
         self.model_button.setFixedSize(200, 50)
         self.path_label = QLabel("Ruta del archivo cargado:")
 
+        # Progress of the file being loaded, hidden while idle
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFixedSize(300, 30)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.hide()
+        self.cancel_button = QPushButton("✖ Cancelar")
+        self.cancel_button.setFixedSize(120, 30)
+        self.cancel_button.hide()
+
+        # Sample mode for files that do not fit in memory
+        self.sample_checkbox = QCheckBox("Cargar muestra")
+        self.sample_checkbox.setToolTip(
+            f"Carga una muestra aleatoria de {self.sample_rows} filas en "
+            "lugar del archivo completo")
+        self.sample_label = QLabel()
+        self.sample_label.setObjectName("sampleLabel")
+        self.sample_label.hide()
+
         # Data preview table
         self.table = DataTable()
         self.table.setMinimumHeight(500)
@@ -87,9 +246,13 @@ class DataTab(QWidget):
         load_bar.addWidget(self.file_button)
         load_bar.addWidget(self.model_button)
         load_bar.addWidget(self.path_label)
+        load_bar.addWidget(self.sample_checkbox)
+        load_bar.addWidget(self.progress_bar)
+        load_bar.addWidget(self.cancel_button)
 
         # Add components to the main layout
         layout.addWidget(self.load_widget)
+        layout.addWidget(self.sample_label)
         layout.addWidget(self.table)
         layout.addWidget(self.column_selector)
         layout.addWidget(self.preprocess_label)
@@ -120,9 +283,14 @@ class DataTab(QWidget):
         self.preprocess_label.hide()
         self.preprocess_toolbar = PreprocessToolbar()
 
+        # Ctrl+Z and Ctrl+Y undo and redo the preprocessing
+        self.undo_shortcut = QShortcut(QKeySequence.Undo, self)
+        self.redo_shortcut = QShortcut(QKeySequence.Redo, self)
+
     def connect_buttons(self):
         # Connect file loading button
         self.file_button.clicked.connect(self.load_data)
+        self.cancel_button.clicked.connect(self.cancel_load)
 
         # Connect preprocessing toolbar buttons
         self.preprocess_toolbar.buttons['delete'].clicked.connect(
@@ -133,6 +301,18 @@ class DataTab(QWidget):
             lambda: self.preprocessing_method('median'))
         self.preprocess_toolbar.buttons['constant'].clicked.connect(
             self.handle_constant_method)
+        self.preprocess_toolbar.buttons['knn'].clicked.connect(
+            lambda: self.preprocessing_method('knn'))
+        self.preprocess_toolbar.buttons['columns'].clicked.connect(
+            self.handle_column_strategies)
+        self.preprocess_toolbar.outliers_button.clicked.connect(
+            self.handle_outliers)
+        self.preprocess_toolbar.undo_button.clicked.connect(
+            self.undo_preprocessing)
+        self.preprocess_toolbar.redo_button.clicked.connect(
+            self.redo_preprocessing)
+        self.undo_shortcut.activated.connect(self.undo_preprocessing)
+        self.redo_shortcut.activated.connect(self.redo_preprocessing)
 
     def load_model(self):
         """    
@@ -165,6 +345,8 @@ class DataTab(QWidget):
             self.column_selector.setVisible(False)
             self.preprocess_label.hide()
             self.preprocess_toolbar.hide_buttons()
+            self.preprocess_toolbar.outliers_button.hide()
+            self.preprocess_toolbar.update_history_buttons(False, False)
 
             # Display the loaded file path and confirmation message
             self.path_label.setText(
@@ -183,25 +365,252 @@ class DataTab(QWidget):
         Notes
         -----
         Uses `im.load_file` to load the file and `show_message` to notify the user
-        in case of success or failure.
+        in case of success or failure. Only the header and the first
+        `preview_rows` rows are read, in a `LoadWorker`, to populate the
+        column selector in `on_preview_loaded`; the confirmed columns are
+        loaded later by `materialize_columns`. If several files are
+        selected, they are loaded as the partitions of a single dataset.
         """
+        if self.load_worker is not None:
+            return
         file_path = open_file_dialog(self)
         if not file_path:
             return
 
         try:
             # Load the dataset into the table and initialize column selection
-            self.data = load_file(file_path)
-            self.path_label.setText(
-                f"📄 Ruta del archivo cargado: {file_path}")
-            self.table.load_data(self.data, batch_size=100)
-            self.column_selector.populate_columns(self.data)
-            self.column_selector.setVisible(True)
-            show_message("✅ ¡Archivo cargado exitosamente! 😃", self)
+            # The partitions of a dataset share the options of the first one
+            first_file = file_path[0] if isinstance(file_path, list)\
+                else file_path
+            options = {}
+            if is_sqlite(first_file):
+                options = self.ask_sqlite_options(first_file)
+            elif is_excel(first_file):
+                options = self.ask_excel_options(first_file)
+            if options is None:
+                return
+
+            # Only the selected columns are read once they are confirmed
+            worker = LoadWorker(_probe_and_optimize, file_path,
+                                self.preview_rows, **options)
+            self.start_worker(worker, lambda result: self.on_preview_loaded(
+                result, file_path, options))
 
         except Exception as e:
             show_error(f"⚠ {str(e)} ⚠", self)
 
+    def on_preview_loaded(self, result: tuple,
+                          file_path: Union[str, List[str]], options: dict):
+        """
+        Shows the first rows of a file and populates the column selector.
+
+        Parameters
+        ----------
+        result : tuple
+            First rows of the file, bytes saved in each column and the
+            index of the nulls.
+        file_path : str or list[str]
+            File, or files of the dataset, previewed.
+        options : dict
+            Options of the SQLite table or Excel sheet read.
+        """
+        self.set_loading(False)
+        self.set_column_store(None)
+        self.data, self.memory_savings, self.null_index = result
+        self.row_mask = RowMask(len(self.data))
+        self.is_preview = True
+        self.set_sample_stats(None)
+        self.file_path = file_path
+        self.load_options = options
+        if isinstance(file_path, list):
+            self.path_label.setText(
+                f"📄 {len(file_path)} archivos cargados: {file_path[0]}...")
+        else:
+            self.path_label.setText(
+                f"📄 Ruta del archivo cargado: {file_path}")
+        self.show_data()
+        self.column_selector.populate_columns(self.data)
+        self.column_selector.setVisible(True)
+        show_message("✅ ¡Archivo cargado exitosamente! 😃", self)
+
+    def start_load(self, columns: List[str], on_finished):
+        """
+        Starts loading columns of the current file in the background.
+
+        Parameters
+        ----------
+        columns : List[str]
+            Columns to load.
+        on_finished : callable
+            Called with the loaded data and the bytes saved in each column.
+        """
+        sample_size = self.sample_rows if self.sample_checkbox.isChecked()\
+            else None
+        worker = LoadWorker(_load_and_optimize, self.file_path,
+                            sample_size=sample_size, columns=columns,
+                            chunksize=self.chunk_size,
+                            engine=self.csv_engine,
+                            store_min_bytes=self.store_min_bytes,
+                            cache=self.ingest_cache, **self.load_options)
+        worker.signals.progress.connect(self.update_progress)
+        worker.signals.preview.connect(self.on_load_preview)
+        self.start_worker(worker, on_finished)
+
+    def start_worker(self, worker: LoadWorker, on_finished):
+        """
+        Runs a `LoadWorker` in the thread pool, showing its progress.
+
+        Parameters
+        ----------
+        worker : LoadWorker
+            Worker to run.
+        on_finished : callable
+            Called with the result of the worker.
+        """
+        worker.signals.finished.connect(on_finished)
+        worker.signals.error.connect(self.on_load_error)
+        worker.signals.cancelled.connect(self.on_load_cancelled)
+        self.load_worker = worker
+
+        self.set_loading(True)
+        self.thread_pool.start(worker)
+
+    def cancel_load(self):
+        """
+        Cancels the file being loaded, if any.
+        """
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+            self.cancel_button.setEnabled(False)
+
+    def set_loading(self, loading: bool):
+        """
+        Shows the progress of a load and disables the buttons that would
+        start another one.
+
+        Parameters
+        ----------
+        loading : bool
+            Whether a file is being loaded or not.
+        """
+        self.file_button.setEnabled(not loading)
+        self.model_button.setEnabled(not loading)
+        self.sample_checkbox.setEnabled(not loading)
+        self.column_selector.setEnabled(not loading)
+        self.cancel_button.setEnabled(loading)
+        self.progress_bar.setVisible(loading)
+        self.cancel_button.setVisible(loading)
+        if loading:
+            # Busy indicator until the first progress is reported
+            self.progress_bar.setRange(0, 0)
+        else:
+            self.load_worker = None
+
+    def on_load_preview(self, batch: DataFrame):
+        """
+        Shows the first rows read while the rest of the file is loading.
+
+        Parameters
+        ----------
+        batch : DataFrame
+            First batch read from the file.
+        """
+        self.table.load_data(batch, batch_size=100)
+
+    def on_load_error(self, message: str):
+        """
+        Restores the previous data and shows the error of a failed load.
+
+        Parameters
+        ----------
+        message : str
+            Error message.
+        """
+        self.set_loading(False)
+        self.restore_table()
+        show_error(f"⚠ {message} ⚠", self)
+
+    def on_load_cancelled(self):
+        """
+        Restores the previous data after a load is cancelled.
+        """
+        self.set_loading(False)
+        self.restore_table()
+        show_message("Carga del archivo cancelada", self)
+
+    def restore_table(self):
+        """
+        Shows the data loaded before the last load in the table.
+        """
+        if self.data is not None:
+            self.show_data()
+        else:
+            self.table.clear()
+            self.table.setRowCount(0)
+            self.table.setColumnCount(0)
+
+    def ask_sqlite_options(self, file_path: str) -> Optional[dict]:
+        """
+        Asks the user which table of a SQLite database to import and
+        how to filter it.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the database.
+
+        Returns
+        -------
+        dict or None
+            Options for `load_file`, or None if the user cancels.
+        """
+        tables = list_sqlite_tables(file_path)
+        if not tables:
+            raise ValueError("La base de datos no contiene ninguna tabla")
+
+        dialog = SqliteImportDialog(tables, parent=self)
+        if dialog.exec_() != SqliteImportDialog.Accepted:
+            return None
+        return dialog.get_options()
+
+    def ask_excel_options(self, file_path: str) -> Optional[dict]:
+        """
+        Asks the user which sheet of an Excel file to import and which
+        row holds the column names.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the Excel file.
+
+        Returns
+        -------
+        dict or None
+            Options for `load_file`, or None if the user cancels.
+        """
+        dialog = ExcelImportDialog(list_excel_sheets(file_path), parent=self)
+        if dialog.exec_() != ExcelImportDialog.Accepted:
+            return None
+        return dialog.get_options()
+
+    def update_progress(self, bytes_read: int, total_bytes: int, rows: int):
+        """
+        Updates the progress bar while a file is being loaded.
+
+        Parameters
+        ----------
+        bytes_read : int
+            Bytes of the file read so far.
+        total_bytes : int
+            Size of the file in bytes.
+        rows : int
+            Rows parsed so far.
+        """
+        percent = int(100 * bytes_read / total_bytes) if total_bytes else 100
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(min(percent, 100))
+        self.progress_bar.setFormat(f"%p% - {rows} filas")
+
     def on_input_column_selection_changed(self, item):
         """
         Highlights a column in the table when it is selected or deselected
@@ -212,14 +621,14 @@ class DataTab(QWidget):
         item : QListWidgetItem
             List item in `input_column_selector` that has changed state.
         """
-        # Get the index of the column and its selection state
-        column_index = self.column_selector.input_column_selector.row(item)
+        # Get the name of the column and its selection state
+        column = item.text()
         state = item.checkState()
 
         # Highlight the selected column in the table
-        if column_index !=\
-                self.column_selector.output_column_selector.currentIndex() or state:
-            self.table.highlight_column(column_index, state)
+        if column !=\
+                self.column_selector.output_column_selector.currentText() or state:
+            self.highlight_column(column, state)
 
     def on_output_column_selection_changed(self):
         """
@@ -236,15 +645,31 @@ class DataTab(QWidget):
         last_column_index = self.column_selector.output_column_selector.last_selected
 
         # Highlight the current output column
-        self.table.highlight_column(current_column_index, True)
+        self.highlight_column(
+            self.column_selector.output_column_selector.currentText(), True)
 
         # Unhighlight the last column if it is no longer selected
-        if not self.column_selector.input_column_selector.item(
-            last_column_index).checkState() and\
+        last_item = self.column_selector.input_column_selector.item(
+            last_column_index)
+        if not last_item.checkState() and\
                 last_column_index != current_column_index:
 
-            self.table.highlight_column(
-                last_column_index, False)
+            self.highlight_column(last_item.text(), False)
+
+    def highlight_column(self, column: str, highlight: bool):
+        """
+        Highlights a column of the table by its name.
+
+        Parameters
+        ----------
+        column : str
+            Name of the column.
+        highlight : bool
+            Whether the column is highlighted or not.
+        """
+        column_index = self.table.column_index(column)
+        if column_index >= 0:
+            self.table.highlight_column(column_index, highlight)
 
     def on_selection_confirmed(self):
         """
@@ -258,25 +683,144 @@ class DataTab(QWidget):
         # Retrieve the selected input and output columns
         input_columns, output_column = self.column_selector.get_selected_columns()
 
-        if not input_columns:
-            return
-        elif output_column == "":
+        if not input_columns or output_column == "":
+            self.selection_confirmed.emit()
             return
 
+        # Read the selected columns if they are not loaded yet
+        if self.materialize_columns(input_columns, output_column):
+            self.finish_selection(input_columns, output_column)
+
+    def finish_selection(self, input_columns: List[str], output_column: str):
+        """
+        Stores the confirmed columns once they are loaded and enables the
+        preprocessing interface if they have null values.
+
+        Parameters
+        ----------
+        input_columns : List[str]
+            Columns selected as inputs.
+        output_column : str
+            Column selected as output.
+        """
+        columns = input_columns + [output_column]
+
         # Store the selected columns and display a summary
         self.selected_input_columns = input_columns
         self.selected_output_column = output_column
-        columns = input_columns + [output_column]
-        none_columns = none_count(self.data, columns)
-        self.null_columns = [x for i, x in enumerate(
-            columns) if none_columns[i] >= 1]
+        self.null_columns = self.null_index.null_columns(columns,
+                                                         self.row_mask)
         self.show_selection_summary(input_columns, output_column)
 
         # Enable preprocessing if there are null values
-        if sum(map(int, none_count(self.data, input_columns + [output_column]))) > 0:
+        if self.null_columns:
             self.enable_preprocessing()
         else:
             self.disable_preprocessing()
+        # Outliers can be removed with or without null values
+        self.preprocess_toolbar.outliers_button.show()
+        self.selection_confirmed.emit()
+
+    def materialize_columns(self, input_columns: List[str],
+                            output_column: str) -> bool:
+        """
+        Loads the confirmed columns of the file, if they are not loaded yet.
+
+        Files are only previewed when opened, so the confirmed columns are
+        read afterwards in a `LoadWorker`, using the column projection of
+        each format. The selection is finished once they are loaded.
+
+        Parameters
+        ----------
+        input_columns : List[str]
+            Columns selected as inputs.
+        output_column : str
+            Column selected as output.
+
+        Returns
+        -------
+        bool
+            True if the columns were already loaded, False if they are
+            being loaded
+        """
+        columns = input_columns + [output_column]
+        is_sample = self.sample_stats is not None
+        if not self.is_preview and\
+                is_sample == self.sample_checkbox.isChecked() and\
+                all(column in self.data.columns for column in columns):
+            return True
+
+        # Keep the file's column order in the table
+        wanted = [column for column in self.column_selector.data.columns
+                  if column in columns]
+        self.start_load(wanted, lambda result: self.on_columns_loaded(
+            result, input_columns, output_column))
+        return False
+
+    def on_columns_loaded(self, result: tuple, input_columns: List[str],
+                          output_column: str):
+        """
+        Shows the loaded columns in the table and finishes the selection.
+
+        Parameters
+        ----------
+        result : tuple
+            Loaded data, bytes saved in each column, for samples the rows
+            and nulls of the whole file, and the index of the nulls.
+        input_columns : List[str]
+            Columns selected as inputs.
+        output_column : str
+            Column selected as output.
+        """
+        self.set_loading(False)
+        self.data, self.memory_savings, stats, self.null_index, store =\
+            result
+        self.set_column_store(store)
+        self.row_mask = RowMask(len(self.data))
+        # The preprocessing of the previous data does not apply any more
+        self.preprocess_applier.pipeline = PreprocessPipeline()
+        self.preprocess_applier.history.clear()
+        self.preprocess_toolbar.update_history_buttons(False, False)
+        self.is_preview = False
+        self.set_sample_stats(stats)
+        self.show_data()
+        for column in input_columns + [output_column]:
+            self.highlight_column(column, True)
+        self.finish_selection(input_columns, output_column)
+
+    def set_column_store(self, store: Optional[MappedColumnStore]):
+        """
+        Keeps the column store of the current data, closing the previous
+        one.
+
+        Parameters
+        ----------
+        store : MappedColumnStore, optional
+            Store of the new data, None if it is not mapped.
+        """
+        if self.column_store is not None and self.column_store is not store:
+            self.column_store.close()
+        self.column_store = store
+
+    def set_sample_stats(self, stats: Optional[tuple[int, dict[str, int]]]):
+        """
+        Stores the counts of the whole file and shows the sample banner
+        if the data is a sample.
+
+        Parameters
+        ----------
+        stats : tuple[int, dict[str, int]], optional
+            Rows and nulls of each column in the whole file, or None if
+            the data is not a sample.
+        """
+        self.sample_stats = stats
+        if stats is None:
+            self.sample_label.hide()
+            return
+        self.sample_label.setText(
+            f"⚠ Datos de muestra: se muestran {len(self.data)} de "
+            f"{stats[0]} filas del archivo ⚠")
+        self.sample_label.show()
 
     def preprocessing_method(self, method: str):
         """
@@ -285,7 +829,8 @@ class DataTab(QWidget):
         Parameters
         ----------
         method : str
-            Preprocessing method to apply ("delete", "mean", "median", "constant").
+            Preprocessing method to apply ("delete", "mean", "median", "constant",
+            "knn").
         """
         try:
             self.preprocess_applier.set_current_method(method)
@@ -294,6 +839,24 @@ class DataTab(QWidget):
         except Exception as e:
             show_error(f'⚠ Error al aplicar el preprocesado: {str(e)} ⚠', self)
 
+    def model_data(self) -> DataFrame:
+        """
+        Returns the selected columns of the data as they are now.
+
+        The preprocessing replaces the columns it changes instead of
+        writing into them, so the DataFrame returned shares the arrays of
+        the data but keeps these values after later fills, undos or
+        redos, and each model tab works on the data it was created with.
+
+        Returns
+        -------
+        DataFrame
+            Input and output columns of the data.
+        """
+        columns = list(dict.fromkeys(self.selected_input_columns +
+                                     [self.selected_output_column]))
+        return self.data[columns]
+
     def show_selection_summary(self, input_columns: List[str], output_column: str):
         """
         Displays a summary of the selected columns in a pop-up message.
@@ -307,18 +870,32 @@ class DataTab(QWidget):
         """
         # Calcula los valores nulos por columna
         all_columns = input_columns + [output_column]
-        null_counts = none_count(self.data, all_columns)
+        null_counts = none_count(self.data, all_columns, self.null_index,
+                                 self.row_mask)
 
         # Construye la sección de valores nulos con nombre y cantidad
-        null_summary = "\n".join(
-            f"- {col}: {nulos} valores nulos" for col, nulos in zip(all_columns, null_counts)
-        )
+        if self.sample_stats is None:
+            null_summary = "\n".join(
+                f"- {col}: {nulos} valores nulos" for col, nulos in zip(all_columns, null_counts)
+            )
+        else:
+            # Las muestras también muestran los nulos del archivo completo
+            rows, file_nulls = self.sample_stats
+            null_summary = "\n".join(
+                f"- {col}: {file_nulls.get(col, 0)} valores nulos "
+                f"({nulos} en la muestra)"
+                for col, nulos in zip(all_columns, null_counts)
+            )
+            null_summary = f"Muestra de {len(self.data)} de {rows} filas\n" +\
+                null_summary
 
         # Construye el mensaje final
+        saved = sum(self.memory_savings.values()) / 1024 ** 2
         summary = (
             f"Columnas de entrada: {', '.join(input_columns)}\n"
             f"Columna de salida: {output_column}\n\n"
-            f"Valores nulos:\n{null_summary}"
+            f"Valores nulos:\n{null_summary}\n\n"
+            f"Memoria ahorrada: {saved:.2f} MB"
         )
 
         # Muestra el mensaje en una ventana emergente
@@ -355,18 +932,13 @@ class DataTab(QWidget):
                 [self.selected_output_column]
 
             # Filter columns that are selected and contain null values
-            null_columns = [
-                column for column in selected_columns
-                if column in self.data.columns and self.data[column].isnull().any()]
-
-            unique_columns = []
-            for column in null_columns:
-                if column not in unique_columns:
-                    unique_columns.append(column)
+            null_columns = self.null_index.null_columns(
+                (column for column in selected_columns
+                 if column in self.data.columns), self.row_mask)
 
             # Create and display the input dialog for constants
             input_window = InputDialog(
-                unique_columns, "Introduzca las constantes", parent=self)
+                null_columns, "Introduzca las constantes", parent=self)
 
             # Use result() to handle the dialog's return value
             if input_window.exec_() == InputDialog.Accepted:
@@ -384,6 +956,59 @@ class DataTab(QWidget):
                     show_error(f"⚠ Error al aplicar el preprocesado: {\
                                str(e)} ⚠", self)
 
+    def handle_column_strategies(self):
+        """
+        Shows a dialog to choose the preprocessing method of each selected
+        column with null values, and applies all of them at once.
+        """
+        if not self.selected_input_columns or\
+                self.selected_output_column is None:
+            return
+        selected_columns = self.selected_input_columns + \
+            [self.selected_output_column]
+        null_columns = self.null_index.null_columns(
+            (column for column in selected_columns
+             if column in self.data.columns), self.row_mask)
+
+        dialog = StrategyDialog(null_columns, parent=self)
+        if dialog.exec_() != StrategyDialog.Accepted:
+            return
+        try:
+            self.preprocess_applier.set_strategies(dialog.get_strategies())
+        except ValueError as e:
+            show_error(f"⚠ Error al aplicar el preprocesado: {str(e)} ⚠",
+                       self)
+            return
+        self.apply_preprocessing(null_columns)
+
+    def handle_outliers(self):
+        """
+        Shows a dialog to choose how the outliers are found, and deletes
+        the rows with outliers in the selected columns from the row mask.
+        """
+        if not self.selected_input_columns or\
+                self.selected_output_column is None:
+            return
+        dialog = OutlierDialog(parent=self)
+        if dialog.exec_() != OutlierDialog.Accepted:
+            return
+        columns = list(dict.fromkeys(
+            self.selected_input_columns + [self.selected_output_column]))
+        try:
+            method, threshold = dialog.get_options()
+            counts = self.preprocess_applier.filter_outliers(
+                self.data, columns, method, threshold, self.row_mask)
+        except (ValueError, TypeError) as e:
+            show_error(f"⚠ Error al buscar valores atípicos: {str(e)} ⚠",
+                       self)
+            return
+
+        self.refresh_preprocessed()
+        summary = "\n".join(f"- {column}: {count} filas"
+                            for column, count in counts.items())
+        show_message(f"Valores atípicos por columna:\n{summary}\n\n"
+                     f"Filas restantes: {len(self.row_mask)}", self)
+
     def apply_preprocessing(self, columns=None):
         """
         Applies the selected preprocessing method to the loaded data
@@ -414,10 +1039,16 @@ class DataTab(QWidget):
 
             self.preprocess_applier.apply_preprocess(
                 self.data,
-                preprocess_columns)
+                preprocess_columns,
+                self.null_index,
+                self.row_mask)
+            self.update_history_buttons()
 
             # Update the data table with the preprocessed data
-            self.table.load_more_rows()
+            self.show_data()
+            for column in self.selected_input_columns +\
+                    [self.selected_output_column]:
+                self.highlight_column(column, True)
 
             self.on_output_column_selection_changed()
 
@@ -426,3 +1057,71 @@ class DataTab(QWidget):
         except Exception as e:
             show_error(f"Error al aplicar el preprocesado: {str(e)}", self)
             return False
+
+    def undo_preprocessing(self):
+        """
+        Undoes the last preprocessing method applied and updates the table.
+        """
+        history = self.preprocess_applier.history
+        if self.data is None or not history.can_undo:
+            return
+        try:
+            self.preprocess_applier.undo(self.data, self.null_index,
+                                         self.row_mask)
+        except Exception as e:
+            show_error(f"⚠ Error al deshacer el preprocesado: {str(e)} ⚠",
+                       self)
+            return
+        self.refresh_preprocessed()
+
+    def redo_preprocessing(self):
+        """
+        Applies again the last preprocessing method undone and updates
+        the table.
+        """
+        history = self.preprocess_applier.history
+        if self.data is None or not history.can_redo:
+            return
+        try:
+            self.preprocess_applier.redo(self.data, self.null_index,
+                                         self.row_mask)
+        except Exception as e:
+            show_error(f"⚠ Error al rehacer el preprocesado: {str(e)} ⚠",
+                       self)
+            return
+        self.refresh_preprocessed()
+
+    def refresh_preprocessed(self):
+        """
+        Shows the data again after undoing or redoing a preprocessing
+        method, and enables the preprocessing if the selected columns have
+        null values.
+        """
+        self.show_data()
+        columns = self.selected_input_columns + [self.selected_output_column]
+        for column in columns:
+            self.highlight_column(column, True)
+        self.null_columns = self.null_index.null_columns(columns,
+                                                         self.row_mask)
+        if self.null_columns:
+            self.enable_preprocessing()
+        else:
+            self.disable_preprocessing()
+        self.update_history_buttons()
+
+    def update_history_buttons(self):
+        """
+        Shows the undo and redo buttons according to the history of the
+        preprocessing.
+        """
+        history = self.preprocess_applier.history
+        self.preprocess_toolbar.update_history_buttons(history.can_undo,
+                                                       history.can_redo)
+
+    def show_data(self):
+        """
+        Shows the rows of the data kept by the row mask in the table.
+        """
+        rows = None if self.row_mask is None or self.row_mask.all\
+            else self.row_mask.positions()
+        self.table.load_data(self.data, batch_size=100, rows=rows)
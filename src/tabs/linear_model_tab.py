@@ -3,6 +3,8 @@ import numpy as np
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QSizePolicy, QPushButton,
                              QHBoxLayout, QApplication, QGroupBox)
 from models.linear_model import LinearModel
+from data_processing.pipeline import PreprocessPipeline
+from data_processing.scaling import Scaler
 from models.plot_manager import PlotManager
 from ui.components.groups import CreationGroup, InfoGroup, PredictionGroup, Qt
 from sklearn.metrics import mean_squared_error, r2_score
@@ -35,11 +37,22 @@ class LinearModelTab(QWidget):
         Canvas for displaying plots.
     loaded_model : Optional[dict]
         Dictionary containing the loaded model's information.
+    preprocessing : Optional[PreprocessPipeline]
+        Preprocessing applied to the data of the model, saved with it and
+        used to fill the empty inputs of a prediction.
+    row_mask : Optional[RowMask]
+        Rows of the dataset used by the model, owned by the tab.
+    scalers : dict[str, Scaler]
+        Scaler of each method, whose statistics are reused by the models
+        created in the tab.
+    scaling : Optional[Scaler]
+        Scaling of the inputs of the model, saved with it.
     """
 
     tab_list = []
 
-    def __init__(self, data=None, input_columns=None, output_column=None, loaded_model=None, parent=None):
+    def __init__(self, data=None, input_columns=None, output_column=None, loaded_model=None,
+                 preprocessing=None, row_mask=None, parent=None):
         """
         Initializes the LinearModelTab.
 
@@ -53,6 +66,11 @@ class LinearModelTab(QWidget):
             Name of the output column.
         loaded_model : Optional[dict]
             Pre-trained model to be loaded into the tab.
+        preprocessing : Optional[PreprocessPipeline]
+            Preprocessing applied to the data, ignored for loaded models,
+            which carry their own.
+        row_mask : Optional[RowMask]
+            Rows of the dataset used by the model. By default, every row.
         parent : QWidget, optional
             Parent widget.
         """
@@ -63,6 +81,15 @@ class LinearModelTab(QWidget):
         self.output_column = output_column
         self.model = None
         self.loaded_model = loaded_model
+        self.preprocessing = preprocessing
+        self.row_mask = row_mask
+        self.scalers = {}
+        self.scaling = None
+        if loaded_model and loaded_model.get("scaling"):
+            self.scaling = Scaler.from_dict(loaded_model["scaling"])
+        if loaded_model and loaded_model.get("preprocessing"):
+            self.preprocessing = PreprocessPipeline.from_dict(
+                loaded_model["preprocessing"])
         self.setup_ui()
 
         # Initialize based on whether a model is loaded or a new one is being created
@@ -82,9 +109,10 @@ class LinearModelTab(QWidget):
         # Group 1: Model creation (only shown if no model is loaded)
         if not self.loaded_model:
 
-            model_creation_group = CreationGroup()
-            model_creation_group.button.clicked.connect(self.create_model)
-            main_layout.addWidget(model_creation_group)
+            self.model_creation_group = CreationGroup()
+            self.model_creation_group.button.clicked.connect(
+                self.create_model)
+            main_layout.addWidget(self.model_creation_group)
 
         # Create horizontal layout for main content
         content_layout = QHBoxLayout()
@@ -158,6 +186,7 @@ class LinearModelTab(QWidget):
             self.output_column = model_data["columns"]["output"]
             self.prediction_group.create_prediction_inputs(
                 self.input_columns, self.model is not None)
+            self.show_input_fills()
             # Show prediction and save buttons
             self.prediction_group.enable_line_edits()
             self.prediction_group.button.setVisible(True)
@@ -171,13 +200,43 @@ class LinearModelTab(QWidget):
             show_error(f"Error al mostrar datos del modelo: {str(e)}", self)
             raise
 
+    def show_input_fills(self):
+        """
+        Shows in the empty prediction inputs the value used to fill them,
+        taken from the preprocessing of the data.
+        """
+        fills = self.input_fills()
+        for column, (_, line_edit) in zip(self.input_columns,
+                                          self.prediction_group.input_widgets):
+            if column in fills:
+                line_edit.setPlaceholderText(
+                    f"Vacío = {fills[column]:.4g}")
+
+    def input_fills(self) -> dict[str, float]:
+        """
+        Gets the fitted fill value of each input column.
+
+        Returns
+        -------
+        dict[str, float]
+            Value that replaces an empty input, for the input columns
+            that were filled by the preprocessing.
+        """
+        if self.preprocessing is None:
+            return {}
+        return {column: value
+                for column, value in self.preprocessing.fills.items()
+                if column in (self.input_columns or [])
+                and not np.isnan(value)}
+
     def initialize_from_loaded_model(self, loaded_model: dict):
         """Initializes the tab with details from a pre-loaded model."""
         try:
             # Reconstruct the model using its coefficients and intercept
             self.model = LinearModel(None,
                                      loaded_model["columns"]["input"],
-                                     loaded_model["columns"]["output"])
+                                     loaded_model["columns"]["output"],
+                                     scaler=self.scaling)
             self.model.coef_ = np.array(loaded_model["coefficients"])
             self.model.intercept_ = float(loaded_model["intercept"])
             self.model.formula = loaded_model["formula"]
@@ -224,9 +283,14 @@ class LinearModelTab(QWidget):
             # Check for null values in the selected columns
             selected_columns = self.input_columns + [self.output_column]
 
-            # Initialize and fit the model
+            # Initialize and fit the model, reusing the statistics of the
+            # scaling of previous models
+            method = self.model_creation_group.scaling
+            self.scaling = None if method is None else\
+                self.scalers.setdefault(method, Scaler(method))
             self.model = LinearModel(
-                self.data, self.input_columns, self.output_column)
+                self.data, self.input_columns, self.output_column,
+                self.row_mask, self.scaling)
             self.model.fit()
 
             # Display the model's details on the UI
@@ -247,14 +311,15 @@ class LinearModelTab(QWidget):
 
             # Create a visualization based on the number of input columns
             if len(self.model.input_columns) == 1:
-                self.plot_manager.plot2d(self.model.x, self.model.y,
-                                         self.model.y_pred, selected_columns)
+                self.plot_manager.plot2d(self.model.x_columns[0],
+                                         self.model.y, self.model.y_pred,
+                                         selected_columns)
                 self.plot_manager.draw()
             elif len(self.model.input_columns) == 2:
-                x_array = [x[0] for x in self.model.x]
-                y_array = [x[1] for x in self.model.x]
-                x_grid, y_grid = np.meshgrid(np.linspace(min(x_array), max(
-                    x_array), 20), np.linspace(min(y_array), max(y_array), 20))
+                x_array, y_array = self.model.x_columns
+                x_grid, y_grid = np.meshgrid(
+                    np.linspace(x_array.min(), x_array.max(), 20),
+                    np.linspace(y_array.min(), y_array.max(), 20))
                 z_grid = self.model.coef_[
                     0] * x_grid + self.model.coef_[1] * y_grid + self.model.intercept_
                 self.plot_manager.plot3d(
@@ -321,6 +386,10 @@ class LinearModelTab(QWidget):
                     "output": self.output_column
                 }
             }
+            if self.preprocessing is not None:
+                model_data["preprocessing"] = self.preprocessing.to_dict()
+            if self.scaling is not None:
+                model_data["scaling"] = self.scaling.to_dict()
 
             # Save model dialog
             file_path = save_file_dialog()
@@ -343,10 +412,16 @@ class LinearModelTab(QWidget):
         # Refresh the UI
         self.layout().update()
 
-        # Retrieve user-entered values from input fields
+        # Retrieve user-entered values from input fields, filling the empty
+        # ones as the nulls of the training data were filled
+        fills = self.input_fills()
         input_values = []
-        for label, line_edit in self.prediction_group.input_widgets:
+        for column, (label, line_edit) in zip(
+                self.input_columns, self.prediction_group.input_widgets):
             value = line_edit.text()
+            if not value and column in fills:
+                input_values.append(fills[column])
+                continue
             if not value:
                 show_warning(
                     "Debe rellenar todas las celdas para realizar predicción.", self)
@@ -96,8 +96,8 @@ class ColumnSelector(QWidget):
         self.input_column_selector.clear()
         self.output_column_selector.clear()
 
-        numeric_columns = data.select_dtypes(
-            include=['int64', 'float64']).columns
+        # Any numeric width is accepted, as columns may have been downcast
+        numeric_columns = data.select_dtypes(include='number').columns
         numeric_columns = [
             col for col in data.columns if col in numeric_columns]
 
@@ -1,6 +1,8 @@
 from PyQt5.QtWidgets import QTableWidget, QTableWidgetItem, QAbstractItemView, QAbstractScrollArea, QStyledItemDelegate
 from PyQt5.QtCore import Qt, QTimer
 from pandas import DataFrame
+from numpy import floating, ndarray
+from typing import Optional
 
 
 class HighlightDelegate(QStyledItemDelegate):
@@ -23,6 +25,7 @@ class DataTable(QTableWidget):
         super().__init__(parent)
         self.init_ui()
         self._data = None  # Full DataFrame
+        self._rows = None  # Positions of the rows shown, None for all
         self.loaded_rows = 0  # Rows currently loaded
         self.batch_size = 100  # Number of rows to load at a time
 
@@ -49,7 +52,8 @@ class DataTable(QTableWidget):
         self.setItemDelegate(HighlightDelegate())
         self.verticalScrollBar().valueChanged.connect(self.on_scroll)
 
-    def load_data(self, data: DataFrame, batch_size: int = 100):
+    def load_data(self, data: DataFrame, batch_size: int = 100,
+                  rows: Optional[ndarray] = None):
         """
         Initializes the table with _data for lazy loading.
 
@@ -59,12 +63,17 @@ class DataTable(QTableWidget):
             The DataFrame to be loaded lazily.
         batch_size : int
             Number of rows to load per batch.
+        rows : ndarray, optional
+            Positions of the rows to show, so deleted rows are hidden
+            without copying the DataFrame. By default, every row.
         """
         self._data = data
+        self._rows = rows
         self.batch_size = batch_size
         self.loaded_rows = 0
 
-        # Setup table headers
+        # Setup table headers, dropping the rows of the previous data
+        self.setRowCount(0)
         self.setColumnCount(self._data.shape[1])
         self.setHorizontalHeaderLabels(self._data.columns)
 
@@ -80,7 +89,9 @@ class DataTable(QTableWidget):
 
         # Determine the next range of rows to load
         start_row = self.loaded_rows
-        end_row = min(self.loaded_rows + self.batch_size, len(self._data))
+        total_rows = len(self._data) if self._rows is None\
+            else len(self._rows)
+        end_row = min(self.loaded_rows + self.batch_size, total_rows)
 
         if start_row >= end_row:  # No more rows to load
             return
@@ -90,10 +101,11 @@ class DataTable(QTableWidget):
         # Load rows into the table
         float_precision = 4
         for i in range(start_row, end_row):
+            row = i if self._rows is None else self._rows[i]
             for j in range(self._data.shape[1]):
-                cell_value = self._data.iat[i, j]
+                cell_value = self._data.iat[row, j]
                 # Format float values
-                if isinstance(cell_value, float):
+                if isinstance(cell_value, (float, floating)):
                     cell_value = f"{cell_value:.{float_precision}f}"
                 item = QTableWidgetItem(str(cell_value))
                 # Initialize unhighlighted
@@ -118,6 +130,14 @@ class DataTable(QTableWidget):
             if self.item(0, col).data(Qt.UserRole + 1):
                 self.highlight_column(col, True)
 
+    def column_index(self, column: str) -> int:
+        """
+        Returns the position of a column in the table, or -1 if it is not shown
+        """
+        if self._data is None or column not in self._data.columns:
+            return -1
+        return self._data.columns.get_loc(column)
+
     def highlight_column(self, column_index: int, highlight: bool):
         """
         Highlights a specific column in the table.
@@ -1,4 +1,5 @@
-from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QHBoxLayout, QScrollArea, QPushButton, QFrame, QLabel, QWidget, QLineEdit
+from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QHBoxLayout, QScrollArea, QPushButton, QFrame, QLabel, QWidget, QLineEdit, QComboBox
+from typing import Optional
 from models.description import ModelDescription, Qt
 
 
@@ -26,8 +27,13 @@ class CreationGroup(BasicGroup):
        Main layout of the group.
     button : QPushButton
         Main button of the layout.
+    scaling_selector : QComboBox
+        Dropdown with the scaling of the input columns.
     """
 
+    SCALINGS = [(None, "Sin escalado"), ("standard", "Estándar"),
+                ("minmax", "Mín-máx"), ("robust", "Robusto")]
+
     def __init__(self):
         """
         Initialices the whole class.
@@ -36,13 +42,19 @@ class CreationGroup(BasicGroup):
         super().__init__("Creación del modelo")
         self.setFixedHeight(100)
         self._button = QPushButton("Crear Modelo de Regresión Lineal")
+        self._scaling_selector = QComboBox()
         self.init_ui()
 
     def init_ui(self):
         self._layout = QHBoxLayout()
         self._button.setFixedSize(350, 50)
+        self._scaling_selector.addItems(
+            [label for _, label in self.SCALINGS])
+        self._scaling_selector.setToolTip("Escalado de las columnas de entrada")
         self._layout.setContentsMargins(0, 0, 0, 0)
         self._layout.addWidget(self._button, Qt.AlignCenter)
+        self._layout.addWidget(QLabel("Escalado:"))
+        self._layout.addWidget(self._scaling_selector)
         self.setLayout(self._layout)
 
     @property
@@ -53,6 +65,18 @@ class CreationGroup(BasicGroup):
     def button(self) -> QPushButton:
         return self._button
 
+    @property
+    def scaling_selector(self) -> QComboBox:
+        return self._scaling_selector
+
+    @property
+    def scaling(self) -> Optional[str]:
+        """
+        Gets the selected scaling method, None if the columns are not
+        scaled.
+        """
+        return self.SCALINGS[self._scaling_selector.currentIndex()][0]
+
 
 class InfoGroup(BasicGroup):
     """
@@ -6,7 +6,8 @@ class PreprocessToolbar(QWidget):
     Preprocessing toolbar that allows selection of various data preprocessing methods.
 
     This toolbar contains buttons representing preprocessing methods (delete nulls,
-    mean, median, constants) and an apply button.
+    mean, median, constants, nearest neighbours, a method for each column), a
+    button to remove outliers and buttons to undo and redo the methods applied.
 
     Parameters
     ----------
@@ -17,8 +18,13 @@ class PreprocessToolbar(QWidget):
     ----------
     buttons : dict
         Dictionary storing the buttons for preprocessing methods.
-    apply_button : QPushButton
-        Button to apply the selected preprocessing method.
+    outliers_button : QPushButton
+        Button to remove the rows with outliers, shown even if there are no
+        null values.
+    undo_button : QPushButton
+        Button to undo the last preprocessing method applied.
+    redo_button : QPushButton
+        Button to apply again the last preprocessing method undone.
     """
 
     def __init__(self, parent=None):
@@ -43,6 +49,8 @@ class PreprocessToolbar(QWidget):
             ('mean', 'Media'),
             ('median', 'Mediana'),
             ('constant', 'Constantes'),
+            ('knn', 'Vecinos (KNN)'),
+            ('columns', 'Por columna'),
         ]
 
         for method, label in button_configs:
@@ -54,6 +62,22 @@ class PreprocessToolbar(QWidget):
             button.clicked.connect(
                 lambda _, method=method: self.handle_button_click(method))
 
+        self.outliers_button = QPushButton('Atípicos')
+        self.outliers_button.setToolTip(
+            "Eliminar las filas con valores atípicos")
+        self.outliers_button.hide()
+        layout.addWidget(self.outliers_button)
+
+        # Undo and redo are shown once a method has been applied
+        layout.addStretch()
+        self.undo_button = QPushButton("↶ Deshacer")
+        self.undo_button.setToolTip("Deshacer el último preprocesado (Ctrl+Z)")
+        self.redo_button = QPushButton("↷ Rehacer")
+        self.redo_button.setToolTip("Rehacer el preprocesado deshecho (Ctrl+Y)")
+        for button in (self.undo_button, self.redo_button):
+            button.hide()
+            layout.addWidget(button)
+
         self.setLayout(layout)
 
     def handle_button_click(self, method):
@@ -85,3 +109,21 @@ class PreprocessToolbar(QWidget):
         """
         for button in self.buttons.values():
             button.hide()
+
+    def update_history_buttons(self, can_undo: bool, can_redo: bool):
+        """
+        Shows the undo and redo buttons while there is something to undo or
+        redo, and enables each one only when it can be used.
+
+        Parameters
+        ----------
+        can_undo : bool
+            Whether there is a preprocessing method to undo.
+        can_redo : bool
+            Whether there is a preprocessing method to redo.
+        """
+        visible = can_undo or can_redo
+        self.undo_button.setVisible(visible)
+        self.redo_button.setVisible(visible)
+        self.undo_button.setEnabled(can_undo)
+        self.redo_button.setEnabled(can_redo)
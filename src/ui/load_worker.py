@@ -0,0 +1,111 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from typing import Callable
+import threading
+from data_processing.import_module import LoadCancelled
+
+
+class LoadSignals(QObject):
+    """
+    Signals emitted by a `LoadWorker` to the GUI thread.
+
+    Attributes
+    ----------
+    progress : pyqtSignal
+        Emitted with the bytes read, the total bytes and the rows parsed.
+    preview : pyqtSignal
+        Emitted with the first batch read, before the load finishes.
+    finished : pyqtSignal
+        Emitted with the result of the function.
+    error : pyqtSignal
+        Emitted with the error message if the function fails.
+    cancelled : pyqtSignal
+        Emitted if the load is cancelled by the user.
+    """
+    progress = pyqtSignal('qint64', 'qint64', 'qint64')
+    preview = pyqtSignal(object)
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class LoadWorker(QRunnable):
+    """
+    Runs a loading function in a thread of a `QThreadPool`.
+
+    The function receives a `progress_callback` and a `batch_callback`
+    that forward the progress and the first batch read to the GUI thread
+    through `signals`. Cancelling the worker makes the next callback raise
+    `LoadCancelled`, which stops the reader between two batches.
+
+    Attributes
+    ----------
+    signals : LoadSignals
+        Signals connected by the GUI to follow the load.
+    """
+
+    def __init__(self, function: Callable, *args, **kwargs):
+        """
+        Initializes the worker.
+
+        Parameters
+        ----------
+        function : callable
+            Function that loads the data. It must accept the
+            `progress_callback` and `batch_callback` keyword arguments.
+        *args, **kwargs
+            Arguments passed to the function.
+        """
+        super().__init__()
+        self.signals = LoadSignals()
+        self._function = function
+        self._args = args
+        self._kwargs = kwargs
+        self._cancel_event = threading.Event()
+        self._previewed = False
+
+    def cancel(self) -> None:
+        """
+        Asks the worker to stop after the batch being read.
+        """
+        self._cancel_event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def run(self) -> None:
+        """
+        Runs the function and emits its result or its error.
+        """
+        try:
+            result = self._function(*self._args,
+                                    progress_callback=self._on_progress,
+                                    batch_callback=self._on_batch,
+                                    **self._kwargs)
+        except LoadCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            if self.is_cancelled:
+                self.signals.cancelled.emit()
+            else:
+                self.signals.error.emit(str(e))
+        else:
+            if self.is_cancelled:
+                self.signals.cancelled.emit()
+            else:
+                self.signals.finished.emit(result)
+
+    def _on_progress(self, bytes_read: int, total_bytes: int,
+                     rows: int) -> None:
+        self._check_cancelled()
+        self.signals.progress.emit(bytes_read, total_bytes, rows)
+
+    def _on_batch(self, batch) -> None:
+        self._check_cancelled()
+        if not self._previewed:
+            self._previewed = True
+            self.signals.preview.emit(batch)
+
+    def _check_cancelled(self) -> None:
+        if self._cancel_event.is_set():
+            raise LoadCancelled()
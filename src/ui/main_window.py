@@ -165,7 +165,7 @@ class MainWindow(QMainWindow):
 
         # Connect events for creating or loading a linear model
         self.tabs_counter = 0
-        self.data_tab.column_selector.confirm_button.clicked.connect(
+        self.data_tab.selection_confirmed.connect(
             self.create_linear_model_tab)
         self.data_tab.model_button.clicked.connect(self.load_model_open_tab)
 
@@ -183,7 +183,8 @@ class MainWindow(QMainWindow):
         # Check for null values in selected columns
         selected_columns = self.data_tab.selected_input_columns + \
             [self.data_tab.selected_output_column]
-        has_nulls = self.data_tab.data[selected_columns].isnull().any().any()
+        has_nulls = self.data_tab.null_index.any(selected_columns,
+                                                 self.data_tab.row_mask)
 
         if has_nulls:
             show_error(
@@ -194,17 +195,21 @@ class MainWindow(QMainWindow):
 
         # Create a new linear model tab
         LinearModelTab(
-            data=self.data_tab.data,
+            data=self.data_tab.model_data(),
             input_columns=self.data_tab.selected_input_columns,
             output_column=self.data_tab.selected_output_column,
-            loaded_model=None)
+            loaded_model=None,
+            preprocessing=self.data_tab.preprocess_applier.pipeline.copy(),
+            row_mask=self.data_tab.row_mask.copy())
 
         # Clear the description of the newly created tab
         LinearModelTab.tab_list[-1].model_description.clear_description()
 
-        # Add the new tab to the tab widget
-        self.tab_widget.addTab(LinearModelTab.tab_list[-1],
-                               f"Modelo {self.tabs_counter}")
+        # Add the new tab to the tab widget, marking models of sampled data
+        title = f"Modelo {self.tabs_counter}"
+        if self.data_tab.sample_stats is not None:
+            title += " (muestra)"
+        self.tab_widget.addTab(LinearModelTab.tab_list[-1], title)
 
         # Close any old tabs with untrained models
         if len(LinearModelTab.tab_list) > 1 and\
@@ -263,3 +268,15 @@ class MainWindow(QMainWindow):
         QMainWindow.resizeEvent(self, event)
         if hasattr(self, "data_tab") and self.data_tab.data is not None:
             self.data_tab.table.fill_area(self.data_tab.data.shape[1])
+
+    def closeEvent(self, event):
+        """
+        Removes the files of the memory-mapped columns before closing.
+
+        Parameters
+        ----------
+        event : QCloseEvent
+            The close event triggered when the window is closed.
+        """
+        self.data_tab.set_column_store(None)
+        QMainWindow.closeEvent(self, event)
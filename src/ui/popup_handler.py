@@ -1,5 +1,6 @@
 from PyQt5.QtWidgets import (
-    QDialog, QDialogButtonBox, QLineEdit, QFormLayout, QMessageBox, QFileDialog)
+    QDialog, QDialogButtonBox, QLineEdit, QFormLayout, QMessageBox, QFileDialog,
+    QComboBox, QHBoxLayout)
 from PyQt5 import QtCore
 
 
@@ -60,6 +61,306 @@ class InputDialog(QDialog):
         return tuple(input.text() for input in self.inputs)
 
 
+class SqliteImportDialog(QDialog):
+    """
+    A dialog window to choose how a SQLite database is imported.
+
+    Lists the tables of the database with their row counts and lets the user
+    write an optional filter, row limit and sample fraction.
+
+    Attributes
+    ----------
+    table_selector : QComboBox
+        Dropdown with the tables of the database.
+    where_input : QLineEdit
+        SQL condition the rows must satisfy.
+    limit_input : QLineEdit
+        Maximum number of rows to read.
+    sample_input : QLineEdit
+        Fraction of rows to read.
+    """
+
+    def __init__(self, tables: list[tuple[str, int]], parent=None):
+
+        super().__init__(parent, QtCore.Qt.WindowCloseButtonHint)
+        self.setWindowTitle("Importar base de datos SQLite")
+        self.tables = tables
+
+        # Create "Aceptar" and "Cancelar" buttons
+        self.buttonBox = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self)
+
+        # Table list with row counts
+        self.table_selector = QComboBox(self)
+        for name, rows in tables:
+            self.table_selector.addItem(f"{name} ({rows} filas)")
+
+        # Optional filters pushed down into the query
+        self.where_input = QLineEdit(self)
+        self.where_input.setPlaceholderText("Opcional, p. ej. edad > 30")
+        self.limit_input = QLineEdit(self)
+        self.limit_input.setPlaceholderText("Opcional, número de filas")
+        self.sample_input = QLineEdit(self)
+        self.sample_input.setPlaceholderText("Opcional, fracción entre 0 y 1")
+
+        layout = QFormLayout(self)
+        layout.addRow("Tabla", self.table_selector)
+        layout.addRow("Filtro (WHERE)", self.where_input)
+        layout.addRow("Límite de filas", self.limit_input)
+        layout.addRow("Muestra", self.sample_input)
+        layout.addWidget(self.buttonBox)
+
+        # Connect the buttons to their respective methods
+        self.buttonBox.accepted.connect(self.accept)
+        self.buttonBox.rejected.connect(self.reject)
+
+    def get_options(self) -> dict:
+        """
+        Retrieves the import options chosen by the user.
+
+        Returns
+        -------
+        dict
+            Table, filter, limit and sample to use with `load_file`.
+
+        Raises
+        ------
+        ValueError
+            If the limit or the sample are not valid numbers.
+        """
+        options = {"table": self.tables[self.table_selector.currentIndex()][0]}
+        if self.where_input.text().strip():
+            options["where"] = self.where_input.text().strip()
+        try:
+            if self.limit_input.text().strip():
+                options["limit"] = int(self.limit_input.text())
+            if self.sample_input.text().strip():
+                options["sample"] = float(self.sample_input.text())
+        except ValueError:
+            raise ValueError("El límite debe ser un entero y la muestra un "
+                             "número con '.' como separador de decimales")
+        return options
+
+
+class ExcelImportDialog(QDialog):
+    """
+    A dialog window to choose the sheet and header row of an Excel file.
+
+    Attributes
+    ----------
+    sheet_selector : QComboBox
+        Dropdown with the sheets of the workbook.
+    header_input : QLineEdit
+        Number (starting at 1) of the row with the column names.
+    """
+
+    def __init__(self, sheets: list[str], parent=None):
+
+        super().__init__(parent, QtCore.Qt.WindowCloseButtonHint)
+        self.setWindowTitle("Importar archivo Excel")
+
+        # Create "Aceptar" and "Cancelar" buttons
+        self.buttonBox = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self)
+
+        self.sheet_selector = QComboBox(self)
+        self.sheet_selector.addItems(sheets)
+        self.header_input = QLineEdit("1", self)
+
+        layout = QFormLayout(self)
+        layout.addRow("Hoja", self.sheet_selector)
+        layout.addRow("Fila de cabecera", self.header_input)
+        layout.addWidget(self.buttonBox)
+
+        # Connect the buttons to their respective methods
+        self.buttonBox.accepted.connect(self.accept)
+        self.buttonBox.rejected.connect(self.reject)
+
+    def get_options(self) -> dict:
+        """
+        Retrieves the import options chosen by the user.
+
+        Returns
+        -------
+        dict
+            Sheet and header row (starting at 0) to use with `load_file`.
+
+        Raises
+        ------
+        ValueError
+            If the header row is not a positive integer.
+        """
+        try:
+            header = int(self.header_input.text()) - 1
+        except ValueError:
+            header = -1
+        if header < 0:
+            raise ValueError("La fila de cabecera debe ser un entero mayor"
+                             " que 0")
+        return {"sheet": self.sheet_selector.currentText(), "header": header}
+
+
+class StrategyDialog(QDialog):
+    """
+    A dialog window to choose a preprocessing method for each column.
+
+    Attributes
+    ----------
+    selectors : dict[str, QComboBox]
+        Dropdown with the method of each column.
+    constants : dict[str, QLineEdit]
+        Value of each column, used by the "Constante", "Cuantil" and
+        "Vecinos (KNN)" methods.
+    """
+
+    METHODS = [("mean", "Media"), ("median", "Mediana"),
+               ("delete", "Eliminar"), ("constant", "Constante"),
+               ("quantile", "Cuantil"), ("knn", "Vecinos (KNN)")]
+
+    def __init__(self, columns: list[str], parent=None):
+
+        super().__init__(parent, QtCore.Qt.WindowCloseButtonHint)
+        self.setWindowTitle("Preprocesado por columna")
+
+        # Create "Aceptar" and "Cancelar" buttons
+        self.buttonBox = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self)
+
+        layout = QFormLayout(self)
+        self.selectors = {}
+        self.constants = {}
+        for column in columns:
+            selector = QComboBox(self)
+            selector.addItems([label for _, label in self.METHODS])
+            constant = QLineEdit(self)
+            constant.setPlaceholderText("Valor")
+            constant.setEnabled(False)
+            selector.currentIndexChanged.connect(
+                lambda index, constant=constant: constant.setEnabled(
+                    self.METHODS[index][0] in ("constant", "quantile",
+                                               "knn")))
+            row = QHBoxLayout()
+            row.addWidget(selector)
+            row.addWidget(constant)
+            layout.addRow(column, row)
+            self.selectors[column] = selector
+            self.constants[column] = constant
+        layout.addWidget(self.buttonBox)
+
+        # Connect the buttons to their respective methods
+        self.buttonBox.accepted.connect(self.accept)
+        self.buttonBox.rejected.connect(self.reject)
+
+    def get_strategies(self) -> dict:
+        """
+        Retrieves the method chosen for each column.
+
+        Returns
+        -------
+        dict
+            Strategy of each column to use with `PreprocessApplier`.
+
+        Raises
+        ------
+        ValueError
+            If a constant is not a valid number, a quantile is not
+            between 0 and 1 or a number of neighbours is not a positive
+            integer.
+        """
+        strategies = {}
+        for column, selector in self.selectors.items():
+            method = self.METHODS[selector.currentIndex()][0]
+            if method not in ("constant", "quantile", "knn"):
+                strategies[column] = method
+                continue
+            text = self.constants[column].text()
+            if method == "knn":
+                if not text.isdigit() or int(text) < 1:
+                    raise ValueError(f"El número de vecinos de la columna "
+                                     f"'{column}' debe ser un entero "
+                                     f"positivo")
+                strategies[column] = (method, int(text))
+                continue
+            try:
+                value = float(text)
+            except ValueError:
+                raise ValueError(f"No se puede convertir '{text}' de la "
+                                 f"columna '{column}' a un número decimal")
+            if method == "quantile" and not 0 <= value <= 1:
+                raise ValueError(f"El cuantil de la columna '{column}' "
+                                 f"debe estar entre 0 y 1")
+            strategies[column] = (method, value)
+        return strategies
+
+
+class OutlierDialog(QDialog):
+    """
+    A dialog window to choose how the outliers are found.
+
+    Attributes
+    ----------
+    method_selector : QComboBox
+        Dropdown with the detection method.
+    threshold : QLineEdit
+        Distance from which a value is an outlier, empty for the default
+        of the method.
+    """
+
+    METHODS = [("iqr", "Rango intercuartílico (IQR)"),
+               ("zscore", "Puntuación Z"),
+               ("mad", "Desviación absoluta mediana (MAD)")]
+
+    def __init__(self, parent=None):
+
+        super().__init__(parent, QtCore.Qt.WindowCloseButtonHint)
+        self.setWindowTitle("Eliminar valores atípicos")
+
+        # Create "Aceptar" and "Cancelar" buttons
+        self.buttonBox = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self)
+
+        layout = QFormLayout(self)
+        self.method_selector = QComboBox(self)
+        self.method_selector.addItems([label for _, label in self.METHODS])
+        self.threshold = QLineEdit(self)
+        self.threshold.setPlaceholderText("Por defecto")
+        layout.addRow("Método", self.method_selector)
+        layout.addRow("Umbral", self.threshold)
+        layout.addWidget(self.buttonBox)
+
+        # Connect the buttons to their respective methods
+        self.buttonBox.accepted.connect(self.accept)
+        self.buttonBox.rejected.connect(self.reject)
+
+    def get_options(self) -> tuple[str, float | None]:
+        """
+        Retrieves the chosen method and threshold.
+
+        Returns
+        -------
+        tuple[str, float | None]
+            Method and threshold to use with `find_outliers`, None for the
+            default threshold.
+
+        Raises
+        ------
+        ValueError
+            If the threshold is not a positive number.
+        """
+        method = self.METHODS[self.method_selector.currentIndex()][0]
+        text = self.threshold.text().strip()
+        if not text:
+            return method, None
+        try:
+            threshold = float(text)
+        except ValueError:
+            raise ValueError(f"No se puede convertir '{text}' a un número "
+                             f"decimal")
+        if not threshold > 0:
+            raise ValueError("El umbral debe ser un número positivo")
+        return method, threshold
+
+
 def show_message(message: str, parent=None):
     """
     Shows a message in a pop up window
@@ -128,20 +429,28 @@ def show_suggestion(title: str, text: str, informative_text: str, parent=None):
     return msg_box.clickedButton() == no_button
 
 
-def open_file_dialog(parent=None) -> str:
+def open_file_dialog(parent=None) -> str | list[str]:
     """
-    Shows the dialog to open files and returns the selected directory
+    Shows the dialog to open files and returns the selected directory.
+    Several files can be selected to load them as a single dataset.
 
     Returns
     -----------
-        file_path: str
+        file_path: str or list[str]
+            Path of the file, list of paths if several files are
+            selected, or an empty string if none is selected.
     """
     options = QFileDialog.Options()
-    res = "Todos los Archivos (*.*);;Archivos CSV (*.csv);;Archivos Excel"
+    res = "Todos los Archivos (*.*);;Archivos CSV (*.csv *.tsv *.csv.gz"
+    res += " *.csv.bz2 *.csv.xz *.csv.zst *.tsv.gz *.tsv.bz2 *.tsv.xz"
+    res += " *.tsv.zst);;Archivos Excel"
     res += " (*.xlsx *.xls);;Base de datos SQLite (*.sqlite *.db)"
-    file_path, _ = QFileDialog.getOpenFileName(parent, "Seleccionar archivo",
-                                               "", res, options=options)
-    return file_path
+    res += ";;Archivos columnares (*.parquet *.pq *.feather *.arrow *.ipc)"
+    file_paths, _ = QFileDialog.getOpenFileNames(
+        parent, "Seleccionar archivo", "", res, options=options)
+    if len(file_paths) == 1:
+        return file_paths[0]
+    return file_paths or ""
 
 
 def save_file_dialog(parent=None) -> str:
@@ -0,0 +1,48 @@
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from data_processing.column_buffer import ColumnBuffer
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+def test_small_tail_is_not_copied():
+    """Test that a reserve slightly too large does not copy the columns."""
+    buffer = ColumnBuffer()
+    buffer.append(pd.DataFrame({'x': np.arange(10.0)}))
+    buffer.reserve(105)
+    buffer.append(pd.DataFrame({'x': np.arange(10.0, 100.0)}))
+    stored = buffer._columns['x']
+
+    data = buffer.to_dataframe()
+
+    assert np.shares_memory(data['x'].to_numpy(), stored)
+    np.testing.assert_array_equal(data['x'], np.arange(100.0))
+
+
+def test_large_tail_is_released():
+    """Test that a reserve much too large is trimmed to the rows read."""
+    buffer = ColumnBuffer(1000)
+    buffer.append(pd.DataFrame({'x': np.arange(100), 's': ['a'] * 100}))
+
+    data = buffer.to_dataframe()
+
+    assert buffer._columns['x'].shape == (100,)
+    np.testing.assert_array_equal(data['x'], np.arange(100))
+    assert data['s'].tolist() == ['a'] * 100
+
+
+def test_empty_batch_keeps_dtypes():
+    """Test that a batch without rows does not fix the dtypes."""
+    buffer = ColumnBuffer()
+    buffer.append(pd.DataFrame(columns=['x', 's']))
+    buffer.append(pd.DataFrame({'x': [1, 2], 's': ['a', 'b']}))
+
+    data = buffer.to_dataframe()
+
+    assert data['x'].dtype == np.int64
+    assert pd.api.types.is_string_dtype(data['s'])
+    assert data['s'].dtype != object
@@ -0,0 +1,115 @@
+import pytest
+import os
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from data_processing.column_store import (MappedColumnStore, map_dataframe,
+                                         remove_stale_stores)
+from models.linear_model import LinearModel
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+@pytest.fixture
+def sample_data():
+    """Create a dataset with numeric, nullable and text columns."""
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=1000)
+    return pd.DataFrame({
+        'x': x,
+        'n': np.arange(1000, dtype=np.int32),
+        'z': np.where(np.arange(1000) % 7 == 0, np.nan, x),
+        'group': np.where(x > 0, 'a', 'b'),
+        'y': 2 * x + 1,
+    }, index=np.arange(1000, 2000))
+
+
+def test_map_dataframe_preserves_data(sample_data, tmp_path):
+    """Test that mapping a DataFrame keeps its values, dtypes and index."""
+    mapped, store = map_dataframe(sample_data, str(tmp_path))
+    pd.testing.assert_frame_equal(mapped, sample_data)
+    # The files are kept until the store is closed
+    assert os.path.isdir(store.directory)
+    store.close()
+    assert not os.path.exists(store.directory)
+    pd.testing.assert_frame_equal(mapped, sample_data)
+
+
+def test_numeric_columns_are_mapped(sample_data, tmp_path):
+    """Test that only the numeric columns are memory maps."""
+    store = MappedColumnStore.from_dataframe(sample_data, str(tmp_path))
+    for name in ('x', 'n', 'z', 'y'):
+        assert isinstance(store.column(name), np.memmap)
+    assert not isinstance(store.column('group'), np.memmap)
+    assert len(store) == 1000
+    assert store.columns == list(sample_data.columns)
+
+
+def test_dataframe_shares_mapped_memory(sample_data, tmp_path):
+    """Test that the DataFrames built from the store do not copy columns."""
+    store = MappedColumnStore.from_dataframe(sample_data, str(tmp_path))
+    first = store.to_dataframe()
+    second = store.to_dataframe(['x', 'y'])
+    assert np.shares_memory(first['x'].to_numpy(), store.column('x'))
+    assert np.shares_memory(second['x'].to_numpy(), store.column('x'))
+
+
+def test_writes_do_not_change_the_store(sample_data, tmp_path):
+    """Test that editing a mapped DataFrame leaves the store unchanged."""
+    store = MappedColumnStore.from_dataframe(sample_data, str(tmp_path))
+    data = store.to_dataframe()
+    other = store.to_dataframe(['x'])
+    data.loc[data.index[0], 'x'] = 100.0
+    data.fillna({'z': 0.0}, inplace=True)
+    assert data['x'].iloc[0] == 100.0
+    assert other['x'].iloc[0] == sample_data['x'].iloc[0]
+    assert store.column('x')[0] == sample_data['x'].iloc[0]
+
+
+def test_columns_are_read_only(sample_data, tmp_path):
+    """Test that the mapped columns and the views of a model are
+    read-only, and that preprocessing replaces the columns it fills."""
+    from data_processing.dataset_calc import PreprocessApplier
+    from data_processing.null_index import NullIndex
+    mapped, store = map_dataframe(sample_data, str(tmp_path))
+    assert not store.column('z').flags.writeable
+    assert not mapped['z'].to_numpy().flags.writeable
+    model = LinearModel(mapped, ['x', 'z'], 'y')
+    with pytest.raises(ValueError):
+        model.x_columns[0][0] = 0.0
+
+    applier = PreprocessApplier()
+    applier.set_current_method('mean')
+    applier.apply_preprocess(mapped, ['z'], NullIndex.from_dataframe(mapped))
+    assert not mapped['z'].isna().any()
+    assert np.isnan(model.x_columns[1]).sum() == 143
+    assert np.isnan(store.column('z')).sum() == 143
+
+
+def test_linear_model_uses_column_views(sample_data, tmp_path):
+    """Test that a model fitted on mapped data keeps views of the columns."""
+    mapped, store = map_dataframe(sample_data, str(tmp_path))
+    model = LinearModel(mapped, ['x', 'n'], 'y')
+    assert np.shares_memory(model.x_columns[0], mapped['x'].to_numpy())
+    model.fit()
+    assert model.x.shape == (1000, 2)
+    assert model.coef_[0] == pytest.approx(2)
+    assert model.intercept_ == pytest.approx(1)
+
+
+def test_remove_stale_stores(sample_data, tmp_path):
+    """Test that only the old directories of stores are removed."""
+    stale = MappedColumnStore.from_dataframe(sample_data, str(tmp_path))
+    os.utime(stale.directory, (0, 0))
+    recent = MappedColumnStore.from_dataframe(sample_data, str(tmp_path))
+    other = tmp_path / "other"
+    other.mkdir()
+    os.utime(other, (0, 0))
+
+    assert remove_stale_stores(str(tmp_path)) == 1
+    assert not os.path.exists(stale.directory)
+    assert os.path.isdir(recent.directory)
+    assert other.is_dir()
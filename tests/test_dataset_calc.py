@@ -0,0 +1,109 @@
+import pytest
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from data_processing.dataset_calc import PreprocessApplier, none_count
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+@pytest.fixture
+def sample_data():
+    """Create a dataset with nulls in float64, float32 and text columns."""
+    return pd.DataFrame({
+        'a': [1.0, np.nan, 3.0, 4.0],
+        'b': np.array([1.0, np.nan, 2.0, np.nan], dtype=np.float32),
+        'c': [np.nan, 1.0, 2.0, 3.0],
+        'd': [np.nan, 5.0, 5.0, 5.0],
+        'text': ['x', None, 'y', 'z'],
+        'n': [1, 2, 3, 4],
+    })
+
+
+@pytest.mark.parametrize("method, expected", [
+    ("mean", [1.0, 8 / 3, 3.0, 4.0]),
+    ("median", [1.0, 3.0, 3.0, 4.0]),
+])
+def test_statistic_methods(sample_data, method, expected):
+    """Test that mean and median fill the nulls of each column."""
+    applier = PreprocessApplier()
+    applier.set_current_method(method)
+    applier.apply_preprocess(sample_data, ['a', 'b'])
+    assert sample_data['a'].tolist() == pytest.approx(expected)
+    assert none_count(sample_data, ['a', 'b']) == [0, 0]
+
+
+def test_constant_method(sample_data):
+    """Test that constants fill only the columns that have one."""
+    applier = PreprocessApplier()
+    applier.set_current_method("constant", ['7', None])
+    applier.apply_preprocess(sample_data, ['a', 'c'])
+    assert sample_data['a'].iloc[1] == 7
+    assert np.isnan(sample_data['c'].iloc[0])
+
+
+def test_invalid_constant(sample_data):
+    """Test that a constant that is not a number raises an error."""
+    applier = PreprocessApplier()
+    applier.set_current_method("constant", ['siete'])
+    with pytest.raises(ValueError):
+        applier.apply_preprocess(sample_data, ['a'])
+    assert np.isnan(sample_data['a'].iloc[1])
+
+
+def test_per_column_strategies(sample_data):
+    """Test that each column gets its own strategy in a single call."""
+    applier = PreprocessApplier()
+    applier.set_strategies({'a': 'mean', 'b': 'median',
+                            'c': ('constant', 9), 'text': 'delete'})
+    applier.apply_preprocess(sample_data, ['a', 'b', 'c', 'd', 'text'])
+
+    # Statistics are computed once the rows to delete are removed
+    kept = applier.row_mask.select(sample_data)
+    assert kept.index.tolist() == [0, 2, 3]
+    assert kept['a'].tolist() == [1.0, 3.0, 4.0]
+    assert kept['b'].tolist() == [1.0, 2.0, 1.5]
+    assert kept['c'].tolist() == [9.0, 2.0, 3.0]
+    # Deleted rows are masked, not removed from the data
+    assert len(sample_data) == 4
+    # Columns without a strategy are not changed
+    assert np.isnan(sample_data['d'].iloc[0])
+
+
+def test_strategies_keep_dtypes(sample_data):
+    """Test that filling the columns does not change their dtypes."""
+    dtypes = sample_data.dtypes.copy()
+    applier = PreprocessApplier()
+    applier.set_strategies({x: 'mean' for x in ['a', 'b', 'c', 'd', 'n']})
+    applier.apply_preprocess(sample_data, ['a', 'b', 'c', 'd', 'n'])
+    pd.testing.assert_series_equal(sample_data.dtypes, dtypes)
+
+
+def test_strategy_on_text_column(sample_data):
+    """Test that filling a text column fails without changing the data."""
+    applier = PreprocessApplier()
+    applier.set_strategies({'a': 'delete', 'text': 'mean'})
+    with pytest.raises(Exception):
+        applier.apply_preprocess(sample_data, ['a', 'text'])
+    assert len(sample_data) == 4
+
+
+def test_wide_frame(sample_data):
+    """Test that many columns with different strategies are filled."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(200, 300))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    data = pd.DataFrame(values, columns=[f"c{i}" for i in range(300)])
+    expected = data.copy()
+    for i, column in enumerate(expected.columns):
+        fill = expected[column].mean() if i % 2 else expected[column].median()
+        expected[column] = expected[column].fillna(fill)
+
+    applier = PreprocessApplier()
+    applier.set_strategies({column: 'mean' if i % 2 else 'median'
+                            for i, column in enumerate(data.columns)})
+    applier.apply_preprocess(data, list(data.columns))
+    pd.testing.assert_frame_equal(data, expected)
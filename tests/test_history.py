@@ -0,0 +1,174 @@
+import pytest
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from data_processing.dataset_calc import PreprocessApplier
+from data_processing.history import EditHistory
+from data_processing.null_index import NullIndex
+from data_processing.row_mask import RowMask
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+@pytest.fixture
+def sample_data():
+    """Create a dataset with nulls, a non-default index and mixed dtypes."""
+    rng = np.random.default_rng(0)
+    a = rng.normal(size=1000)
+    a[rng.random(1000) < 0.1] = np.nan
+    b = rng.normal(size=1000).astype(np.float32)
+    b[::7] = np.nan
+    return pd.DataFrame({
+        'a': a,
+        'b': b,
+        'c': np.arange(1000, dtype=np.int32),
+        'text': np.where(np.arange(1000) % 5 == 0, 'y', 'x'),
+    }, index=np.arange(1000) * 3 + 10)
+
+
+def apply(applier, data, index, strategies, row_mask=None):
+    """Apply a set of strategies with the applier."""
+    applier.set_strategies(strategies)
+    applier.apply_preprocess(data, list(strategies), index, row_mask)
+
+
+def test_undo_fill_restores_nulls(sample_data):
+    """Test that undoing a fill sets the filled cells back to null."""
+    original = sample_data.copy()
+    index = NullIndex.from_dataframe(sample_data)
+    applier = PreprocessApplier()
+    apply(applier, sample_data, index, {'a': 'mean', 'b': 'median'})
+    assert not sample_data[['a', 'b']].isna().any().any()
+
+    applier.undo(sample_data, index)
+    pd.testing.assert_frame_equal(sample_data, original)
+    assert index.counts(sample_data.columns) ==\
+        [int(n) for n in original.isna().sum()]
+    assert len(applier.pipeline) == 0
+
+
+def test_undo_delete_restores_rows(sample_data):
+    """Test that undoing a deletion keeps the rows again."""
+    original = sample_data.copy()
+    index = NullIndex.from_dataframe(sample_data)
+    row_mask = RowMask(len(sample_data))
+    applier = PreprocessApplier()
+    apply(applier, sample_data, index, {'a': 'delete', 'b': 'mean'},
+          row_mask)
+    assert len(row_mask) == original['a'].notna().sum()
+    assert not index.any(['a', 'b'], row_mask)
+
+    applier.undo(sample_data, index)
+    assert row_mask.all
+    pd.testing.assert_frame_equal(sample_data, original)
+    np.testing.assert_array_equal(index.mask('b'),
+                                  original['b'].isna().to_numpy())
+
+
+def test_redo_reapplies_step(sample_data):
+    """Test that redo leaves the data as the step did."""
+    index = NullIndex.from_dataframe(sample_data)
+    row_mask = RowMask(len(sample_data))
+    applier = PreprocessApplier()
+    apply(applier, sample_data, index, {'a': 'delete', 'b': 'median'},
+          row_mask)
+    applied = sample_data.copy()
+    kept = row_mask.to_numpy()
+    step = applier.pipeline.steps[-1]
+
+    applier.undo(sample_data, index)
+    assert applier.history.can_redo
+    applier.redo(sample_data, index)
+    pd.testing.assert_frame_equal(sample_data, applied)
+    np.testing.assert_array_equal(row_mask.to_numpy(), kept)
+    assert applier.pipeline.steps == [step]
+    assert not index.any(['a', 'b'], row_mask)
+
+
+def test_several_steps_undone_in_order(sample_data):
+    """Test that steps are undone from the last one."""
+    original = sample_data.copy()
+    index = NullIndex.from_dataframe(sample_data)
+    applier = PreprocessApplier()
+    apply(applier, sample_data, index, {'b': 'delete'})
+    after_first = sample_data.copy()
+    apply(applier, sample_data, index, {'a': ('constant', 0.0)})
+
+    applier.undo(sample_data, index)
+    pd.testing.assert_frame_equal(sample_data, after_first)
+    assert len(applier.pipeline) == 1
+    assert not applier.row_mask.all
+    applier.undo(sample_data, index)
+    pd.testing.assert_frame_equal(sample_data, original)
+    assert applier.row_mask.all
+    assert not applier.history.can_undo
+    with pytest.raises(ValueError):
+        applier.undo(sample_data, index)
+
+
+def test_new_step_clears_redo(sample_data):
+    """Test that applying a step after an undo discards the redo."""
+    index = NullIndex.from_dataframe(sample_data)
+    applier = PreprocessApplier()
+    apply(applier, sample_data, index, {'a': 'mean'})
+    applier.undo(sample_data, index)
+    apply(applier, sample_data, index, {'b': 'mean'})
+    assert not applier.history.can_redo
+    with pytest.raises(ValueError):
+        applier.redo(sample_data, index)
+
+
+def test_failed_step_is_not_recorded(sample_data):
+    """Test that a step rejected before changing the data is not undone."""
+    index = NullIndex.from_dataframe(sample_data)
+    applier = PreprocessApplier()
+    with pytest.raises(Exception, match="no es numérica"):
+        apply(applier, sample_data, index, {'a': 'mean', 'text': 'mean'})
+    assert not applier.history.can_undo
+
+
+def test_edit_stores_only_changes():
+    """Test that an edit takes much less memory than the data."""
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=(100_000, 10))
+    values[rng.random(values.shape) < 0.01] = np.nan
+    data = pd.DataFrame(values, columns=[f"c{i}" for i in range(10)])
+    index = NullIndex.from_dataframe(data)
+    applier = PreprocessApplier()
+    apply(applier, data, index, {x: 'mean' for x in data.columns})
+    assert applier.history.nbytes < data.memory_usage().sum() / 50
+
+
+def test_history_limit():
+    """Test that the history keeps at most `limit` steps."""
+    data = pd.DataFrame({'a': [np.nan, 1.0, np.nan, 2.0]})
+    index = NullIndex.from_dataframe(data)
+    applier = PreprocessApplier()
+    applier.history = EditHistory(limit=1)
+    apply(applier, data, index, {'a': ('constant', 0.0)})
+    apply(applier, data, index, {'a': ('constant', 5.0)})
+    applier.undo(data, index)
+    assert not applier.history.can_undo
+
+
+def test_undo_keeps_models_data(sample_data):
+    """Test that undo and redo do not change the data of a model."""
+    from models.linear_model import LinearModel
+    index = NullIndex.from_dataframe(sample_data)
+    row_mask = RowMask(len(sample_data))
+    applier = PreprocessApplier()
+    apply(applier, sample_data, index, {'a': 'mean'}, row_mask)
+    model = LinearModel(sample_data, ['a'], 'c', row_mask=row_mask.copy())
+    filled = model.x_columns[0].copy()
+
+    applier.undo(sample_data, index)
+    assert sample_data['a'].isna().any()
+    np.testing.assert_array_equal(model.x_columns[0], filled)
+    applier.redo(sample_data, index)
+    applier.undo(sample_data, index)
+    np.testing.assert_array_equal(model.x_columns[0], filled)
+    model.fit()
+    assert not np.isnan(model.coef_).any()
@@ -0,0 +1,542 @@
+import pytest
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.ipc as ipc
+import sqlite3
+from unittest.mock import patch
+from data_processing.column_buffer import ColumnBuffer
+from data_processing.import_module import (LoadCancelled, iter_excel_batches,
+                                           iter_sqlite_batches,
+                                           list_excel_sheets,
+                                           list_sqlite_tables, load_file,
+                                           probe_file)
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+@pytest.fixture
+def sample_data():
+    """Create a sample dataset with nulls and mixed dtypes."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'x1': rng.integers(0, 100, 1000),
+        'x2': rng.normal(size=1000),
+        'name': [f"row{i}" for i in range(1000)],
+    })
+    data.loc[750, 'x1'] = None
+    return data
+
+
+@pytest.fixture
+def csv_file(sample_data, tmp_path):
+    """Write the sample dataset to a CSV file."""
+    path = tmp_path / "data.csv"
+    sample_data.to_csv(path, index=False)
+    return str(path)
+
+
+def test_chunked_csv_matches_full_read(csv_file):
+    """Test that the chunked reader returns the same data as read_csv."""
+    expected = pd.read_csv(csv_file)
+    data = load_file(csv_file, chunksize=100)
+
+    pd.testing.assert_frame_equal(data, expected)
+
+
+def test_chunked_csv_promotes_dtypes(csv_file):
+    """Test that a null in a later batch promotes the integer column."""
+    data = load_file(csv_file, chunksize=100)
+
+    assert data['x1'].dtype == np.float64
+    assert data['x1'].isna().sum() == 1
+
+
+def test_chunked_csv_reports_progress(csv_file):
+    """Test that the progress callback receives bytes and rows."""
+    calls = []
+    load_file(csv_file, chunksize=300,
+              progress_callback=lambda *args: calls.append(args))
+
+    assert len(calls) == 4
+    assert [rows for _, _, rows in calls] == [300, 600, 900, 1000]
+    bytes_read, total_bytes, _ = calls[-1]
+    assert bytes_read == total_bytes
+
+
+def test_chunked_csv_batch_callback(csv_file):
+    """Test that every batch is passed to the batch callback."""
+    batches = []
+    load_file(csv_file, chunksize=300, batch_callback=batches.append)
+
+    assert [len(batch) for batch in batches] == [300, 300, 300, 100]
+
+
+def test_chunked_csv_cancel(csv_file):
+    """Test that LoadCancelled raised by a callback stops the load."""
+    def cancel(bytes_read, total_bytes, rows):
+        raise LoadCancelled()
+
+    with pytest.raises(LoadCancelled):
+        load_file(csv_file, chunksize=300, progress_callback=cancel)
+
+
+@pytest.mark.parametrize("chunksize", [None, 300])
+def test_csv_column_projection(csv_file, sample_data, chunksize):
+    """Test that only the requested columns are read, in their order."""
+    data = load_file(csv_file, chunksize=chunksize, columns=['x2', 'x1'])
+
+    assert list(data.columns) == ['x2', 'x1']
+    np.testing.assert_allclose(data['x2'], sample_data['x2'])
+
+
+def test_csv_probe(csv_file, sample_data):
+    """Test that the probe reads every column but only the first rows."""
+    preview = probe_file(csv_file, nrows=10)
+
+    assert list(preview.columns) == list(sample_data.columns)
+    assert len(preview) == 10
+
+
+@pytest.mark.parametrize("chunksize", [None, 300])
+def test_pyarrow_engine_matches_c(csv_file, chunksize):
+    """Test that the pyarrow engine returns the same data as pandas."""
+    expected = load_file(csv_file, chunksize=chunksize)
+    data = load_file(csv_file, chunksize=chunksize, engine="pyarrow")
+
+    pd.testing.assert_frame_equal(data, expected)
+
+
+@pytest.mark.parametrize("chunksize", [None, 1])
+def test_pyarrow_engine_keeps_dates_as_text(tmp_path, chunksize):
+    """Test that pyarrow leaves dates and timestamps as text, like pandas."""
+    path = tmp_path / "dates.csv"
+    path.write_text("d,t,x\n2024-01-01,2024-01-01T10:00:00,1\n"
+                    "2024-02-03,,2\n")
+    expected = load_file(str(path), chunksize=chunksize)
+    data = load_file(str(path), chunksize=chunksize, engine="pyarrow")
+
+    pd.testing.assert_frame_equal(data, expected)
+    assert data['t'].iloc[0] == "2024-01-01T10:00:00"
+
+
+def test_pyarrow_engine_projection(csv_file, sample_data):
+    """Test that the pyarrow engine reads the columns in their order."""
+    data = load_file(csv_file, engine="pyarrow", columns=['x2', 'x1'])
+
+    assert list(data.columns) == ['x2', 'x1']
+    np.testing.assert_allclose(data['x2'], sample_data['x2'])
+
+
+def test_pyarrow_engine_falls_back(tmp_path):
+    """Test that a type change after the first block is still read."""
+    path = tmp_path / "mixed.csv"
+    values = [str(i) for i in range(300_000)] + ["abc"]
+    path.write_text("x\n" + "\n".join(values) + "\n")
+
+    full = load_file(str(path), engine="pyarrow")
+    chunked = load_file(str(path), chunksize=10_000, engine="pyarrow")
+
+    assert len(full) == len(chunked) == 300_001
+    assert chunked['x'].iloc[-1] == "abc"
+    assert str(chunked['x'].iloc[12_345]) == "12345"
+
+
+def test_pyarrow_fallback_resumes_by_rows(tmp_path):
+    """Test that the fallback resumes at the right row when there are
+    blank lines and quoted values that span several lines."""
+    path = tmp_path / "multiline.csv"
+    rows = [f'{i},"line\nbreak {i}"' if i % 3 == 0 else
+            f"{i},plain\n" if i % 1000 == 1 else f"{i},plain"
+            for i in range(300_000)] + ['abc,"last\nrow"']
+    path.write_text("x,note\n" + "\n".join(rows) + "\n")
+
+    chunked = load_file(str(path), chunksize=10_000, engine="pyarrow")
+
+    assert len(chunked) == 300_001
+    assert chunked['x'].astype(str).tolist() ==\
+        [str(i) for i in range(300_000)] + ["abc"]
+    assert chunked['note'].iloc[-1] == "last\nrow"
+
+
+def test_unknown_engine(csv_file):
+    """Test that an unknown engine raises a ValueError."""
+    with pytest.raises(ValueError, match="Motor"):
+        load_file(csv_file, engine="python")
+
+
+def test_chunked_csv_empty_file(tmp_path):
+    """Test that an empty CSV raises a ValueError."""
+    path = tmp_path / "empty.csv"
+    path.write_text("")
+
+    with pytest.raises(ValueError, match="vacio"):
+        load_file(str(path), chunksize=100)
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_chunked_csv_header_only(tmp_path, engine):
+    """Test that a CSV without rows keeps the columns of its header."""
+    path = tmp_path / "header.csv"
+    path.write_text("a,b,c\n")
+
+    data = load_file(str(path), chunksize=100, engine=engine)
+
+    assert data.empty
+    pd.testing.assert_frame_equal(data, load_file(str(path), engine=engine))
+
+
+@pytest.fixture(params=["gz", "bz2", "xz", "zst"])
+def compressed_csv_file(request, sample_data, tmp_path):
+    """Write the sample dataset to a compressed CSV file."""
+    if request.param == "zst":
+        pytest.importorskip("zstandard")
+    path = tmp_path / f"data.csv.{request.param}"
+    sample_data.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.mark.parametrize("chunksize", [None, 300])
+def test_compressed_csv(compressed_csv_file, csv_file, chunksize):
+    """Test that compressed CSV files are decompressed while parsed."""
+    expected = pd.read_csv(csv_file)
+    data = load_file(compressed_csv_file, chunksize=chunksize)
+
+    pd.testing.assert_frame_equal(data, expected)
+
+
+def test_compressed_csv_progress(compressed_csv_file):
+    """Test that the progress is measured in compressed bytes."""
+    calls = []
+    load_file(compressed_csv_file, chunksize=300,
+              progress_callback=lambda *args: calls.append(args))
+
+    bytes_read, total_bytes, rows = calls[-1]
+    assert rows == 1000
+    assert bytes_read == total_bytes
+
+
+def test_compressed_tsv_probe(sample_data, tmp_path):
+    """Test that compressed TSV files are split by tabs."""
+    path = tmp_path / "data.tsv.gz"
+    sample_data.to_csv(path, sep="\t", index=False)
+
+    preview = probe_file(str(path), nrows=10)
+
+    assert list(preview.columns) == list(sample_data.columns)
+    assert len(preview) == 10
+
+
+@pytest.fixture(params=["parquet", "feather", "arrow"])
+def columnar_file(request, sample_data, tmp_path):
+    """Write the sample dataset to a Parquet, Feather or Arrow IPC file."""
+    path = tmp_path / f"data.{request.param}"
+    table = pa.Table.from_pandas(sample_data, preserve_index=False)
+    if request.param == "parquet":
+        sample_data.to_parquet(path, index=False)
+    elif request.param == "feather":
+        feather.write_feather(table, path)
+    else:
+        with ipc.new_file(str(path), table.schema) as writer:
+            writer.write_table(table)
+    return str(path)
+
+
+def test_columnar_projection(columnar_file, sample_data):
+    """Test that only the requested columns are read."""
+    data = load_file(columnar_file, columns=['x2', 'x1'])
+
+    assert list(data.columns) == ['x2', 'x1']
+    np.testing.assert_array_equal(data['x2'], sample_data['x2'])
+
+
+def test_columnar_full_read(columnar_file, sample_data):
+    """Test that all columns are read without a projection."""
+    data = load_file(columnar_file)
+
+    assert list(data.columns) == list(sample_data.columns)
+    assert len(data) == len(sample_data)
+
+
+def test_columnar_probe(columnar_file, sample_data):
+    """Test that the probe reads every column but only the first rows."""
+    preview = probe_file(columnar_file, nrows=10)
+
+    assert list(preview.columns) == list(sample_data.columns)
+    assert len(preview) == 10
+
+
+@pytest.fixture
+def sqlite_file(sample_data, tmp_path):
+    """Write the sample dataset and a second table to a SQLite database."""
+    path = tmp_path / "data.db"
+    with sqlite3.connect(path) as conn:
+        pd.DataFrame({'a': [1, 2]}).to_sql('other', conn, index=False)
+        sample_data.to_sql('measures', conn, index=False)
+    return str(path)
+
+
+def test_list_sqlite_tables(sqlite_file):
+    """Test that tables are listed with their row counts."""
+    assert list_sqlite_tables(sqlite_file) == [('other', 2),
+                                               ('measures', 1000)]
+
+
+def test_sqlite_default_table(sqlite_file):
+    """Test that the first table is read when none is chosen."""
+    data = load_file(sqlite_file)
+
+    assert list(data.columns) == ['a']
+
+
+def test_sqlite_pushdown(sqlite_file, sample_data):
+    """Test that columns, filter and limit are applied by SQLite."""
+    data = load_file(sqlite_file, table='measures', columns=['x2', 'x1'],
+                     where='x1 < 50', limit=20)
+    expected = sample_data[sample_data['x1'] < 50][['x2', 'x1']].head(20)
+
+    assert list(data.columns) == ['x2', 'x1']
+    np.testing.assert_array_equal(data['x2'], expected['x2'])
+
+
+def test_sqlite_sample_is_deterministic(sqlite_file):
+    """Test that a sample returns the same rows for any projection."""
+    first = load_file(sqlite_file, table='measures', columns=['x2'],
+                      sample=0.25)
+    second = load_file(sqlite_file, table='measures',
+                       columns=['name', 'x2'], sample=0.25)
+
+    assert 150 < len(first) < 350
+    np.testing.assert_array_equal(first['x2'], second['x2'])
+
+
+def test_sqlite_sample_large_rowids(tmp_path):
+    """Test that the sample hash does not overflow with large rowids."""
+    path = str(tmp_path / "large.db")
+    rowids = [9_000_000_000 + i for i in range(1000)]
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.executemany("INSERT INTO t (rowid, x) VALUES (?, ?)",
+                         [(rowid, rowid) for rowid in rowids])
+
+    data = load_file(path, sample=0.25)
+    expected = [rowid for rowid in rowids
+                if (rowid * 2654435761) % 2 ** 32 < 2 ** 30]
+
+    assert data['x'].tolist() == expected
+    assert 150 < len(data) < 350
+
+
+def test_sqlite_sample_without_rowid(tmp_path):
+    """Test that sampling a WITHOUT ROWID table raises a clear error."""
+    path = str(tmp_path / "norowid.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (k INTEGER PRIMARY KEY, x REAL) "
+                     "WITHOUT ROWID")
+        conn.execute("INSERT INTO t VALUES (1, 1.0)")
+
+    with pytest.raises(ValueError, match="WITHOUT ROWID"):
+        load_file(path, sample=0.5)
+    with pytest.raises(ValueError, match="WITHOUT ROWID"):
+        list(iter_sqlite_batches(path, 't', sample=0.5))
+
+
+def test_sqlite_reserves_rows(sqlite_file):
+    """Test that the buffer is preallocated with the rows of the query."""
+    with patch('data_processing.import_module.ColumnBuffer',
+               wraps=ColumnBuffer) as buffer:
+        data = load_file(sqlite_file, table='measures', columns=['x2'],
+                         where='x1 < 50', sample=0.5)
+
+    buffer.assert_called_once_with(len(data))
+    assert 0 < len(data) < 500
+
+
+def test_sqlite_probe(sqlite_file):
+    """Test that the probe reads the first rows of the chosen table."""
+    preview = probe_file(sqlite_file, nrows=10, table='measures')
+
+    assert len(preview) == 10
+    assert list(preview.columns) == ['x1', 'x2', 'name']
+
+
+def test_sqlite_unknown_table(sqlite_file):
+    """Test that an unknown table raises a ValueError."""
+    with pytest.raises(ValueError, match="no existe"):
+        load_file(sqlite_file, table='missing')
+
+
+def test_sqlite_stream_batches(sqlite_file, sample_data):
+    """Test that the streaming reader yields typed batches."""
+    batches = list(iter_sqlite_batches(sqlite_file, 'measures',
+                                       batch_size=300))
+
+    assert [len(batch) for batch in batches] == [300, 300, 300, 100]
+    assert batches[0]['x2'].dtype == np.float64
+    assert pd.api.types.is_string_dtype(batches[0]['name'])
+    np.testing.assert_array_equal(
+        np.concatenate([batch['x2'] for batch in batches]), sample_data['x2'])
+
+
+def test_sqlite_stream_promotes_nulls(tmp_path):
+    """Test that a NULL in a later batch turns integers into floats."""
+    path = str(tmp_path / "ints.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?)",
+                         [(i,) for i in range(5)] + [(None,)])
+
+    batches = list(iter_sqlite_batches(path, 't', batch_size=5))
+    data = load_file(path)
+
+    assert batches[0]['x'].dtype == np.int64
+    assert data['x'].dtype == np.float64
+    assert data['x'].isna().sum() == 1
+
+
+def test_sqlite_stream_keeps_numeric_text(tmp_path):
+    """Test that text columns stay text, even if they look numeric."""
+    path = str(tmp_path / "text.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (code TEXT, note TEXT, x REAL)")
+        conn.executemany("INSERT INTO t VALUES (?, ?, ?)",
+                         [("1.5", "a" * 1000, 1.0), ("2", None, None)])
+
+    data = load_file(path)
+
+    assert data['code'].tolist() == ["1.5", "2"]
+    assert data['note'].iloc[0] == "a" * 1000
+    assert data['x'].dtype == np.float64
+
+
+def test_sqlite_empty_result_keeps_columns(sqlite_file):
+    """Test that a filter without matches returns the columns."""
+    data = load_file(sqlite_file, table='measures', where='x1 > 1000')
+
+    assert data.empty
+    assert list(data.columns) == ['x1', 'x2', 'name']
+
+
+@pytest.fixture
+def excel_file(sample_data, tmp_path):
+    """Write the sample dataset to the second sheet of a workbook."""
+    path = tmp_path / "data.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({'a': [1]}).to_excel(writer, sheet_name='info',
+                                          index=False)
+        sample_data.to_excel(writer, sheet_name='measures', index=False,
+                             startrow=2)
+    return str(path)
+
+
+def test_list_excel_sheets(excel_file):
+    """Test that the sheets are listed in order."""
+    assert list_excel_sheets(excel_file) == ['info', 'measures']
+
+
+def test_excel_stream_matches_read_excel(excel_file):
+    """Test that the streamed sheet matches read_excel."""
+    expected = pd.read_excel(excel_file, sheet_name='measures', header=2)
+    data = load_file(excel_file, chunksize=300, sheet='measures', header=2)
+
+    pd.testing.assert_frame_equal(data, expected)
+
+
+def test_excel_stream_batches(excel_file):
+    """Test that the sheet is streamed in batches with progress."""
+    calls = []
+    batches = list(iter_excel_batches(
+        excel_file, 'measures', header=2, chunksize=400,
+        progress_callback=lambda *args: calls.append(args)))
+
+    assert [len(batch) for batch in batches] == [400, 400, 200]
+    assert [rows for _, _, rows in calls] == [400, 800, 1000]
+    assert calls[-1][0] == calls[-1][1]
+
+
+@pytest.mark.parametrize("chunksize", [None, 300])
+def test_excel_column_projection(excel_file, sample_data, chunksize):
+    """Test that only the requested columns of the sheet are read."""
+    data = load_file(excel_file, chunksize=chunksize, sheet='measures',
+                     header=2, columns=['name', 'x2'])
+
+    assert list(data.columns) == ['name', 'x2']
+    assert list(data['name']) == list(sample_data['name'])
+
+
+def test_excel_probe(excel_file):
+    """Test that the probe reads the first rows of the chosen sheet."""
+    preview = probe_file(excel_file, nrows=10, sheet='measures', header=2)
+
+    assert len(preview) == 10
+    assert list(preview.columns) == ['x1', 'x2', 'name']
+
+
+@pytest.fixture
+def partitioned_dir(sample_data, tmp_path):
+    """Split the sample dataset into three daily CSV files."""
+    folder = tmp_path / "exports"
+    folder.mkdir()
+    for i, start in enumerate([0, 334, 667]):
+        part = sample_data.iloc[start:[334, 667, 1000][i]]
+        part.to_csv(folder / f"data_2026-01-0{i + 1}.csv", index=False)
+    return folder
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_dataset_glob(partitioned_dir, sample_data, workers):
+    """Test that the files of a glob are concatenated in order."""
+    data = load_file(str(partitioned_dir / "data_2026-*.csv"),
+                     chunksize=100, workers=workers)
+
+    assert len(data) == len(sample_data)
+    np.testing.assert_allclose(data['x2'], sample_data['x2'])
+    assert isinstance(data['_partition'].dtype, pd.CategoricalDtype)
+    assert data['_partition'].value_counts().to_dict() == {
+        'data_2026-01-01.csv': 334, 'data_2026-01-02.csv': 333,
+        'data_2026-01-03.csv': 333}
+
+
+def test_dataset_directory_projection(partitioned_dir):
+    """Test that a directory is loaded with only the given columns."""
+    data = load_file(str(partitioned_dir), columns=['x2'], workers=1)
+
+    assert list(data.columns) == ['x2', '_partition']
+    assert len(data) == 1000
+
+
+def test_dataset_schema_mismatch(partitioned_dir):
+    """Test that files with different columns raise a ValueError."""
+    pd.DataFrame({'other': [1]}).to_csv(
+        partitioned_dir / "data_2026-01-04.csv", index=False)
+
+    with pytest.raises(ValueError, match="no coinciden"):
+        load_file(str(partitioned_dir), workers=1)
+
+
+def test_bracketed_file_is_not_a_glob(sample_data, tmp_path):
+    """Test that a file with glob characters in its name loads alone."""
+    file_path = tmp_path / "ventas [2024].csv"
+    sample_data.to_csv(file_path, index=False)
+
+    data = load_file(str(file_path))
+    preview = probe_file(str(file_path), nrows=10)
+
+    assert list(data.columns) == ['x1', 'x2', 'name']
+    assert len(data) == len(sample_data)
+    assert len(preview) == 10
+
+
+def test_dataset_probe(partitioned_dir):
+    """Test that the probe reads the first file of the dataset."""
+    files = sorted(str(path) for path in partitioned_dir.iterdir())
+    preview = probe_file(files, nrows=10)
+
+    assert list(preview.columns) == ['x1', 'x2', 'name', '_partition']
+    assert list(preview['_partition'].cat.categories) == [
+        'data_2026-01-01.csv', 'data_2026-01-02.csv', 'data_2026-01-03.csv']
@@ -0,0 +1,81 @@
+import pytest
+import os
+import sys
+import pandas as pd
+from pathlib import Path
+from data_processing.ingest_cache import IngestCache
+from data_processing.import_module import load_file
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    return IngestCache(directory=str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """Write a small CSV file."""
+    path = tmp_path / "data.csv"
+    pd.DataFrame({'x': [1.0, 2.0, None], 'y': [3, 4, 5]}).to_csv(
+        path, index=False)
+    return str(path)
+
+
+def test_cache_hit_returns_same_data(cache, csv_file):
+    """Test that a second load returns the cached data."""
+    first = load_file(csv_file, cache=cache)
+    assert cache.get(csv_file, engine="c") is not None
+
+    second = load_file(csv_file, cache=cache)
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_cache_entries_per_engine(cache, csv_file):
+    """Test that data parsed by one CSV engine is not used by the other."""
+    load_file(csv_file, cache=cache, engine="c")
+    assert cache.get(csv_file, engine="pyarrow") is None
+
+    load_file(csv_file, cache=cache, engine="pyarrow")
+    assert cache.get(csv_file, engine="pyarrow") is not None
+
+
+def test_cache_invalidated_on_change(cache, csv_file):
+    """Test that modifying the file invalidates its entry."""
+    load_file(csv_file, cache=cache)
+
+    pd.DataFrame({'x': [7.0], 'y': [8]}).to_csv(csv_file, index=False)
+    os.utime(csv_file, ns=(1, 1))
+
+    assert cache.get(csv_file) is None
+    assert load_file(csv_file, cache=cache)['x'].tolist() == [7.0]
+
+
+def test_cache_evicts_least_recently_used(cache, tmp_path):
+    """Test that the least recently used entry is evicted when full."""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"data{i}.csv"
+        pd.DataFrame({'x': range(1000)}).to_csv(path, index=False)
+        paths.append(str(path))
+
+    for path in paths[:2]:
+        cache.put(path, load_file(path))
+    entry_size = max(os.path.getsize(os.path.join(cache.directory, name))
+                     for name in os.listdir(cache.directory))
+    cache.max_bytes = 2 * entry_size
+
+    # The first file was used more recently than the second one
+    for path, seconds in zip(paths[:2], (2000, 1000)):
+        entry = os.path.join(cache.directory, cache.key(path) + cache.EXTENSION)
+        os.utime(entry, (seconds, seconds))
+
+    cache.put(paths[2], load_file(paths[2]))
+
+    assert cache.get(paths[0]) is not None
+    assert cache.get(paths[1]) is None
+    assert cache.get(paths[2]) is not None
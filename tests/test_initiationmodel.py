@@ -11,7 +11,8 @@ sys.path.append(str(project_root / "src"))
 @pytest.fixture
 def app():
     """Fixture para la aplicación Qt"""
-    app = QApplication(sys.argv)
+    # matplotlib keeps the first application, so it is reused
+    app = QApplication.instance() or QApplication(sys.argv)
     yield app
     app.quit()
 
@@ -45,4 +46,108 @@ def test_data_tab_initialization(data_tab):
     assert hasattr(data_tab, 'preprocess_label')
     assert hasattr(data_tab, 'preprocess_toolbar')
     
-    
\ No newline at end of file
+    
+def test_model_data_is_isolated(data_tab):
+    """Test that the data of a model tab keeps its values after later
+    fills, undos and redos in the data tab"""
+    import numpy as np
+    import pandas as pd
+    from data_processing.null_index import NullIndex
+    from data_processing.row_mask import RowMask
+    data_tab.data = pd.DataFrame({'x': [1.0, np.nan, 3.0, 4.0],
+                                  'y': [2.0, 4.0, np.nan, 8.0],
+                                  'z': [0.0, 1.0, 2.0, 3.0]})
+    data_tab.null_index = NullIndex.from_dataframe(data_tab.data)
+    data_tab.row_mask = RowMask(4)
+    data_tab.selected_input_columns = ['x']
+    data_tab.selected_output_column = 'y'
+    applier = data_tab.preprocess_applier
+
+    applier.set_current_method('mean')
+    applier.apply_preprocess(data_tab.data, ['x', 'y'], data_tab.null_index,
+                             data_tab.row_mask)
+    first = data_tab.model_data()
+    expected = first.copy()
+    assert list(first.columns) == ['x', 'y']
+
+    applier.undo(data_tab.data, data_tab.null_index)
+    second = data_tab.model_data()
+    applier.set_strategies({'x': ('knn', 1), 'z': ('knn', 1)})
+    applier.apply_preprocess(data_tab.data, ['x', 'z'], data_tab.null_index,
+                             data_tab.row_mask)
+    assert data_tab.data['x'].tolist() == [1.0, 1.0, 3.0, 4.0]
+    applier.set_current_method('constant', [0])
+    applier.apply_preprocess(data_tab.data, ['y'], data_tab.null_index,
+                             data_tab.row_mask)
+    applier.undo(data_tab.data, data_tab.null_index)
+    applier.redo(data_tab.data, data_tab.null_index)
+
+    pd.testing.assert_frame_equal(first, expected)
+    assert second['x'].isna().sum() == 1
+    assert second['y'].isna().sum() == 1
+
+def test_model_tabs_are_isolated(app):
+    """Test that a model tab keeps the data it was created with"""
+    import numpy as np
+    import pandas as pd
+    from unittest.mock import patch
+    from data_processing.null_index import NullIndex
+    from data_processing.row_mask import RowMask
+    from tabs.linear_model_tab import LinearModelTab
+    from ui.main_window import MainWindow
+    window = MainWindow()
+    data_tab = window.data_tab
+    data_tab.data = pd.DataFrame({'x': [1.0, np.nan, 3.0, 4.0],
+                                  'y': [2.0, 4.0, 6.0, 8.0]})
+    data_tab.null_index = NullIndex.from_dataframe(data_tab.data)
+    data_tab.row_mask = RowMask(4)
+    data_tab.selected_input_columns = ['x']
+    data_tab.selected_output_column = 'y'
+    applier = data_tab.preprocess_applier
+    applier.set_current_method('median')
+    applier.apply_preprocess(data_tab.data, ['x'], data_tab.null_index,
+                             data_tab.row_mask)
+
+    with patch('tabs.linear_model_tab.show_message'):
+        window.create_linear_model_tab()
+        tab = LinearModelTab.tab_list[-1]
+        tab.create_model()
+    x = tab.model.x_columns[0].copy()
+
+    applier.undo(data_tab.data, data_tab.null_index)
+    applier.set_current_method('constant', [0])
+    applier.apply_preprocess(data_tab.data, ['x'], data_tab.null_index,
+                             data_tab.row_mask)
+
+    assert tab.data['x'].tolist() == [1.0, 3.0, 3.0, 4.0]
+    np.testing.assert_array_equal(tab.model.x_columns[0], x)
+    assert data_tab.data['x'].tolist() == [1.0, 0.0, 3.0, 4.0]
+
+def test_preview_is_read_in_a_worker(app, tmp_path):
+    """Test that the preview of a file is read outside the GUI thread"""
+    import threading
+    import pandas as pd
+    from unittest.mock import patch
+    from tabs import data_tab as module
+    path = tmp_path / "data.csv"
+    pd.DataFrame({'x': [1.0, 2.0], 'y': [3.0, 4.0]}).to_csv(path, index=False)
+    tab = module.DataTab()
+    threads = []
+
+    def probe(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return probe_file(*args, **kwargs)
+
+    probe_file = module.probe_file
+    with patch.object(module, 'open_file_dialog', return_value=str(path)),\
+            patch.object(module, 'probe_file', side_effect=probe),\
+            patch.object(module, 'show_message'):
+        tab.load_data()
+        assert tab.load_worker is not None
+        tab.thread_pool.waitForDone()
+        app.processEvents()
+
+    assert threads and threads[0] is not threading.main_thread()
+    assert tab.load_worker is None and tab.is_preview
+    assert list(tab.data.columns) == ['x', 'y']
+    assert tab.file_path == str(path)
@@ -0,0 +1,150 @@
+import pytest
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from scipy.spatial import KDTree
+from unittest.mock import patch
+from data_processing.dataset_calc import PreprocessApplier
+from data_processing.knn_imputer import knn_impute
+from data_processing.null_index import NullIndex
+from data_processing.pipeline import PreprocessPipeline, parse_strategy
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+@pytest.fixture
+def sensor_data():
+    """Create correlated columns and a copy of them with nulls."""
+    rng = np.random.default_rng(0)
+    t = rng.normal(size=5000)
+    full = pd.DataFrame({
+        'a': t,
+        'b': 2 * t + rng.normal(scale=0.1, size=5000),
+        'c': (-t + rng.normal(scale=0.1, size=5000)).astype(np.float32),
+    })
+    mask = rng.random(full.shape) < 0.05
+    return full, full.mask(mask), mask
+
+
+def brute_force(data, columns, k, features):
+    """Impute with the pairwise distances on the observed features."""
+    values = data[features].to_numpy(dtype=np.float64)
+    donors = values[~np.isnan(values).any(axis=1)]
+    mean, std = donors.mean(axis=0), donors.std(axis=0)
+    result = data[columns].to_numpy(dtype=np.float64, copy=True)
+    for i, row in enumerate(values):
+        observed = ~np.isnan(row)
+        if observed.all() or not observed.any():
+            continue
+        scaled = (donors[:, observed] - mean[observed]) / std[observed]
+        query = (row[observed] - mean[observed]) / std[observed]
+        nearest = np.argsort(((scaled - query) ** 2).sum(axis=1))[:k]
+        targets = [features.index(column) for column in columns]
+        means = donors[nearest][:, targets].mean(axis=0)
+        result[i] = np.where(np.isnan(result[i]), means, result[i])
+    return result
+
+
+def test_matches_brute_force(sensor_data):
+    """Test that the KD-tree finds the same neighbours as a brute force."""
+    _, data, _ = sensor_data
+    data = data.iloc[:500].copy()
+    expected = brute_force(data, ['a', 'b'], 3, ['a', 'b', 'c'])
+    knn_impute(data, ['a', 'b'], 3, ['a', 'b', 'c'], batch_size=64)
+    np.testing.assert_allclose(data[['a', 'b']].to_numpy(), expected)
+
+
+def test_neighbours_per_column(sensor_data):
+    """Test that columns with different k share the trees of each pattern."""
+    _, data, _ = sensor_data
+    data = data.iloc[:500].copy()
+    features = ['a', 'b', 'c']
+    expected_a = brute_force(data, ['a'], 2, features)
+    expected_b = brute_force(data, ['b'], 7, features)
+    missing = data.isna().to_numpy()
+    patterns = np.unique(missing[missing[:, :2].any(axis=1)], axis=0)
+
+    with patch('data_processing.knn_imputer.KDTree', wraps=KDTree) as tree:
+        knn_impute(data, ['a', 'b'], [2, 7], features)
+
+    assert tree.call_count == len(patterns)
+    np.testing.assert_allclose(data['a'], expected_a[:, 0])
+    np.testing.assert_allclose(data['b'], expected_b[:, 0])
+
+
+def test_replaces_columns(sensor_data):
+    """Test that the filled columns are replaced, not written in place."""
+    _, data, _ = sensor_data
+    data = data.copy()
+    before = data['c'].to_numpy()
+    values = before.copy()
+    knn_impute(data, ['c'], 3, ['a', 'b', 'c'])
+    assert not data['c'].isna().any()
+    assert data['c'].dtype == np.float32
+    np.testing.assert_array_equal(before, values)
+
+
+def test_recovers_correlated_values(sensor_data):
+    """Test that the neighbours estimate the nulls better than the mean."""
+    full, data, mask = sensor_data
+    index = NullIndex.from_dataframe(data)
+    knn_impute(data, ['a', 'b', 'c'], 5, null_index=index)
+
+    observed = ~mask
+    np.testing.assert_array_equal(data.to_numpy()[observed],
+                                  full.to_numpy()[observed])
+    assert data['c'].dtype == np.float32
+    for j, column in enumerate(full.columns):
+        nulls = mask[:, j] & data[column].notna().to_numpy()
+        knn_error = np.abs(data[column] - full[column])[nulls].mean()
+        mean_error = np.abs(full[column].mean() - full[column])[nulls].mean()
+        assert knn_error < mean_error / 5
+    assert index.counts(data.columns) ==\
+        [int(n) for n in data.isna().sum()]
+
+
+def test_rows_without_features_keep_nulls():
+    """Test that rows with no observed features are left for the fallback."""
+    data = pd.DataFrame({'a': [1.0, 2.0, 3.0, np.nan, np.nan],
+                         'b': [1.0, 2.0, 3.0, 2.1, np.nan]})
+    knn_impute(data, ['a', 'b'], 1)
+    assert data['a'][3] == 2.0
+    assert data.iloc[4].isna().all()
+
+
+def test_parse_knn_strategy():
+    """Test that the number of neighbours is validated."""
+    assert parse_strategy(("knn", 5)) == ("knn", 5)
+    assert parse_strategy(("knn", "3")) == ("knn", 3)
+    for strategy in ["knn", ("knn", 0), ("knn", 2.5), ("knn", "x"),
+                     ("knn", None)]:
+        with pytest.raises(ValueError):
+            parse_strategy(strategy)
+
+
+def test_pipeline_knn_step(sensor_data):
+    """Test that a knn step is fitted, replayed and undone."""
+    full, data, _ = sensor_data
+    original = data.copy()
+    index = NullIndex.from_dataframe(data)
+    applier = PreprocessApplier()
+    applier.neighbors = 4
+    applier.set_current_method('knn')
+    applier.apply_preprocess(data, ['a', 'b', 'c'], index)
+    assert not data.isna().any().any()
+
+    step = applier.pipeline.steps[-1]
+    assert step["strategies"]['a'] == ("knn", 4)
+    assert step["fills"]['a'] == pytest.approx(original['a'].mean())
+    pipeline = PreprocessPipeline.from_dict(applier.pipeline.to_dict())
+    pd.testing.assert_frame_equal(pipeline.transform(original), data)
+
+    # A single row has no neighbours and gets the mean
+    row = pipeline.transform(pd.DataFrame({'a': [np.nan], 'b': [1.0]}))
+    assert row['a'][0] == pytest.approx(original['a'].mean())
+
+    applier.undo(data, index)
+    pd.testing.assert_frame_equal(data, original)
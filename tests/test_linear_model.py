@@ -5,6 +5,7 @@ import pandas as pd
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error, r2_score
 from src.models.linear_model import LinearModel
+from data_processing.row_mask import RowMask
 from pathlib import Path
 
 # Añadir el directorio src al PYTHONPATH
@@ -128,4 +129,127 @@ def test_zero_input_data():
     model.fit()
     
     assert model.coef_ is not None
-    assert model.intercept_ is not None
\ No newline at end of file
+    assert model.intercept_ is not None
+
+def test_row_mask(sample_data):
+    """Test that the model is fitted only on the rows kept by the mask."""
+    row_mask = RowMask.from_array(np.array([True, False, True, True, True]))
+    model = LinearModel(
+        data=sample_data,
+        input_columns=['x1', 'x2'],
+        output_column='y',
+        row_mask=row_mask
+    )
+    model.fit()
+
+    kept = sample_data.drop(index=1)
+    expected = LinearRegression().fit(kept[['x1', 'x2']], kept['y'])
+    np.testing.assert_allclose(model.coef_, expected.coef_)
+    assert model.y.tolist() == kept['y'].tolist()
+    # The data is not modified
+    assert len(sample_data) == 5
+
+@pytest.fixture
+def large_data():
+    """Create a dataset with a large offset and several chunks of rows."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'x1': rng.normal(1e6, 1, size=5000),
+        'x2': rng.normal(size=5000),
+    })
+    data['y'] = 2 * data['x1'] - 3 * data['x2'] + rng.normal(size=5000)
+    return data
+
+@pytest.mark.parametrize("scaled", [False, True])
+def test_gram_engine_matches_sklearn(large_data, scaled):
+    """Test that the normal equations engine fits the same model."""
+    from data_processing.scaling import Scaler
+    model = LinearModel(large_data, ['x1', 'x2'], 'y',
+                        scaler=Scaler() if scaled else None,
+                        engine="gram", batch_size=700)
+    model.fit()
+
+    x, y = large_data[['x1', 'x2']], large_data['y']
+    expected = LinearRegression().fit(x, y)
+    np.testing.assert_allclose(model.coef_, expected.coef_, rtol=1e-6)
+    assert model.intercept_ == pytest.approx(expected.intercept_, rel=1e-6)
+    np.testing.assert_allclose(model.y_pred, expected.predict(x))
+    assert model.mse_ == pytest.approx(
+        mean_squared_error(y, expected.predict(x)), rel=1e-6)
+    assert model.r2_ == pytest.approx(r2_score(y, expected.predict(x)))
+
+def test_fit_batches(large_data):
+    """Test that a model fitted on a stream of batches matches sklearn."""
+    model = LinearModel(None, ['x1', 'x2'], 'y')
+    model.fit_batches(large_data.iloc[i:i + 1000]
+                      for i in range(0, len(large_data), 1000))
+
+    expected = LinearRegression().fit(large_data[['x1', 'x2']],
+                                      large_data['y'])
+    np.testing.assert_allclose(model.coef_, expected.coef_, rtol=1e-6)
+    assert model.r2_ == pytest.approx(
+        expected.score(large_data[['x1', 'x2']], large_data['y']))
+    assert model.formula.startswith('y = ')
+
+def test_gram_engine_zero_input_data():
+    """Test that constant data does not break the normal equations."""
+    data = pd.DataFrame({'x1': [0, 0, 0], 'x2': [0, 0, 0], 'y': [0, 0, 0]})
+    model = LinearModel(data, ['x1', 'x2'], 'y', engine="gram")
+    model.fit()
+    np.testing.assert_array_equal(model.coef_, [0.0, 0.0])
+    assert model.intercept_ == 0.0
+    assert model.r2_ == 1.0
+    with pytest.raises(ValueError):
+        LinearModel(data, ['x1'], 'y', engine="qr")
+    with pytest.raises(ValueError, match="No hay datos"):
+        LinearModel(None, ['x1'], 'y').fit_batches([])
+
+def test_predict_batch(large_data):
+    """Test that arrays and DataFrames are predicted in chunks."""
+    model = LinearModel(large_data, ['x1', 'x2'], 'y', batch_size=300)
+    model.fit()
+    x = large_data[['x1', 'x2']]
+    expected = model.model.predict(x.to_numpy())
+
+    np.testing.assert_allclose(model.predict(x.to_numpy()), expected)
+    # Columns are matched by name, whatever their order
+    np.testing.assert_allclose(model.predict(large_data[['y', 'x2', 'x1']]),
+                               expected)
+    np.testing.assert_allclose(model.predict(), expected)
+    assert model.predict(x.iloc[0].tolist()) == pytest.approx(expected[0])
+
+def test_predict_loaded_model():
+    """Test that a model without training data predicts new rows."""
+    model = LinearModel(None, ['x1', 'x2'], 'y')
+    model.set_model_params([2.0, 3.0], 1.0, "y = 1.00")
+    assert model.predict([1.0, 1.0]) == 6.0
+    np.testing.assert_array_equal(model.predict([[1.0, 1.0], [0.0, 2.0]]),
+                                  [6.0, 7.0])
+    with pytest.raises(ValueError, match="No hay datos"):
+        model.predict()
+    with pytest.raises(ValueError, match="Faltan las columnas"):
+        model.predict(pd.DataFrame({'x1': [1.0]}))
+    with pytest.raises(ValueError):
+        model.predict([[1.0, 2.0, 3.0]])
+
+def test_downcast_columns_fit_the_same_model():
+    """Test that columns downcast to float32 on load give the same model."""
+    from data_processing.memory_optimizer import optimize_dtypes
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'x1': rng.normal(1000, 1, size=200_000).astype(np.float32),
+        'x2': rng.normal(size=200_000).astype(np.float32),
+    }).astype(np.float64)
+    data['y'] = (2 * data['x1'] - 3 * data['x2'] + 5)\
+        .astype(np.float32).astype(np.float64)
+    optimized, _ = optimize_dtypes(data)
+    assert optimized['x1'].dtype == np.float32
+
+    model = LinearModel(data, ['x1', 'x2'], 'y')
+    model.fit()
+    downcast = LinearModel(optimized, ['x1', 'x2'], 'y')
+    downcast.fit()
+    assert downcast.coef_.dtype == np.float64
+    np.testing.assert_array_equal(downcast.coef_, model.coef_)
+    assert downcast.intercept_ == model.intercept_
+    assert downcast.r2_ == model.r2_
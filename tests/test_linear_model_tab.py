@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 from tabs.linear_model_tab import LinearModelTab
 from models.linear_model import LinearModel
+from data_processing.pipeline import PreprocessPipeline
 
 # Añadir el directorio src al PYTHONPATH
 project_root = Path(__file__).parent.parent
@@ -110,6 +111,64 @@ def test_save_model(linear_model_tab, tmp_path):
         assert "columns" in saved_model
         
 
+def test_save_model_with_preprocessing(linear_model_tab, tmp_path):
+    """Test that the preprocessing is saved with the model"""
+    pipeline = PreprocessPipeline()
+    pipeline.add_step({'x': 'mean'})
+    pipeline.fit(pd.DataFrame({'x': [1.0, np.nan, 5.0]}))
+    linear_model_tab.preprocessing = pipeline
+    with patch('tabs.linear_model_tab.show_message'):
+        linear_model_tab.create_model()
+
+    model_path = tmp_path / "test_model.joblib"
+    with patch('tabs.linear_model_tab.save_file_dialog', return_value=str(model_path)), \
+         patch('tabs.linear_model_tab.show_message'):
+        linear_model_tab.save_model()
+
+    saved_model = joblib.load(model_path)
+    restored = PreprocessPipeline.from_dict(saved_model["preprocessing"])
+    assert restored.fills == {'x': 3.0}
+
+
+def test_save_model_with_scaling(linear_model_tab, tmp_path):
+    """Test that a scaled model keeps its formula in the original units"""
+    with patch('tabs.linear_model_tab.show_message'):
+        linear_model_tab.create_model()
+    unscaled_formula = linear_model_tab.model.formula
+    linear_model_tab.model_creation_group.scaling_selector.setCurrentIndex(3)
+    with patch('tabs.linear_model_tab.show_message'):
+        linear_model_tab.create_model()
+    assert linear_model_tab.model.formula == unscaled_formula
+
+    model_path = tmp_path / "test_model.joblib"
+    with patch('tabs.linear_model_tab.save_file_dialog', return_value=str(model_path)), \
+         patch('tabs.linear_model_tab.show_message'):
+        linear_model_tab.save_model()
+
+    saved_model = joblib.load(model_path)
+    assert saved_model["scaling"] == {
+        "method": "robust", "statistics": {'x': [3.0, 2.0]}}
+
+
+def test_prediction_fills_empty_inputs(linear_model_tab):
+    """Test that empty inputs are filled with the preprocessing values"""
+    pipeline = PreprocessPipeline()
+    pipeline.add_step({'x': ('constant', 2)})
+    pipeline.fit(pd.DataFrame({'x': [1.0]}))
+    linear_model_tab.preprocessing = pipeline
+    with patch('tabs.linear_model_tab.show_message'):
+        linear_model_tab.create_model()
+
+    linear_model_tab.prediction_group = MagicMock()
+    linear_model_tab.prediction_group.input_widgets = [
+        ('x', MagicMock(text=lambda: ''))
+    ]
+    with patch('tabs.linear_model_tab.show_warning') as mock_warning:
+        linear_model_tab.make_prediction()
+        mock_warning.assert_not_called()
+    predicted_value = float(linear_model_tab.prediction_group.label.setText.call_args[0][0].split('=')[1])
+    assert abs(predicted_value - 5) < 1
+
 def test_invalid_prediction_input(linear_model_tab):
     """Test de manejo de entradas inválidas para predicción"""
     # Primero crear el modelo
@@ -0,0 +1,53 @@
+import pytest
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from data_processing.memory_optimizer import optimize_dtypes
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+@pytest.fixture
+def sample_data():
+    """Create a dataset with columns that can be reduced."""
+    return pd.DataFrame({
+        'small_int': np.arange(1000, dtype=np.int64) % 100,
+        'big_int': np.arange(1000, dtype=np.int64) * 10 ** 10,
+        'half': np.arange(1000) / 2,
+        'precise': np.arange(1000) / 3,
+        'city': ['Madrid', 'Vigo', None, 'Lugo'] * 250,
+        'name': [f"row{i}" for i in range(1000)],
+    })
+
+
+def test_optimize_dtypes(sample_data):
+    """Test that each column gets the smallest safe dtype."""
+    data, _ = optimize_dtypes(sample_data)
+
+    assert data['small_int'].dtype == np.int8
+    assert data['big_int'].dtype == np.int64
+    assert data['half'].dtype == np.float32
+    assert data['precise'].dtype == np.float64
+    assert data['city'].dtype == 'category'
+    assert data['name'].dtype != 'category'
+
+
+def test_optimize_dtypes_keeps_values(sample_data):
+    """Test that the optimized data holds the same values."""
+    data, _ = optimize_dtypes(sample_data)
+
+    pd.testing.assert_frame_equal(data, sample_data, check_dtype=False,
+                                  check_categorical=False)
+
+
+def test_optimize_dtypes_reports_savings(sample_data):
+    """Test that saved bytes are reported per column."""
+    _, savings = optimize_dtypes(sample_data)
+
+    assert set(savings) == set(sample_data.columns)
+    assert savings['small_int'] == 7000
+    assert savings['big_int'] == 0
+    assert savings['city'] > 0
@@ -0,0 +1,93 @@
+import pytest
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from data_processing.dataset_calc import PreprocessApplier, none_count
+from data_processing.null_index import NullIndex
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+@pytest.fixture
+def sample_data():
+    """Create a dataset with nulls in some columns."""
+    rng = np.random.default_rng(0)
+    a = rng.normal(size=1003)
+    a[rng.random(1003) < 0.1] = np.nan
+    b = rng.normal(size=1003)
+    b[::7] = np.nan
+    return pd.DataFrame({
+        'a': a,
+        'b': b,
+        'c': np.arange(1003.0),
+        'text': np.where(np.arange(1003) % 5 == 0, None, 'x'),
+    })
+
+
+def test_counts_match_data(sample_data):
+    """Test that the index counts the nulls of every column."""
+    index = NullIndex.from_dataframe(sample_data)
+    columns = list(sample_data.columns)
+    assert index.counts(columns) ==\
+        [int(n) for n in sample_data.isna().sum()]
+    assert none_count(sample_data, columns, index) ==\
+        none_count(sample_data, columns)
+    assert index.has_nulls('a') and not index.has_nulls('c')
+    assert index.any(['a', 'c']) and not index.any(['c'])
+    assert index.null_columns(['c', 'b', 'a', 'b']) == ['b', 'a']
+
+
+def test_masks_match_data(sample_data):
+    """Test that the unpacked bitmaps give the null positions."""
+    index = NullIndex.from_dataframe(sample_data)
+    for column in sample_data.columns:
+        np.testing.assert_array_equal(index.mask(column),
+                                      sample_data[column].isna().to_numpy())
+    np.testing.assert_array_equal(index.masks(['b', 'c', 'a']),
+                                  sample_data[['b', 'c', 'a']].isna()
+                                  .to_numpy().T)
+
+
+def test_scan_by_blocks(sample_data):
+    """Test that scanning by blocks builds the same index."""
+    index = NullIndex.from_dataframe(sample_data)
+    blocks = NullIndex.from_dataframe(sample_data, block_cells=1500)
+    columns = list(sample_data.columns)
+    assert blocks.counts(columns) == index.counts(columns)
+    np.testing.assert_array_equal(blocks.masks(columns),
+                                  index.masks(columns))
+
+
+def test_delete_updates_index(sample_data):
+    """Test that the counts of the rows kept match dropna."""
+    index = NullIndex.from_dataframe(sample_data)
+    applier = PreprocessApplier()
+    applier.set_current_method("delete")
+    applier.apply_preprocess(sample_data, ['b'], index)
+    kept = sample_data.dropna(subset=['b'])
+    columns = list(sample_data.columns)
+    assert index.rows == len(sample_data)
+    assert index.counts(columns, applier.row_mask) ==\
+        [int(n) for n in kept.isna().sum()]
+    assert none_count(sample_data, columns, None, applier.row_mask) ==\
+        index.counts(columns, applier.row_mask)
+    assert not index.any(['b'], applier.row_mask)
+    assert index.null_columns(columns, applier.row_mask) ==\
+        ['a', 'text']
+
+
+def test_fill_updates_index(sample_data):
+    """Test that filled columns are cleared from the index."""
+    sample_data['empty'] = np.nan
+    index = NullIndex.from_dataframe(sample_data)
+    applier = PreprocessApplier()
+    applier.set_strategies({'a': 'mean', 'b': ('constant', 0),
+                            'empty': 'median'})
+    applier.apply_preprocess(sample_data, ['a', 'b', 'empty'], index)
+    assert index.counts(['a', 'b']) == [0, 0]
+    # A column without values can not be filled
+    assert index.count('empty') == len(sample_data)
+    assert index.count('text') == sample_data['text'].isna().sum()
@@ -0,0 +1,130 @@
+import pytest
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from data_processing.dataset_calc import PreprocessApplier
+from data_processing.outliers import OutlierDetector, find_outliers
+from data_processing.row_mask import RowMask
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+@pytest.fixture
+def telemetry():
+    """Create normal columns with a few extreme rows and some nulls."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'a': rng.normal(size=2000),
+        'b': rng.normal(10, 2, size=2000).astype(np.float32),
+        'flat': np.ones(2000),
+    })
+    data.loc[[5, 50, 500], 'a'] = [40.0, -35.0, 25.0]
+    data.loc[[7, 50], 'b'] = [200.0, -100.0]
+    data.loc[[1, 2, 3], 'a'] = np.nan
+    return data
+
+
+def reference(column, method, threshold):
+    """Flag the outliers of a Series with pandas."""
+    if method == "zscore":
+        z = (column - column.mean()) / column.std(ddof=0)
+        return z.abs() > threshold
+    if method == "iqr":
+        q1, q3 = column.quantile([0.25, 0.75])
+        spread = threshold * (q3 - q1)
+        return (column < q1 - spread) | (column > q3 + spread)
+    median = column.median()
+    mad = (column - median).abs().median()
+    return (0.6745 * (column - median) / mad).abs() > threshold
+
+
+@pytest.mark.parametrize("method", ["zscore", "iqr", "mad"])
+def test_methods_match_pandas(telemetry, method):
+    """Test that each method flags the same rows as pandas."""
+    threshold = {"zscore": 3.0, "iqr": 1.5, "mad": 3.5}[method]
+    rows, counts = find_outliers(telemetry, ['a', 'b'], method)
+    expected = {column: reference(telemetry[column].astype(float), method,
+                                  threshold)
+                for column in ['a', 'b']}
+    assert counts == {column: int(flags.sum())
+                      for column, flags in expected.items()}
+    np.testing.assert_array_equal(rows, (expected['a'] | expected['b'])
+                                  .to_numpy())
+    assert rows[[5, 7, 50]].all()
+    # Nulls are never outliers
+    assert not rows[[1, 2, 3]].any()
+
+
+def test_constant_column_has_no_outliers(telemetry):
+    """Test that a column without spread flags no rows."""
+    for method in ["zscore", "iqr", "mad"]:
+        _, counts = find_outliers(telemetry, ['flat'], method)
+        assert counts == {'flat': 0}
+
+
+@pytest.mark.parametrize("method", ["zscore", "iqr", "mad"])
+def test_streamed_bounds_match(telemetry, method):
+    """Test that bounds fitted by chunks match the one-pass bounds."""
+    detector = OutlierDetector(method).fit(telemetry, ['a', 'b'])
+    streamed = OutlierDetector(method).fit_batches(
+        (telemetry.iloc[i:i + 300] for i in range(0, len(telemetry), 300)),
+        ['a', 'b'])
+    for column in ['a', 'b']:
+        assert streamed.bounds[column] ==\
+            pytest.approx(detector.bounds[column], rel=1e-3)
+
+
+def test_row_mask_is_honored(telemetry):
+    """Test that deleted rows are neither used nor flagged."""
+    mask = RowMask(len(telemetry))
+    mask.delete(np.isin(np.arange(len(telemetry)), [5, 50]))
+    rows, _ = find_outliers(telemetry, ['a'], "zscore", row_mask=mask)
+    assert not rows[[5, 50]].any()
+    # Without the largest values the third one stands out more
+    assert rows[500]
+
+
+def test_invalid_options(telemetry):
+    """Test that invalid methods, thresholds and columns are rejected."""
+    with pytest.raises(ValueError):
+        OutlierDetector("sigma")
+    with pytest.raises(ValueError):
+        OutlierDetector("iqr", 0)
+    with pytest.raises(ValueError):
+        OutlierDetector().detect(telemetry)
+    telemetry['text'] = 'x'
+    with pytest.raises(TypeError):
+        find_outliers(telemetry, ['text'])
+
+
+def test_applier_masks_outliers(telemetry):
+    """Test that the applier masks the outliers and can undo it."""
+    original = telemetry.copy()
+    applier = PreprocessApplier()
+    counts = applier.filter_outliers(telemetry, ['a', 'b'], "mad")
+    mask = applier.row_mask
+    assert counts['a'] >= 3 and counts['b'] >= 2
+    assert not mask.to_numpy()[[5, 7, 50, 500]].any()
+    pd.testing.assert_frame_equal(telemetry, original)
+    assert len(applier.pipeline) == 0
+
+    applier.undo(telemetry)
+    assert mask.all
+    applier.redo(telemetry)
+    assert not mask.to_numpy()[[5, 7, 50, 500]].any()
+
+
+def test_streamed_zscore_with_large_offset(telemetry):
+    """Test that the streamed z-score keeps its precision on large values."""
+    telemetry['a'] += 1e9
+    detector = OutlierDetector("zscore").fit(telemetry, ['a'])
+    streamed = OutlierDetector("zscore").fit_batches(
+        (telemetry.iloc[i:i + 300] for i in range(0, len(telemetry), 300)),
+        ['a'])
+    assert streamed.bounds['a'] == pytest.approx(detector.bounds['a'],
+                                                 abs=1e-6)
+    rows, _ = streamed.detect(telemetry)
+    assert rows[[5, 50, 500]].all()
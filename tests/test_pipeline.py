@@ -0,0 +1,162 @@
+import pytest
+import sys
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from data_processing.dataset_calc import PreprocessApplier
+from data_processing.pipeline import PreprocessPipeline
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+def make_data(seed: int, rows: int = 1000) -> pd.DataFrame:
+    """Create a dataset with nulls in every column."""
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        'a': rng.normal(size=rows),
+        'b': rng.normal(10, 2, size=rows).astype(np.float32),
+        'c': rng.uniform(size=rows),
+        'd': rng.normal(size=rows),
+    })
+    for column in data.columns:
+        data.loc[rng.random(rows) < 0.1, column] = np.nan
+    return data
+
+
+@pytest.fixture
+def recorded():
+    """Apply two preprocessing steps and keep the original data."""
+    original = make_data(0)
+    data = original.copy()
+    applier = PreprocessApplier()
+    applier.set_strategies({'a': 'mean', 'd': 'delete'})
+    applier.apply_preprocess(data, ['a', 'd'])
+    applier.set_strategies({'b': 'median', 'c': ('constant', -1)})
+    applier.apply_preprocess(data, ['b', 'c'])
+    # The deleted rows are only masked in the preprocessed data
+    return original, applier.row_mask.select(data), applier.pipeline
+
+
+def test_applier_records_steps(recorded):
+    """Test that the applied methods are recorded with their values."""
+    original, data, pipeline = recorded
+    assert len(pipeline) == 2
+    kept = original.dropna(subset=['d'])
+    assert pipeline.fills['a'] == pytest.approx(kept['a'].mean())
+    assert pipeline.fills['b'] == pytest.approx(kept['b'].median())
+    assert pipeline.fills['c'] == -1
+
+
+def test_transform_replays_steps(recorded):
+    """Test that replaying the pipeline gives the preprocessed data."""
+    original, data, pipeline = recorded
+    pd.testing.assert_frame_equal(pipeline.transform(original), data)
+    # The original data is not modified
+    assert original.isna().any().all()
+
+
+def test_fit_matches_recorded_values(recorded):
+    """Test that fitting on the original data gives the same values."""
+    original, data, pipeline = recorded
+    refitted = PreprocessPipeline.from_dict(pipeline.to_dict())
+    for step in refitted.steps:
+        step["fills"] = None
+    refitted.fit(original)
+    assert refitted.fills == pytest.approx(pipeline.fills)
+
+
+def test_fit_batches_matches_fit(recorded):
+    """Test that fitting on a stream of batches gives the same values."""
+    original, data, pipeline = recorded
+    streamed = PreprocessPipeline.from_dict(pipeline.to_dict())
+    streamed.fit_batches(original.iloc[i:i + 128]
+                         for i in range(0, len(original), 128))
+    assert streamed.fills == pytest.approx(pipeline.fills)
+
+
+def test_transform_new_data_in_batches(recorded):
+    """Test that the fitted values are applied to new data by batches."""
+    original, data, pipeline = recorded
+    new = make_data(1)
+    batches = [new.iloc[i:i + 300] for i in range(0, len(new), 300)]
+    result = pd.concat(pipeline.transform_batches(batches))
+    pd.testing.assert_frame_equal(result, pipeline.transform(new))
+    assert not result.isna().any().any()
+    filled = new['a'].isna() & new['d'].notna()
+    assert (result.loc[filled[filled].index, 'a'] ==
+            pipeline.fills['a']).all()
+
+
+def test_transform_skips_missing_columns(recorded):
+    """Test that the steps of columns that are not in the data are skipped."""
+    original, data, pipeline = recorded
+    inputs = pd.DataFrame({'a': [np.nan, 1.0]})
+    result = pipeline.transform(inputs)
+    assert result['a'].tolist() == [pipeline.fills['a'], 1.0]
+
+
+def test_serialization(recorded):
+    """Test that the pipeline survives a JSON round trip."""
+    original, data, pipeline = recorded
+    restored = PreprocessPipeline.from_dict(
+        json.loads(json.dumps(pipeline.to_dict())))
+    assert restored.steps == pipeline.steps
+    pd.testing.assert_frame_equal(restored.transform(original), data)
+
+
+def test_unfitted_transform():
+    """Test that an unfitted pipeline can not transform data."""
+    pipeline = PreprocessPipeline()
+    pipeline.add_step({'a': 'mean'})
+    with pytest.raises(ValueError):
+        pipeline.transform(make_data(0))
+
+
+def test_quantile_strategy():
+    """Test that columns can be filled with any quantile."""
+    data = make_data(0)
+    expected = data['a'].quantile(0.9)
+    applier = PreprocessApplier()
+    applier.set_strategies({'a': ('quantile', 0.9), 'c': 'median'})
+    applier.apply_preprocess(data, ['a', 'c'])
+    assert applier.pipeline.fills['a'] == pytest.approx(expected)
+    assert not data[['a', 'c']].isna().any().any()
+
+
+def test_streaming_quantiles():
+    """Test that long streams are fitted within the sketch error."""
+    rng = np.random.default_rng(2)
+    values = rng.lognormal(size=400_000)
+    values[rng.random(len(values)) < 0.1] = np.nan
+    data = pd.DataFrame({'a': values, 'b': values})
+    pipeline = PreprocessPipeline()
+    pipeline.add_step({'a': 'median', 'b': ('quantile', 0.25)})
+    pipeline.fit_batches((data.iloc[i:i + 50_000]
+                          for i in range(0, len(data), 50_000)), error=0.001)
+    ordered = np.sort(values[~np.isnan(values)])
+    for column, q in (('a', 0.5), ('b', 0.25)):
+        rank = np.searchsorted(ordered, pipeline.fills[column]) /\
+            len(ordered)
+        assert abs(rank - q) <= 0.001
+
+
+def test_fit_file(recorded, tmp_path):
+    """Test that a pipeline can be fitted on a file by batches."""
+    original, data, pipeline = recorded
+    path = tmp_path / "data.csv"
+    original.to_csv(path, index=False)
+    refitted = PreprocessPipeline.from_dict(pipeline.to_dict())
+    refitted.fit_file(str(path), chunksize=100)
+    assert refitted.fills == pytest.approx(pipeline.fills, rel=1e-6)
+
+
+@pytest.mark.parametrize("strategy", ['mode', ('constant', 'x'),
+                                      ('mean', 1), 'quantile',
+                                      ('quantile', 2)])
+def test_invalid_strategy(strategy):
+    """Test that invalid strategies are rejected."""
+    with pytest.raises(ValueError):
+        PreprocessPipeline().add_step({'a': strategy})
@@ -0,0 +1,102 @@
+import pytest
+import sys
+import numpy as np
+from pathlib import Path
+from data_processing.quantile_sketch import QuantileSketch
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+QUANTILES = np.linspace(0.01, 0.99, 99)
+
+
+@pytest.fixture(scope="module")
+def stream():
+    """Create a skewed stream of 1000000 values."""
+    return np.random.default_rng(0).lognormal(size=1_000_000)
+
+
+def rank_errors(values: np.ndarray, sketch: QuantileSketch) -> np.ndarray:
+    """Return the rank error of the sketch for each quantile."""
+    ordered = np.sort(values)
+    ranks = np.searchsorted(ordered, sketch.quantiles(QUANTILES)) /\
+        len(values)
+    return np.abs(ranks - QUANTILES)
+
+
+def test_small_stream_is_exact():
+    """Test that the quantiles are exact while nothing is compacted."""
+    values = np.random.default_rng(1).normal(size=500)
+    sketch = QuantileSketch()
+    sketch.update(values)
+    assert sketch.is_exact
+    assert sketch.quantile(0.5) == np.median(values)
+    np.testing.assert_array_equal(sketch.quantiles(QUANTILES),
+                                  np.quantile(values, QUANTILES))
+
+
+@pytest.mark.parametrize("error", [0.01, 0.001])
+def test_rank_error_is_bounded(stream, error):
+    """Test that the quantiles of a long stream are within the error."""
+    sketch = QuantileSketch(error)
+    for start in range(0, len(stream), 65_536):
+        sketch.update(stream[start:start + 65_536])
+    assert not sketch.is_exact
+    assert sketch.count == len(stream)
+    assert rank_errors(stream, sketch).max() <= error
+    # Memory is bounded by the error, not by the stream
+    assert sketch.retained <= 3 * sketch.k
+
+
+def test_merge_parallel_chunks(stream):
+    """Test that sketches of separate chunks merge into a valid sketch."""
+    parts = np.array_split(stream, 8)
+    sketches = []
+    for seed, part in enumerate(parts):
+        sketch = QuantileSketch(seed=seed)
+        sketch.update(part)
+        sketches.append(sketch)
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+    assert merged.count == len(stream)
+    assert merged.min == stream.min() and merged.max == stream.max()
+    assert merged.quantile(0) == stream.min()
+    assert merged.quantile(1) == stream.max()
+    assert rank_errors(stream, merged).max() <= merged.error
+
+
+def test_merge_exact_sketches():
+    """Test that merging small sketches gives the exact quantiles."""
+    values = np.arange(100.0)
+    left, right = QuantileSketch(), QuantileSketch()
+    left.update(values[:60])
+    right.update(values[60:])
+    merged = left.merge(right)
+    assert merged.is_exact
+    assert merged.quantile(0.5) == np.median(values)
+
+
+def test_nulls_and_empty_sketch():
+    """Test that nulls are ignored and empty sketches return NaN."""
+    sketch = QuantileSketch()
+    assert np.isnan(sketch.quantile(0.5))
+    sketch.update([np.nan, 1.0, 3.0, np.nan])
+    assert sketch.count == 2
+    assert sketch.quantile(0.5) == 2.0
+
+
+@pytest.mark.parametrize("error", [0, 1, -0.1])
+def test_invalid_error(error):
+    """Test that the error must be between 0 and 1."""
+    with pytest.raises(ValueError):
+        QuantileSketch(error)
+
+
+def test_invalid_quantile():
+    """Test that quantiles outside [0, 1] are rejected."""
+    sketch = QuantileSketch()
+    sketch.update([1.0, 2.0])
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
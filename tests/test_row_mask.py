@@ -0,0 +1,66 @@
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from data_processing.null_index import NullIndex
+from data_processing.row_mask import RowMask
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+def test_delete_and_restore():
+    """Test that rows are deleted from the mask and restored."""
+    mask = RowMask(13)
+    assert mask.all and len(mask) == 13
+    rows = np.zeros(13, dtype=bool)
+    rows[[2, 5, 12]] = True
+    deleted = mask.delete(rows)
+    np.testing.assert_array_equal(deleted, rows)
+    assert len(mask) == 10 and not mask.all
+    assert mask.positions().tolist() == [0, 1, 3, 4, 6, 7, 8, 9, 10, 11]
+
+    # Rows already deleted are not deleted again
+    rows[[0, 2]] = True
+    assert np.flatnonzero(mask.delete(rows)).tolist() == [0]
+    mask.restore(rows)
+    assert mask.all
+
+
+def test_select():
+    """Test that the rows kept are selected from frames and arrays."""
+    data = pd.DataFrame({'a': range(5)}, index=list('vwxyz'))
+    mask = RowMask.from_array(np.array([True, False, True, False, True]))
+    assert mask.select(data).index.tolist() == ['v', 'x', 'z']
+    assert mask.select(data['a'].to_numpy()).tolist() == [0, 2, 4]
+    assert RowMask(5).select(data) is data
+
+
+def test_copies_are_independent():
+    """Test that copies of a mask do not share their bits."""
+    mask = RowMask(8)
+    copy = mask.copy()
+    mask.delete(np.arange(8) < 3)
+    assert copy.all and len(mask) == 5
+
+
+def test_one_bit_per_row():
+    """Test that the mask uses one bit per row."""
+    assert RowMask(1_000_000).nbytes == 125_000
+
+
+def test_null_counts_of_rows_kept():
+    """Test that the null counts only include the rows kept."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(1001, 3))
+    values[rng.random(values.shape) < 0.2] = np.nan
+    data = pd.DataFrame(values, columns=['a', 'b', 'c'])
+    index = NullIndex.from_dataframe(data)
+    mask = RowMask(len(data))
+    mask.delete(index.rows_with_nulls(['a']))
+
+    kept = data.dropna(subset=['a'])
+    assert index.counts(data.columns, mask) ==\
+        [int(n) for n in kept.isna().sum()]
+    assert index.null_columns(data.columns, mask) == ['b', 'c']
@@ -0,0 +1,79 @@
+import pytest
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from data_processing.sampling import (ReservoirSampler, load_sample,
+                                      sample_batches)
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+@pytest.fixture
+def stream():
+    """Create a dataset of 100000 rows with nulls every 10 rows."""
+    data = pd.DataFrame({
+        'id': np.arange(100_000),
+        'x': np.where(np.arange(100_000) % 10 == 0, np.nan, 1.0),
+    })
+    return data
+
+
+def batches_of(data, size):
+    return (data.iloc[i:i + size] for i in range(0, len(data), size))
+
+
+def test_sample_counts_whole_stream(stream):
+    """Test that rows and nulls are counted for the whole stream."""
+    sample, rows, nulls = sample_batches(batches_of(stream, 777), 1000)
+
+    assert len(sample) == 1000
+    assert rows == 100_000
+    assert nulls == {'id': 0, 'x': 10_000}
+
+
+def test_sample_is_uniform_and_ordered(stream):
+    """Test that the sample covers the stream and keeps its order."""
+    sample, _, _ = sample_batches(batches_of(stream, 777), 1000)
+
+    assert sample['id'].is_monotonic_increasing
+    assert sample['id'].is_unique
+    assert abs(sample['id'].mean() - 50_000) < 3_000
+    assert 50 < sample['x'].isna().sum() < 150
+
+
+def test_sample_is_deterministic(stream):
+    """Test that the same seed gives the same sample."""
+    first, _, _ = sample_batches(batches_of(stream, 500), 100, seed=3)
+    second, _, _ = sample_batches(batches_of(stream, 500), 100, seed=3)
+    other, _, _ = sample_batches(batches_of(stream, 500), 100, seed=4)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert not first['id'].equals(other['id'])
+
+
+def test_small_stream_is_kept_whole(stream):
+    """Test that a stream smaller than the sample is returned whole."""
+    sampler = ReservoirSampler(1000)
+    for batch in batches_of(stream.head(300), 128):
+        sampler.add(batch)
+
+    pd.testing.assert_frame_equal(sampler.to_dataframe(),
+                                  stream.head(300))
+
+
+@pytest.mark.parametrize("name", ["data.csv", "data.csv.gz"])
+def test_load_sample_from_csv(stream, tmp_path, name):
+    """Test that a CSV file is sampled with only the given columns."""
+    path = tmp_path / name
+    stream.to_csv(path, index=False)
+
+    sample, rows, nulls = load_sample(str(path), size=500, chunksize=10_000,
+                                      columns=['x'])
+
+    assert list(sample.columns) == ['x']
+    assert len(sample) == 500
+    assert rows == 100_000
+    assert nulls == {'x': 10_000}
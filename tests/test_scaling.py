@@ -0,0 +1,87 @@
+import pytest
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
+from data_processing.scaling import Scaler
+from models.linear_model import LinearModel
+
+# Añadir el directorio src al PYTHONPATH
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "src"))
+
+
+@pytest.fixture
+def sample_data():
+    """Create inputs with very different scales."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'small': rng.normal(0, 1e-3, size=500),
+        'large': rng.normal(1e6, 1e4, size=500),
+        'flat': np.full(500, 7.0),
+    })
+    data['y'] = 3e3 * data['small'] + 2e-4 * data['large'] +\
+        rng.normal(size=500)
+    return data
+
+
+@pytest.mark.parametrize("method, reference", [
+    ("standard", StandardScaler),
+    ("minmax", MinMaxScaler),
+    ("robust", RobustScaler),
+])
+def test_matches_sklearn(sample_data, method, reference):
+    """Test that the scaled columns match the sklearn scalers."""
+    columns = ['small', 'large']
+    scaler = Scaler(method)
+    design = scaler.design([sample_data[x].to_numpy() for x in columns],
+                           columns)
+    expected = reference().fit_transform(sample_data[columns])
+    np.testing.assert_allclose(design, expected, atol=1e-12)
+
+
+def test_statistics_are_cached(sample_data):
+    """Test that the statistics of a column are computed only once."""
+    scaler = Scaler()
+    scaler.fit([sample_data['small'].to_numpy()], ['small'])
+    statistics = scaler.statistics['small']
+    scaler.fit([sample_data['small'].to_numpy() * 2], ['small'])
+    assert scaler.statistics['small'] == statistics
+
+
+def test_constant_column_is_not_scaled(sample_data):
+    """Test that a column without spread keeps a scale of 1."""
+    for method in ["standard", "minmax", "robust"]:
+        scaler = Scaler(method).fit([sample_data['flat'].to_numpy()],
+                                    ['flat'])
+        assert scaler.statistics['flat'][1] == 1.0
+
+
+@pytest.mark.parametrize("method", ["standard", "minmax", "robust"])
+def test_model_coefficients_in_original_units(sample_data, method):
+    """Test that a scaled model recovers the coefficients of badly
+    conditioned inputs, in their original units."""
+    columns = ['small', 'large']
+    model = LinearModel(sample_data, columns, 'y', scaler=Scaler(method))
+    model.fit()
+    np.testing.assert_allclose(model.coef_, [3e3, 2e-4], rtol=0.05)
+    x = sample_data[columns].to_numpy()
+    np.testing.assert_allclose(model.y_pred,
+                               x @ model.coef_ + model.intercept_)
+    assert model.predict([1e-3, 1e6]) ==\
+        pytest.approx(model.coef_ @ [1e-3, 1e6] + model.intercept_)
+
+
+def test_serialization(sample_data):
+    """Test that the statistics survive a round trip."""
+    scaler = Scaler("robust").fit([sample_data['large'].to_numpy()],
+                                  ['large'])
+    restored = Scaler.from_dict(scaler.to_dict())
+    assert restored.method == "robust"
+    assert restored.statistics == scaler.statistics
+    coefficients, intercept = restored.unscale([2.0], 1.0, ['large'])
+    np.testing.assert_allclose(
+        restored.scale_coefficients(coefficients, ['large']), [2.0])
+    with pytest.raises(ValueError):
+        Scaler("log")